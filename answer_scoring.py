@@ -0,0 +1,281 @@
+"""
+Answer scoring for TalentScout Hiring Assistant
+Scores technical answers against the reference keypoints in config, whole
+batches at a time with NumPy
+
+Usage:
+    python answer_scoring.py --db talentscout.db --hours 24   # rank today's candidates
+"""
+
+import argparse
+import math
+import re
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence, Tuple
+
+import question_index
+from config import GENERAL_QUESTION_KEYPOINTS, QUESTION_KEYPOINTS
+from question_index import QuestionIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_TOKEN = re.compile(r"[^\s,;:!?()\[\]{}\"'`/]+")
+# Bound on the token -> term id memo kept by a scorer
+_TOKEN_CACHE_SIZE = 1 << 16
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in into is it its of on or than that the this to use used vs when with"
+    .split()
+)
+
+
+def _stem(token: str) -> str:
+    """Crude suffix stripping, applied alike to answers and keypoints"""
+    token = token.strip(".")
+    if len(token) > 4:
+        if token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif token.endswith(("sses", "xes", "ches", "shes")):
+            token = token[:-2]
+        elif token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+    if len(token) > 5 and token.endswith("ing"):
+        token = token[:-3]
+    elif len(token) > 4 and token.endswith("ed"):
+        token = token[:-2]
+    if len(token) > 4 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def terms(text: str) -> List[str]:
+    """Normalized content terms of a text, in order, without duplicates"""
+    seen = {}
+    for token in _TOKEN.findall(text.lower()):
+        if token in _STOPWORDS:
+            continue
+        term = _stem(token)
+        if term:
+            seen.setdefault(term, None)
+    return list(seen)
+
+
+def question_keypoints(index: QuestionIndex, tech_keypoints: Mapping[str, Sequence[Sequence[str]]],
+                       general_keypoints: Sequence[Sequence[str]]) -> Dict[str, Sequence[str]]:
+    """Keypoints by question id, checking there is one entry per question in the bank"""
+    for tech, question_ids in index.tech_question_ids.items():
+        if len(tech_keypoints.get(tech, ())) != len(question_ids):
+            raise ValueError(f"QUESTION_KEYPOINTS['{tech}'] must have one entry per question")
+    if len(general_keypoints) != len(index.general_question_ids):
+        raise ValueError("GENERAL_QUESTION_KEYPOINTS must have one entry per general question")
+
+    keypoints = {}
+    for tech, question_ids in index.tech_question_ids.items():
+        keypoints.update(zip(question_ids, tech_keypoints[tech]))
+    keypoints.update(zip(index.general_question_ids, general_keypoints))
+    return keypoints
+
+
+class AnswerScorer:
+    """Keypoint-coverage scores in [0, 1] for (question id, answer) pairs
+
+    Each keypoint is a set of terms weighted by IDF across all keypoints, so
+    distinctive terms ("mvcc", "broadcasting") count for more than common
+    ones ("data", "performance"). A keypoint's coverage is the weighted
+    share of its terms the answer uses, and a question's score is the mean
+    coverage of its keypoints. That mean is linear in the term weights, so
+    one flat weight table per question turns scoring into a gather, a
+    membership test and a row sum over the whole batch.
+    """
+
+    def __init__(self, keypoints: Mapping[str, Sequence[str]]):
+        # Imported here so that importing the module (for format_score) does not load NumPy
+        import numpy as np
+
+        keypoint_terms = {qid: [terms(point) for point in points] for qid, points in keypoints.items()}
+
+        document_frequency: Dict[str, int] = {}
+        total = 0
+        for points in keypoint_terms.values():
+            for point in points:
+                total += 1
+                for term in point:
+                    document_frequency[term] = document_frequency.get(term, 0) + 1
+        self.vocabulary: Mapping[str, int] = MappingProxyType(
+            {term: i for i, term in enumerate(sorted(document_frequency))}
+        )
+        idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+        # Row 0 is a sentinel for questions without keypoints
+        self._rows: Dict[str, int] = {}
+        slots: List[List[Tuple[int, float]]] = [[]]
+        for qid, points in keypoint_terms.items():
+            points = [point for point in points if point]
+            if not points:
+                continue
+            weights: Dict[int, float] = {}
+            for point in points:
+                point_weight = sum(idf[term] for term in point)
+                for term in point:
+                    term_id = self.vocabulary[term]
+                    weights[term_id] = weights.get(term_id, 0.0) + idf[term] / point_weight / len(points)
+            self._rows[qid] = len(slots)
+            slots.append(sorted(weights.items()))
+
+        self._token_ids: Dict[str, int] = {}
+
+        width = max(len(row) for row in slots)
+        # Padding slots point at term -1, which never occurs in an answer
+        self._term_ids = np.full((len(slots), width), -1, dtype=np.int64)
+        self._weights = np.zeros((len(slots), width), dtype=np.float32)
+        for row, items in enumerate(slots):
+            if items:
+                self._term_ids[row, :len(items)] = [term_id for term_id, _ in items]
+                self._weights[row, :len(items)] = [weight for _, weight in items]
+
+    @classmethod
+    def from_config(cls) -> "AnswerScorer":
+        return cls(question_keypoints(question_index.QUESTION_INDEX, QUESTION_KEYPOINTS, GENERAL_QUESTION_KEYPOINTS))
+
+    def state(self) -> Tuple[List[str], Dict[str, int], "np.ndarray", "np.ndarray"]:
+        """(vocabulary, row per question id, term id table, weight table), for from_state"""
+        return list(self.vocabulary), dict(self._rows), self._term_ids, self._weights
+
+    @classmethod
+    def from_state(cls, vocabulary: Sequence[str], rows: Mapping[str, int],
+                   term_ids: "np.ndarray", weights: "np.ndarray") -> "AnswerScorer":
+        """Rebuild a scorer from state(), e.g. arrays mapped straight from a config artifact"""
+        scorer = cls.__new__(cls)
+        scorer.vocabulary = MappingProxyType({term: i for i, term in enumerate(vocabulary)})
+        scorer._rows = dict(rows)
+        scorer._token_ids = {}
+        scorer._term_ids = term_ids
+        scorer._weights = weights
+        return scorer
+
+    def has_keypoints(self, question_id: str) -> bool:
+        return question_id in self._rows
+
+    def _token_id(self, token: str) -> int:
+        """Vocabulary id of a raw lowercase token, -1 if it is not a keypoint term"""
+        term_id = self._token_ids.get(token)
+        if term_id is None:
+            term_id = -1 if token in _STOPWORDS else self.vocabulary.get(_stem(token), -1)
+            if len(self._token_ids) >= _TOKEN_CACHE_SIZE:
+                self._token_ids.clear()
+            self._token_ids[token] = term_id
+        return term_id
+
+    def score(self, question_ids: Sequence[str], answers: Sequence[str]) -> "np.ndarray":
+        """Score answers[i] against question_ids[i]; NaN where a question has no keypoints"""
+        import numpy as np
+
+        if len(question_ids) != len(answers):
+            raise ValueError("question_ids and answers must have the same length")
+        n = len(answers)
+        if n == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        rows = np.fromiter((self._rows.get(qid, 0) for qid in question_ids), dtype=np.int64, count=n)
+
+        # (answer, term) pairs encoded as answer * V + term, sorted for searchsorted
+        size = len(self.vocabulary)
+        token_ids = self._token_ids
+        pairs = []
+        for i, answer in enumerate(answers):
+            base = i * size
+            for token in set(_TOKEN.findall(answer.lower())):
+                term_id = token_ids.get(token)
+                if term_id is None:
+                    term_id = self._token_id(token)
+                if term_id >= 0:
+                    pairs.append(base + term_id)
+        # Duplicates (two tokens with one stem) do not matter to searchsorted
+        present_pairs = np.sort(np.asarray(pairs, dtype=np.int64))
+
+        term_ids = self._term_ids[rows]
+        wanted = np.arange(n, dtype=np.int64)[:, None] * size + term_ids
+        if present_pairs.size:
+            found = np.searchsorted(present_pairs, wanted)
+            found[found == present_pairs.size] = 0
+            present = (present_pairs[found] == wanted) & (term_ids >= 0)
+        else:
+            present = np.zeros(wanted.shape, dtype=bool)
+
+        scores = (self._weights[rows] * present).sum(axis=1)
+        scores[rows == 0] = np.nan
+        return np.clip(scores, 0.0, 1.0)
+
+
+@lru_cache(maxsize=None)
+def _config_scorer() -> AnswerScorer:
+    return AnswerScorer.from_config()
+
+
+def __getattr__(name: str):
+    # ANSWER_SCORER is built from config.py on first use and then shared by every session
+    if name == "ANSWER_SCORER":
+        return _config_scorer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def format_score(score: float) -> str:
+    return "n/a" if math.isnan(score) else f"{score * 100:.0f}%"
+
+
+def rank_candidates(rows: Sequence[Tuple[str, str, str]]) -> List[Tuple[str, float, int]]:
+    """Rank sessions from (session_id, question_id, answer) rows by mean answer score
+
+    Returns (session_id, mean score, answers scored), best first. All rows are
+    scored in a single batch.
+    """
+    import numpy as np
+    # Imported here: config_artifact builds on this module
+    from config_artifact import current_catalog
+
+    if not rows:
+        return []
+    session_ids, question_ids, answers = zip(*rows)
+    scores = current_catalog().answer_scorer.score(question_ids, answers)
+    scored = ~np.isnan(scores)
+    sessions, index = np.unique(np.asarray(session_ids, dtype=object), return_inverse=True)
+    totals = np.bincount(index, weights=np.where(scored, scores, 0.0), minlength=len(sessions))
+    counts = np.bincount(index, weights=scored, minlength=len(sessions))
+    means = np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+    order = np.argsort(-means, kind="stable")
+    return [(sessions[i], float(means[i]), int(counts[i])) for i in order]
+
+
+def main() -> None:
+    from candidate_store import connect
+
+    parser = argparse.ArgumentParser(description="Rank recent candidates by technical answer score")
+    parser.add_argument("--db", default="talentscout.db", help="candidate store SQLite file")
+    parser.add_argument("--hours", type=float, default=24, help="only candidates active in the last N hours")
+    parser.add_argument("--limit", type=int, default=50, help="how many candidates to print")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    since = time.time() - args.hours * 3600
+    rows = conn.execute(
+        "SELECT a.session_id, a.question_id, a.answer FROM answers a"
+        " JOIN candidates c ON c.session_id = a.session_id WHERE c.updated_at >= ?",
+        (since,),
+    ).fetchall()
+    names = dict(conn.execute(
+        "SELECT session_id, full_name || ' (' || desired_position || ')' FROM candidates WHERE updated_at >= ?",
+        (since,),
+    ).fetchall())
+
+    start = time.perf_counter()
+    ranking = rank_candidates([tuple(row) for row in rows])
+    elapsed = time.perf_counter() - start
+    print(f"{len(rows)} answers from {len(ranking)} candidates scored in {elapsed * 1000:.1f} ms")
+    for session_id, score, answered in ranking[:args.limit]:
+        print(f"{format_score(score):>5}  {answered:>2} answers  {names.get(session_id, session_id)}")
+
+
+if __name__ == "__main__":
+    main()
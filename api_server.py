@@ -0,0 +1,352 @@
+"""
+Asyncio JSON API for TalentScout Hiring Assistant
+Hosts many screening sessions in one process, without Streamlit
+
+Endpoints:
+    POST   /sessions                    create a session, returns the greeting;
+                                        {"candidate": {...}} pre-fills known details
+    POST   /sessions/{id}/turns         {"message": "..."} -> assistant reply
+    GET    /sessions/{id}/summary       candidate summary and collected info
+    GET    /candidates?q=...&limit=N    recruiter search over stored candidates
+    DELETE /sessions/{id}               drop a session
+    GET    /health                      liveness and session count
+    GET    /metrics                     stage latency and funnel metrics (OpenMetrics text)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import secrets
+import time
+import weakref
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs
+
+from assistant import HiringAssistant
+from candidate_import import load_candidate_info
+from candidate_store import CandidateStore, connect
+from config_artifact import ConfigWatcher, current_catalog
+from duplicate_index import DuplicateIndex
+from event_log import EventLog
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, METRICS
+from session_store import MemorySessionStore, SessionStore, open_session_store
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 64 * 1024
+MAX_HEADER_LINES = 100
+
+STATUS_TEXT = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ScreeningAPI:
+    """Routes JSON requests to per-session HiringAssistant instances
+
+    Sessions live in a SessionStore: by default live objects in this process,
+    or snapshots in a shared store so several API replicas can serve them.
+    Either way they expire after APP_CONFIG['session_timeout'] idle seconds.
+    With an EventLog, every turn is logged and a session this process has
+    lost (e.g. after a restart) is rebuilt from the log on its next request.
+
+    Calls into a shared store or the event log block on I/O, so they run in
+    the loop's default executor, as do the turns themselves: a turn can wait
+    on the question generator (up to its timeout). Requests for one session
+    are serialized so a turn never loads state another turn is about to
+    overwrite.
+    """
+
+    def __init__(self, store: Optional[CandidateStore] = None, sessions: Optional[SessionStore] = None,
+                 events: Optional[EventLog] = None):
+        self.sessions = sessions if sessions is not None else MemorySessionStore()
+        self.store = store
+        self.events = events
+        self._session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    async def _io(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking store call off the event loop; the in-process store is called directly"""
+        if not self.sessions.shared:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = self._session_locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def _get_session(self, session_id: str) -> HiringAssistant:
+        data = await self._io(self.sessions.load, session_id)
+        if data is None:
+            assistant = await self._recover_session(session_id)
+            if assistant is None:
+                raise HTTPError(404, f"unknown session: {session_id}")
+            return assistant
+        if not self.sessions.shared:
+            return data
+        try:
+            return HiringAssistant.restore(data)
+        except ValueError as e:
+            # Written by a newer version, or refers to questions this config no longer has
+            raise HTTPError(409, f"session {session_id} cannot be resumed: {e}")
+
+    async def _recover_session(self, session_id: str) -> Optional[HiringAssistant]:
+        """Rebuild a session from the event log unless it has been idle past its timeout"""
+        if self.events is None:
+            return None
+        replayed = await asyncio.get_running_loop().run_in_executor(None, self.events.replay, session_id)
+        if replayed is None or time.time() - replayed.updated_at > self.sessions.ttl:
+            return None
+        await self._put_session(session_id, replayed.assistant)
+        return replayed.assistant
+
+    async def _put_session(self, session_id: str, assistant: HiringAssistant) -> None:
+        if self.sessions.shared:
+            await self._io(self.sessions.save, session_id, assistant.snapshot())
+        else:
+            self.sessions.save(session_id, assistant)
+
+    async def create_session(self, body: Dict) -> Tuple[int, Dict]:
+        candidate = body.get("candidate")
+        if candidate is not None and not isinstance(candidate, dict):
+            raise HTTPError(400, "'candidate' must be an object")
+        try:
+            info = load_candidate_info(candidate) if candidate else None
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        session_id = secrets.token_urlsafe(16)
+        assistant = HiringAssistant(session_id, info)
+        reply = await self._respond(session_id, assistant, "")
+        await self._put_session(session_id, assistant)
+        return 201, {"session_id": session_id, "reply": reply, "stage": assistant.get_current_stage()}
+
+    async def post_turn(self, session_id: str, body: Dict) -> Tuple[int, Dict]:
+        async with self._session_lock(session_id):
+            assistant = await self._get_session(session_id)
+            message = body.get("message")
+            if not isinstance(message, str):
+                raise HTTPError(400, "'message' must be a string")
+            if assistant.conversation_ended:
+                raise HTTPError(400, "conversation has ended")
+            reply = await self._respond(session_id, assistant, message)
+            await self._put_session(session_id, assistant)
+        if self.store is not None:
+            self.store.save(session_id, assistant)
+        return 200, {
+            "reply": reply,
+            "stage": assistant.get_current_stage(),
+            "conversation_ended": assistant.conversation_ended,
+        }
+
+    async def _respond(self, session_id: str, assistant: HiringAssistant, message: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(None, self._turn, session_id, assistant, message)
+
+    def _turn(self, session_id: str, assistant: HiringAssistant, message: str) -> str:
+        if self.events is None:
+            return assistant.get_response(message)
+        start = self.events.begin_turn(session_id, assistant)
+        reply = assistant.get_response(message)
+        self.events.end_turn(start, message, reply)
+        return reply
+
+    async def get_summary(self, session_id: str) -> Tuple[int, Dict]:
+        assistant = await self._get_session(session_id)
+        return 200, {
+            "summary": assistant.get_candidate_summary(),
+            "candidate_info": asdict(assistant.candidate_info),
+            "stage": assistant.get_current_stage(),
+            "conversation_ended": assistant.conversation_ended,
+        }
+
+    async def delete_session(self, session_id: str) -> Tuple[int, Dict]:
+        async with self._session_lock(session_id):
+            await self._get_session(session_id)
+            await self._io(self.sessions.delete, session_id)
+            if self.events is not None:
+                self.events.close_session(session_id)
+        return 200, {"deleted": session_id}
+
+    def search_candidates(self, query: str) -> Tuple[int, Dict]:
+        if self.store is None or self.store.index is None:
+            raise HTTPError(404, "candidate search needs --db")
+        params = parse_qs(query)
+        try:
+            limit = int(params.get("limit", ["100"])[0])
+        except ValueError:
+            raise HTTPError(400, "'limit' must be an integer")
+        result = self.store.search(params.get("q", [""])[0], max(0, min(limit, 1000)))
+        return 200, {"total": result.total, "session_ids": result.session_ids}
+
+    async def dispatch(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, Union[Dict, str]]:
+        path, _, query = path.partition("?")
+        parts = [part for part in path.split("/") if part]
+
+        if parts == ["health"] and method == "GET":
+            return 200, {"status": "ok", "sessions": await self._io(self.sessions.count)}
+        if parts == ["metrics"] and method == "GET":
+            return 200, METRICS.render()
+        if parts == ["sessions"] and method == "POST":
+            return await self.create_session(body or {})
+        if parts == ["candidates"] and method == "GET":
+            return self.search_candidates(query)
+        if len(parts) == 2 and parts[0] == "sessions" and method == "DELETE":
+            return await self.delete_session(parts[1])
+        if len(parts) == 3 and parts[0] == "sessions":
+            if parts[2] == "turns" and method == "POST":
+                return await self.post_turn(parts[1], body or {})
+            if parts[2] == "summary" and method == "GET":
+                return await self.get_summary(parts[1])
+
+        known_paths = (["health"], ["metrics"], ["sessions"], ["candidates"])
+        if parts in known_paths or (parts and parts[0] == "sessions" and len(parts) in (2, 3)):
+            raise HTTPError(405, f"{method} not allowed on {path}")
+        raise HTTPError(404, f"no route for {path}")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HTTPError(400, "too many headers")
+
+    try:
+        length = int(headers.get("content-length", "0") or 0)
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length")
+    if length < 0:
+        raise HTTPError(400, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path, headers, body
+
+
+def _encode_response(status: int, payload: Union[Dict, str], keep_alive: bool) -> bytes:
+    if isinstance(payload, str):
+        body, content_type = payload.encode("utf-8"), METRICS_CONTENT_TYPE
+    else:
+        body, content_type = json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8"
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def handle_connection(api: ScreeningAPI, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            keep_alive = False
+            method = path = ""
+            try:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, raw_body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    body = json.loads(raw_body) if raw_body else None
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    raise HTTPError(400, "invalid JSON body")
+                if body is not None and not isinstance(body, dict):
+                    raise HTTPError(400, "request body must be a JSON object")
+                status, payload = await api.dispatch(method, path, body)
+            except HTTPError as e:
+                status, payload = e.status, {"error": e.message}
+            except asyncio.IncompleteReadError:
+                break
+            except Exception:
+                logger.exception("Failed to handle %s %s", method, path)
+                status, payload = 500, {"error": "internal server error"}
+
+            writer.write(_encode_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8080, api: Optional[ScreeningAPI] = None) -> None:
+    api = api or ScreeningAPI()
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(api, reader, writer), host, port
+    )
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the hiring assistant as a JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--db", help="SQLite file to persist screenings to")
+    parser.add_argument("--sessions", help="shared session store: redis://host:port or a SQLite file")
+    parser.add_argument("--config", help="config artifact to load and watch for new versions")
+    parser.add_argument("--events", help="directory for the per-turn event log; lost sessions are rebuilt from it")
+    parser.add_argument("--adaptive-questions", action="store_true",
+                        help="choose technical questions adaptively and stop once the skill estimate is confident")
+    args = parser.parse_args()
+    if args.adaptive_questions:
+        HiringAssistant.adaptive_questions = True
+    watcher = ConfigWatcher(args.config).start() if args.config else None
+    # Build the catalog before taking traffic, not on the first candidate's tech stack
+    current_catalog()
+    store = CandidateStore(args.db, index=True) if args.db else None
+    if store is not None:
+        HiringAssistant.duplicate_index = DuplicateIndex.from_connection(connect(args.db)).start()
+    sessions = open_session_store(args.sessions)
+    # Replies are not held back for fsync; a crash can lose the turns of the
+    # last group commit
+    events = EventLog(args.events, wait_for_commit=False) if args.events else None
+    try:
+        asyncio.run(serve(args.host, args.port, ScreeningAPI(store, sessions, events)))
+    finally:
+        if events is not None:
+            events.close()
+        if watcher is not None:
+            watcher.stop()
+        if store is not None:
+            store.close()
+        if sessions is not None:
+            sessions.close()
+
+
+if __name__ == "__main__":
+    main()
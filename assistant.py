@@ -0,0 +1,622 @@
+"""
+Core screening logic for TalentScout Hiring Assistant
+Conversation state machine and candidate data, with no UI dependencies
+"""
+
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, fields
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from adaptive_questions import POOL_SIZE
+from answer_scoring import format_score
+from config import APP_CONFIG
+from config_artifact import current_catalog
+from duplicate_index import DuplicateMatch, phone_digits
+from metrics import METRICS
+from question_cache import cache_key
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep the dict layout
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class CandidateInfo:
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    experience_years: str = ""
+    desired_position: str = ""
+    location: str = ""
+    tech_stack: List[str] = None
+
+    def __post_init__(self):
+        if self.tech_stack is None:
+            self.tech_stack = []
+
+
+# Model-generated questions are content-addressed ("gen/<hash>") so that
+# sessions can keep referring to questions by id. Each session keeps the
+# texts of its own; this process-wide registry only remembers recent ones,
+# for lookups without a session such as exports.
+MAX_GENERATED_QUESTIONS = 10_000
+_GENERATED_QUESTIONS: "OrderedDict[str, str]" = OrderedDict()
+_generated_lock = threading.Lock()
+
+
+def register_question(text: str) -> str:
+    """Return the id of a question that is not in the template bank"""
+    qid = sys.intern("gen/" + hashlib.sha1(text.encode("utf-8")).hexdigest()[:16])
+    with _generated_lock:
+        _GENERATED_QUESTIONS[qid] = text
+        _GENERATED_QUESTIONS.move_to_end(qid)
+        if len(_GENERATED_QUESTIONS) > MAX_GENERATED_QUESTIONS:
+            _GENERATED_QUESTIONS.popitem(last=False)
+    return qid
+
+
+def question_text(qid: str) -> str:
+    """Text of a bank question, or of a recently generated one; KeyError otherwise"""
+    text = current_catalog().question_index.text.get(qid)
+    if text is not None:
+        return text
+    with _generated_lock:
+        return _GENERATED_QUESTIONS[qid]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of the screening conversation
+
+    handler is the HiringAssistant method that processes the candidate's
+    input. Simple collection stages store the stripped input in `field`
+    when `validator` accepts it and reply with `prompt`, otherwise they
+    reply with `retry_prompt`.
+    """
+    name: str
+    handler: str
+    field: Optional[str] = None
+    validator: Optional[str] = None
+    prompt: str = ""
+    retry_prompt: str = ""
+
+
+STAGE_DEFINITIONS = {
+    "greeting": Stage(
+        name="greeting",
+        handler="_handle_greeting",
+        prompt="""Hello! 👋 Welcome to TalentScout's AI Hiring Assistant!
+
+I'm here to help with your initial screening for technology positions. I'll gather some basic information about you and ask a few technical questions based on your expertise.
+
+This should take about 5-10 minutes. You can type 'exit' or 'bye' anytime to end our conversation.
+
+Let's get started! What's your full name?""",
+    ),
+    "name_collection": Stage(
+        name="name_collection",
+        handler="_handle_field",
+        field="full_name",
+        prompt="Nice to meet you, {value}! 😊\n\nCould you please provide your email address?",
+        retry_prompt="Please provide your full name to continue.",
+    ),
+    "email_collection": Stage(
+        name="email_collection",
+        handler="_handle_field",
+        field="email",
+        validator="validate_email",
+        prompt="Great! Now, what's your phone number?",
+        retry_prompt="Please provide a valid email address (e.g., john@example.com).",
+    ),
+    "phone_collection": Stage(
+        name="phone_collection",
+        handler="_handle_field",
+        field="phone",
+        validator="validate_phone",
+        prompt="Perfect! How many years of professional experience do you have in technology?",
+        retry_prompt="Please provide a valid phone number.",
+    ),
+    "experience_collection": Stage(
+        name="experience_collection",
+        handler="_handle_field",
+        field="experience_years",
+        prompt="Thanks! What position(s) are you interested in? (e.g., Software Developer, Data Scientist, DevOps Engineer)",
+        retry_prompt="Please specify your years of experience.",
+    ),
+    "position_collection": Stage(
+        name="position_collection",
+        handler="_handle_field",
+        field="desired_position",
+        prompt="Excellent! What's your current location (city, state/country)?",
+        retry_prompt="Please specify the position you're interested in.",
+    ),
+    "location_collection": Stage(
+        name="location_collection",
+        handler="_handle_field",
+        field="location",
+        prompt="""Now for the technical part! 💻
+
+Please tell me about your tech stack. List the programming languages, frameworks, databases, and tools you're proficient in.
+
+For example: "Python, Django, React, PostgreSQL, AWS, Docker" """,
+        retry_prompt="Please provide your current location.",
+    ),
+    "tech_stack_collection": Stage(
+        name="tech_stack_collection",
+        handler="_handle_tech_stack",
+        retry_prompt="Please tell me about your technical skills and tools you use.",
+    ),
+    "technical_questions": Stage(
+        name="technical_questions",
+        handler="_handle_technical_questions",
+        retry_prompt="Please provide an answer to continue with the next question.",
+    ),
+    "conclusion": Stage(
+        name="conclusion",
+        handler="_handle_conclusion",
+        prompt="""Thank you for your interest in TalentScout! 🌟
+
+Your information has been recorded and our team will be in touch soon.
+
+Have a wonderful day, and good luck with your job search!
+
+Type 'bye' to end our conversation.""",
+    ),
+}
+
+DUPLICATE_PROMPT = """Welcome back, {name}! 👋 It looks like you've already completed a screening with us using this {field}, so there's no need to go through it again.
+
+Our recruitment team has your application and will be in touch if your profile matches our current openings.
+
+Type 'bye' to end our conversation."""
+
+PREFILLED_GREETING = """Hello, {name}! 👋 Welcome to TalentScout's AI Hiring Assistant!
+
+We already have some of your details from your application, so I'll only ask for what's missing. You can type 'exit' or 'bye' anytime to end our conversation.
+
+"""
+
+# Fields whose completion triggers a duplicate-applicant check
+_DUPLICATE_CHECK_FIELDS = {"email": "email address", "phone": "phone number"}
+
+
+def _compile_stages(names: List[str]) -> Tuple[Stage, ...]:
+    unknown = [name for name in names if name not in STAGE_DEFINITIONS]
+    if unknown:
+        raise ValueError(f"Unknown conversation stages in APP_CONFIG: {', '.join(unknown)}")
+    return tuple(STAGE_DEFINITIONS[name] for name in names)
+
+
+# Stage order comes from config so there is a single source of truth
+STAGES = _compile_stages(APP_CONFIG["conversation_stages"])
+CONCLUSION_STAGE = STAGE_DEFINITIONS["conclusion"]
+
+EXIT_KEYWORDS = frozenset(["bye", "goodbye", "exit", "quit", "end", "stop", "finish"])
+# Words that may accompany an exit keyword ("ok bye for now", "end the chat please")
+_EXIT_FILLER_WORDS = frozenset(["ok", "okay", "please", "now", "for", "let's", "thanks", "thank", "you", "i", "want", "to", "the", "this", "conversation", "chat", "screening", "interview"])
+_WORD = re.compile(r"[a-z']+")
+_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+SNAPSHOT_VERSION = 1
+_CANDIDATE_FIELDS = tuple(f.name for f in fields(CandidateInfo))
+
+
+class HiringAssistant:
+    # Shared, read-only stage list; per-session state lives in the slots
+    conversation_stages = tuple(stage.name for stage in STAGES)
+
+    # Optional model-backed generator shared by every session (see
+    # question_generator.QuestionGenerator). Templates are used without it.
+    question_generator = None
+    # Optional question_cache.QuestionCache in front of question selection
+    question_cache = None
+    # metrics.ScreeningMetrics to record latency and funnel data into; None disables it
+    metrics = METRICS
+    # Optional duplicate_index.DuplicateIndex checked once email and phone are given
+    duplicate_index = None
+    # Ask bank questions one at a time for the running skill estimate (see
+    # adaptive_questions.py) instead of a fixed set; the model generator is not used
+    adaptive_questions = APP_CONFIG['adaptive_questions']
+
+    __slots__ = (
+        "current_stage_index",
+        "candidate_info",
+        "question_ids",
+        "current_question_index",
+        "answers",
+        "conversation_ended",
+        "session_id",
+        "duplicate_of",
+        "generated_questions",
+    )
+
+    def __init__(self, session_id: str = "", candidate_info: Optional[CandidateInfo] = None):
+        self.current_stage_index = 0
+        # Pre-filled details (e.g. from candidate_import) skip their stages
+        self.candidate_info = candidate_info if candidate_info is not None else CandidateInfo()
+        self.question_ids: Tuple[str, ...] = ()
+        self.current_question_index = 0
+        self.answers: List[str] = []
+        self.conversation_ended = False
+        self.session_id = session_id
+        self.duplicate_of: Optional[DuplicateMatch] = None
+        # Texts of the model-generated questions among question_ids, by id
+        self.generated_questions: Optional[Dict[str, str]] = None
+
+    @property
+    def technical_questions(self) -> List[str]:
+        return [self.question_text(qid) for qid in self.question_ids]
+
+    def question_text(self, qid: str) -> str:
+        if self.generated_questions is not None and qid in self.generated_questions:
+            return self.generated_questions[qid]
+        return question_text(qid)
+
+    def _keep_questions(self, texts: Iterable[str]) -> Tuple[str, ...]:
+        """Ids for question texts; texts outside the bank are kept with the session"""
+        bank_ids = current_catalog().question_index.ids_by_text
+        ids = []
+        for text in texts:
+            qid = bank_ids.get(text)
+            if qid is None:
+                qid = register_question(text)
+                if self.generated_questions is None:
+                    self.generated_questions = {}
+                self.generated_questions[qid] = text
+            ids.append(qid)
+        return tuple(ids)
+
+    def get_current_stage(self):
+        if self.current_stage_index < len(STAGES):
+            return STAGES[self.current_stage_index].name
+        return "conclusion"
+
+    def advance_stage(self):
+        if self.metrics is not None:
+            self.metrics.stage_completions.inc(self.get_current_stage())
+        self.current_stage_index += 1
+
+    def is_exit_keyword(self, user_input: str) -> bool:
+        # Only short messages made of exit words ("bye", "exit please", "end the
+        # chat") count, so "Backend Developer" or an answer mentioning "stop"
+        # does not end the screening
+        words = _WORD.findall(user_input.lower())
+        return bool(words) and any(word in EXIT_KEYWORDS for word in words) and all(
+            word in EXIT_KEYWORDS or word in _EXIT_FILLER_WORDS for word in words
+        )
+
+    def validate_email(self, email: str) -> bool:
+        return _EMAIL.match(email) is not None
+
+    def validate_phone(self, phone: str) -> bool:
+        # Check if it has 10-15 digits (common phone number lengths)
+        return 10 <= len(phone_digits(phone)) <= 15
+
+    def extract_tech_stack(self, user_input: str) -> List[str]:
+        return current_catalog().tech_matcher.extract(user_input)
+
+    def select_question_ids(self, tech_stack: List[str], position: str = "", seed: str = "") -> Tuple[str, ...]:
+        """Pick question ids from the shared bank based on the candidate's tech stack and position"""
+        return current_catalog().question_index.select(tech_stack, position, seed)
+
+    def _choose_question_ids(self, tech_stack: List[str]) -> Tuple[str, ...]:
+        """Pick the question set, preferring (cached) model-generated questions"""
+        start = time.perf_counter()
+        question_ids, source = self._choose_question_ids_from(tech_stack)
+        if self.metrics is not None:
+            self.metrics.question_selection.observe(time.perf_counter() - start, source)
+        return question_ids
+
+    def _choose_question_ids_from(self, tech_stack: List[str]) -> Tuple[Tuple[str, ...], str]:
+        info = self.candidate_info
+        if self.adaptive_questions:
+            # Only the first question; the rest are chosen as answers come in
+            first = self._next_adaptive_question_id()
+            return ((first,) if first is not None else ()), "adaptive"
+        if self.question_generator is None:
+            # Rotate the bank per candidate so leaked questions are spread out
+            return self.select_question_ids(tech_stack, info.desired_position, info.email.lower()), "bank"
+
+        cache = self.question_cache
+        if cache is not None:
+            key = cache_key(tech_stack, info.desired_position, info.experience_years)
+            cached = cache.get(key)
+            if cached is not None:
+                return self._keep_questions(cached), "cache"
+
+        question_ids = self._generated_question_ids(tech_stack)
+        if not question_ids:
+            # Not cached, so the next candidate with this stack retries the model
+            return self.select_question_ids(tech_stack, info.desired_position, info.email.lower()), "fallback"
+
+        if cache is not None:
+            cache.put(key, [self.question_text(qid) for qid in question_ids])
+        return question_ids, "model"
+
+    def _generated_question_ids(self, tech_stack: List[str]) -> Tuple[str, ...]:
+        """Ask the model-backed generator for questions; empty when unavailable or late"""
+        if self.question_generator is None:
+            return ()
+        questions = self.question_generator.generate(
+            tech_stack,
+            self.candidate_info.desired_position,
+            self.candidate_info.experience_years,
+        )
+        return self._keep_questions(questions or ())
+
+    def _next_adaptive_question_id(self) -> Optional[str]:
+        """The most informative question for the skill estimate so far; None once it is confident"""
+        catalog = current_catalog()
+        info = self.candidate_info
+        pool = catalog.question_index.select(info.tech_stack, info.desired_position, info.email.lower(),
+                                             max_questions=POOL_SIZE)
+        return catalog.item_bank.next_question(pool, self.question_ids, self.answer_scores())
+
+    def generate_technical_questions(self, tech_stack: List[str], position: str = "", seed: str = "") -> List[str]:
+        """Generate technical questions based on the candidate's tech stack"""
+        return [question_text(qid) for qid in self.select_question_ids(tech_stack, position, seed)]
+
+    def get_response(self, user_input: str) -> str:
+        return "".join(self.stream_response(user_input))
+
+    def stream_response(self, user_input: str) -> Iterator[str]:
+        """Yield the reply in chunks as they become available
+
+        Joined together the chunks equal get_response(). Stages that have to
+        wait on slow work (such as model-generated questions) yield what they
+        already know first. The stream must be consumed to the end for the
+        turn to be fully applied.
+        """
+        start = time.perf_counter()
+        stage_name = self.get_current_stage()
+        if self.is_exit_keyword(user_input):
+            if self.metrics is not None:
+                self.metrics.exits.inc(stage_name)
+            self.conversation_ended = True
+            yield "Thank you for your time! We'll review your information and get back to you soon. Have a great day! 👋"
+            return
+
+        if self.current_stage_index < len(STAGES):
+            index = self.current_stage_index
+            reply = _STAGE_HANDLERS[index](self, STAGES[index], user_input)
+        else:
+            reply = self._handle_conclusion(CONCLUSION_STAGE, user_input)
+
+        if isinstance(reply, str):
+            yield reply
+        else:
+            yield from reply
+
+        if self.metrics is not None:
+            self.metrics.stage_latency.observe(time.perf_counter() - start, stage_name)
+
+    def _handle_greeting(self, stage: Stage, user_input: str) -> str:
+        self.advance_stage()
+        reply = self._skip_answered()
+        if reply is None:
+            return stage.prompt
+        if self.current_stage_index >= len(STAGES) and self.duplicate_of is not None:
+            return reply
+        return PREFILLED_GREETING.format(name=self.candidate_info.full_name) + reply
+
+    def _skip_answered(self) -> Optional[str]:
+        """Move past stages the pre-filled candidate info already answers
+
+        Returns the reply asking for the first missing detail, or None when
+        the current stage still needs the candidate's input.
+        """
+        info = self.candidate_info
+        reply = None
+        while self.current_stage_index < len(STAGES):
+            stage = STAGES[self.current_stage_index]
+            if stage.field is not None:
+                value = getattr(info, stage.field)
+                if not value or (stage.validator and not getattr(self, stage.validator)(value)):
+                    return reply
+                duplicate = self._duplicate_reply(stage.field)
+                if duplicate is not None:
+                    return duplicate
+                self.advance_stage()
+                reply = stage.prompt.format(value=value)
+            elif stage.handler == "_handle_tech_stack" and info.tech_stack:
+                return f"I have your expertise down as: {', '.join(info.tech_stack)}\n\n" + self._start_questions()
+            else:
+                return reply
+        return reply
+
+    def _handle_field(self, stage: Stage, user_input: str) -> str:
+        value = user_input.strip()
+        valid = getattr(self, stage.validator)(value) if stage.validator else bool(value)
+        if not valid:
+            if stage.validator and self.metrics is not None:
+                self.metrics.validation_failures.inc(stage.field)
+            return stage.retry_prompt
+        setattr(self.candidate_info, stage.field, value)
+        duplicate = self._duplicate_reply(stage.field)
+        if duplicate is not None:
+            return duplicate
+        self.advance_stage()
+        skipped = self._skip_answered()
+        return skipped if skipped is not None else stage.prompt.format(value=value)
+
+    def _duplicate_reply(self, field: str) -> Optional[str]:
+        """Conclude the screening if this field matches a finished one; None otherwise"""
+        if field not in _DUPLICATE_CHECK_FIELDS or self.duplicate_index is None:
+            return None
+        if not (self._check_duplicate() and self.duplicate_of.completed):
+            return None
+        # Same email or phone as a finished screening: skip the rest
+        self.current_stage_index = len(STAGES)
+        return DUPLICATE_PROMPT.format(
+            name=self.candidate_info.full_name, field=_DUPLICATE_CHECK_FIELDS[self.duplicate_of.reason])
+
+    def _check_duplicate(self) -> bool:
+        """Look the applicant up among earlier ones and register them; True on an exact match"""
+        info = self.candidate_info
+        matches = self.duplicate_index.find(info.full_name, info.email, info.phone, exclude=self.session_id)
+        if self.session_id:
+            self.duplicate_index.register(self.session_id, info.full_name, info.email, info.phone)
+        if not matches:
+            return False
+        match = matches[0]
+        if self.duplicate_of is None or (self.duplicate_of.reason == "name" and match.reason != "name"):
+            self.duplicate_of = match
+            if self.metrics is not None:
+                self.metrics.duplicates.inc(match.reason)
+        return match.reason != "name"
+
+    def _handle_tech_stack(self, stage: Stage, user_input: str) -> Iterator[str]:
+        if not user_input.strip():
+            yield stage.retry_prompt
+            return
+
+        tech_stack = self.extract_tech_stack(user_input)
+        if not tech_stack:
+            yield "I couldn't identify specific technologies. Please mention specific programming languages, frameworks, or tools you know (e.g., Python, React, MySQL, etc.)."
+            return
+
+        self.candidate_info.tech_stack = tech_stack
+        # Acknowledge straight away; choosing questions may wait on the model
+        yield f"Perfect! I've identified your expertise in: {', '.join(tech_stack)}\n\n"
+        yield self._start_questions()
+
+    def _start_questions(self) -> str:
+        """Choose the technical questions for the tech stack and ask the first one"""
+        self.question_ids = self._choose_question_ids(self.candidate_info.tech_stack)
+        self.advance_stage()
+        count = f"up to {APP_CONFIG['max_questions']}" if self.adaptive_questions else len(self.question_ids)
+        return f"""Now I'll ask you {count} technical questions to assess your proficiency. Please answer them to the best of your ability.
+
+**Question 1:** {self.question_text(self.question_ids[0]) if self.question_ids else "Tell me about a recent project you've worked on."}"""
+
+    def _handle_technical_questions(self, stage: Stage, user_input: str) -> str:
+        if not user_input.strip():
+            return stage.retry_prompt
+
+        self.answers.append(user_input.strip())
+        self.current_question_index += 1
+        if self.adaptive_questions and self.current_question_index >= len(self.question_ids):
+            next_id = self._next_adaptive_question_id()
+            if next_id is not None:
+                self.question_ids += (next_id,)
+
+        if self.current_question_index < len(self.question_ids):
+            return f"Thank you for your answer! 👍\n\n**Question {self.current_question_index + 1}:** {self.question_text(self.question_ids[self.current_question_index])}"
+
+        self.advance_stage()
+        if self.metrics is not None:
+            self.metrics.questions_asked.observe(
+                len(self.question_ids), "adaptive" if self.adaptive_questions else "fixed")
+        if self.duplicate_index is not None and self.session_id:
+            self.duplicate_index.register(self.session_id, completed=True)
+        return """Excellent! You've completed all the technical questions. 🎉
+
+Let me summarize the information we've collected:
+
+""" + self.get_candidate_summary() + """
+
+Thank you for taking the time to complete this screening! Our recruitment team will review your responses and contact you within 2-3 business days if your profile matches our current openings.
+
+Is there anything else you'd like to know about TalentScout or our process?"""
+
+    def _handle_conclusion(self, stage: Stage, user_input: str) -> str:
+        return stage.prompt
+
+    def answer_scores(self) -> List[float]:
+        """Keypoint score (0-1, NaN if unscorable) for each technical answer given so far"""
+        answered = self.question_ids[:len(self.answers)]
+        return [float(score) for score in current_catalog().answer_scorer.score(answered, self.answers)]
+
+    def get_candidate_summary(self) -> str:
+        summary = f"""
+**Candidate Summary:**
+• **Name:** {self.candidate_info.full_name}
+• **Email:** {self.candidate_info.email}
+• **Phone:** {self.candidate_info.phone}
+• **Experience:** {self.candidate_info.experience_years} years
+• **Desired Position:** {self.candidate_info.desired_position}
+• **Location:** {self.candidate_info.location}
+• **Tech Stack:** {', '.join(self.candidate_info.tech_stack) if self.candidate_info.tech_stack else 'Not specified'}
+• **Questions Completed:** {len(self.question_ids)} technical questions answered
+"""
+        scores = self.answer_scores()
+        if scores:
+            per_question = ", ".join(f"Q{i}: {format_score(score)}" for i, score in enumerate(scores, 1))
+            scored = [score for score in scores if score == score]
+            average = format_score(sum(scored) / len(scored)) if scored else "n/a"
+            summary += f"• **Answer Scores:** {per_question} (average {average})\n"
+            if self.adaptive_questions:
+                skill, spread = current_catalog().item_bank.estimate(self.question_ids[:len(scores)], scores)
+                summary += f"• **Skill Estimate:** {skill:+.1f} ± {spread:.1f} (0 is the bank's average difficulty)\n"
+        if self.duplicate_of is not None:
+            match = self.duplicate_of
+            detail = f"similar name, {match.similarity:.0%}" if match.reason == "name" else f"same {match.reason}"
+            summary += f"• **Possible Duplicate Of:** {match.session_id} ({detail})\n"
+        return summary
+
+    def snapshot(self) -> bytes:
+        """Serialize the conversation state into a small versioned JSON blob"""
+        state = {
+            "v": SNAPSHOT_VERSION,
+            "s": self.current_stage_index,
+            "c": list(astuple(self.candidate_info)),
+            "q": list(self.question_ids),
+            "g": self.generated_questions or {},
+            "i": self.current_question_index,
+            "a": self.answers,
+            "e": self.conversation_ended,
+        }
+        if self.session_id:
+            state["id"] = self.session_id
+        if self.duplicate_of is not None:
+            state["d"] = list(astuple(self.duplicate_of))
+        return json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def restore(cls, blob: bytes) -> "HiringAssistant":
+        """Rebuild a HiringAssistant from a snapshot() blob"""
+        state = json.loads(blob)
+        if state.get("v") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {state.get('v')!r}")
+
+        assistant = cls(state.get("id", ""))
+        assistant.current_stage_index = state["s"]
+        assistant.candidate_info = CandidateInfo(**dict(zip(_CANDIDATE_FIELDS, state["c"])))
+        generated = state.get("g")
+        if generated:
+            assistant.generated_questions = {sys.intern(qid): text for qid, text in generated.items()}
+        else:
+            generated = {}
+        bank = current_catalog().question_index.text
+        unknown = [qid for qid in state["q"] if qid not in bank and qid not in generated]
+        if unknown:
+            raise ValueError(f"Snapshot refers to unknown questions: {', '.join(unknown)}")
+        assistant.question_ids = tuple(sys.intern(qid) for qid in state["q"])
+        assistant.current_question_index = state["i"]
+        assistant.answers = list(state.get("a", ()))
+        assistant.conversation_ended = state["e"]
+        if state.get("d"):
+            assistant.duplicate_of = DuplicateMatch(*state["d"])
+        return assistant
+
+
+def validate_emails(emails: Iterable[str]) -> List[bool]:
+    """Batch version of HiringAssistant.validate_email for bulk imports"""
+    match = _EMAIL.match
+    return [match(email) is not None for email in emails]
+
+
+def validate_phones(phones: Iterable[str]) -> List[bool]:
+    """Batch version of HiringAssistant.validate_phone for bulk imports"""
+    return [10 <= len(phone_digits(phone)) <= 15 for phone in phones]
+
+
+# Stage handlers resolved once, indexed like STAGES
+_STAGE_HANDLERS: Tuple[Callable[[HiringAssistant, Stage, str], Union[str, Iterator[str]]], ...] = tuple(
+    getattr(HiringAssistant, stage.handler) for stage in STAGES
+)
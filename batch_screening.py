@@ -0,0 +1,137 @@
+"""
+Headless batch screening for TalentScout Hiring Assistant
+Replays scripted candidate transcripts through HiringAssistant without the UI
+
+Input is JSONL, one candidate per line:
+    {"candidate_id": "c-001", "turns": ["Jane Doe", "jane@example.com", ...]}
+
+Output is JSONL in the same order as the input, one result per candidate.
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Dict, Iterable, Iterator, List
+
+from assistant import HiringAssistant
+
+
+def validate_transcript(transcript) -> None:
+    """Raise ValueError unless transcript is an object whose turns are a list of strings"""
+    if not isinstance(transcript, dict):
+        raise ValueError("expected a JSON object")
+    turns = transcript.get("turns", [])
+    if not isinstance(turns, list) or not all(isinstance(turn, str) for turn in turns):
+        raise ValueError("'turns' must be a list of strings")
+
+
+def screen_transcript(transcript: Dict) -> Dict:
+    """Replay one candidate's turns and return the final screening result"""
+    validate_transcript(transcript)
+    assistant = HiringAssistant()
+    # The UI opens every conversation with an empty turn to get the greeting
+    assistant.get_response("")
+
+    turns_used = 0
+    for turn in transcript.get("turns", []):
+        if assistant.conversation_ended:
+            break
+        assistant.get_response(turn)
+        turns_used += 1
+
+    return {
+        "candidate_id": transcript.get("candidate_id"),
+        "final_stage": assistant.get_current_stage(),
+        "conversation_ended": assistant.conversation_ended,
+        "turns_used": turns_used,
+        "candidate_info": asdict(assistant.candidate_info),
+        "answer_scores": [None if score != score else round(score, 3) for score in assistant.answer_scores()],
+        "summary": assistant.get_candidate_summary(),
+    }
+
+
+def screen_line(line: str) -> str:
+    """Screen one raw JSONL line and return the serialized result
+
+    A bad line becomes an error result, so it never stops the rest of the batch.
+    """
+    try:
+        transcript = json.loads(line)
+        validate_transcript(transcript)
+    except ValueError as e:
+        return json.dumps({"candidate_id": None, "error": f"invalid transcript: {e}"}, ensure_ascii=False)
+    try:
+        result = screen_transcript(transcript)
+    except Exception as e:
+        result = {"candidate_id": transcript.get("candidate_id"), "error": f"screening failed: {type(e).__name__}: {e}"}
+    return json.dumps(result, ensure_ascii=False, default=str)
+
+
+def screen_chunk(lines: List[str]) -> List[str]:
+    return [screen_line(line) for line in lines]
+
+
+def _chunked(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    chunk = []
+    for line in lines:
+        if not line.strip():
+            continue
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(lines: Iterable[str], workers: int = 1, chunk_size: int = 64,
+              max_pending: int = 0) -> Iterator[str]:
+    """Screen transcripts across a process pool, yielding results in input order
+
+    At most max_pending chunks are in flight at once (default: 4 per worker),
+    so memory stays bounded no matter how large the input file is.
+    """
+    chunks = _chunked(lines, chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from screen_chunk(chunk)
+        return
+
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(screen_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay candidate transcripts without the Streamlit UI")
+    parser.add_argument("input", help="JSONL file of transcripts ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file for results ('-' for stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=64, help="transcripts sent to a worker at a time")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for result in run_batch(source, workers=args.workers, chunk_size=args.chunk_size):
+            sink.write(result + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Adaptive questioning simulation for TalentScout Hiring Assistant
+Screens simulated candidates of known skill with the adaptive policy and with
+the fixed question set, and compares questions asked, estimation error and
+pass/fail agreement with the true skill
+
+Usage:
+    python benchmarks/adaptive_simulation.py --candidates 2000
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adaptive_questions import PASS_LEVEL, POOL_SIZE, probability  # noqa: E402
+from config import APP_CONFIG, QUESTION_TEMPLATES  # noqa: E402
+from config_artifact import current_catalog  # noqa: E402
+
+# Answers are scored on the share of a question's keypoints they cover
+KEYPOINTS = 4
+
+
+def answer_score(rng: random.Random, theta: float, rating: Tuple[float, float]) -> float:
+    p = probability(theta, rating)
+    return sum(rng.random() < p for _ in range(KEYPOINTS)) / KEYPOINTS
+
+
+def screen(rng: random.Random, theta: float, stack: Sequence[str], seed: str, adaptive: bool) -> Tuple[int, float]:
+    """(questions asked, skill estimate) for one simulated candidate"""
+    catalog = current_catalog()
+    bank = catalog.item_bank
+    asked: List[str] = []
+    scores: List[float] = []
+    if adaptive:
+        pool = catalog.question_index.select(stack, "", seed, max_questions=POOL_SIZE)
+        while True:
+            qid = bank.next_question(pool, asked, scores)
+            if qid is None:
+                break
+            asked.append(qid)
+            scores.append(answer_score(rng, theta, bank.rating(qid)))
+    else:
+        for qid in catalog.question_index.select(stack, "", seed):
+            asked.append(qid)
+            scores.append(answer_score(rng, theta, bank.rating(qid)))
+    return len(asked), bank.estimate(asked, scores)[0]
+
+
+def simulate(candidates: int, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(seed)
+    techs = sorted(QUESTION_TEMPLATES)
+    people = [(rng.gauss(0.0, 1.0), rng.sample(techs, rng.randint(1, 3)), f"candidate{n}@example.com")
+              for n in range(candidates)]
+    report = {}
+    for policy in ("fixed", "adaptive"):
+        policy_rng = random.Random(seed + 1)
+        asked, squared_error, agree = 0, 0.0, 0
+        for theta, stack, email in people:
+            count, estimate = screen(policy_rng, theta, stack, email, policy == "adaptive")
+            asked += count
+            squared_error += (estimate - theta) ** 2
+            agree += (estimate >= PASS_LEVEL) == (theta >= PASS_LEVEL)
+        report[policy] = {
+            "mean_questions": round(asked / candidates, 2),
+            "rmse": round(math.sqrt(squared_error / candidates), 3),
+            "pass_fail_agreement": round(agree / candidates, 3),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare adaptive and fixed questioning on simulated candidates")
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = simulate(args.candidates, args.seed)
+    print(json.dumps(report, indent=2))
+    print(f"{args.candidates} candidates, min {APP_CONFIG['min_questions']} / max {APP_CONFIG['max_questions']} "
+          f"questions", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Hot-path benchmarks for the TalentScout screening core
+Runs headless (no Streamlit) and compares against a saved JSON baseline
+
+Usage:
+    python benchmarks/bench_core.py                      # run and print
+    python benchmarks/bench_core.py --save               # write benchmarks/baseline.json
+    python benchmarks/bench_core.py --compare            # fail on >25% regressions
+    python benchmarks/bench_core.py -k stage --quick     # subset, fewer samples
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from assistant import STAGES, HiringAssistant  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+SHORT_STACK = "Python, Django, React, PostgreSQL, AWS, Docker"
+LONG_STACK = " ".join(
+    [
+        "Over the last decade I have shipped production systems in python and go,",
+        "built frontends with react native, vue.js and angular, ran spring boot services",
+        "on kubernetes and docker, and maintained postgresql, mongodb and redis clusters.",
+        "Most recently I worked on google cloud and aws with terraform and github actions,",
+        "plus a lot of pandas, numpy and scikit-learn for analytics.",
+    ]
+    * 40
+)
+
+# One valid answer per stage, so every stage advances
+STAGE_INPUTS = {
+    "greeting": "",
+    "name_collection": "Jane Doe",
+    "email_collection": "jane.doe@example.com",
+    "phone_collection": "+1 (555) 010-2233",
+    "experience_collection": "6",
+    "position_collection": "Backend Developer",
+    "location_collection": "Berlin, Germany",
+    "tech_stack_collection": SHORT_STACK,
+    "technical_questions": "Tuples are immutable; lists can be modified in place.",
+    "conclusion": "Thanks!",
+}
+
+
+@dataclass
+class Case:
+    """A benchmark: fn(arg) is timed, make_arg() runs outside the timed region"""
+    name: str
+    fn: Callable[[Any], Any]
+    make_arg: Callable[[], Any] = lambda: None
+
+
+def _session_at(stage_name: str) -> bytes:
+    assistant = HiringAssistant()
+    for stage in STAGES:
+        if stage.name == stage_name:
+            return assistant.snapshot()
+        assistant.get_response(STAGE_INPUTS[stage.name])
+    raise ValueError(f"unknown stage {stage_name}")
+
+
+def _full_conversation(_: Any) -> None:
+    assistant = HiringAssistant()
+    for stage in STAGES[:-1]:
+        assistant.get_response(STAGE_INPUTS[stage.name])
+    # Answer the remaining technical questions
+    while assistant.get_current_stage() == "technical_questions":
+        assistant.get_response(STAGE_INPUTS["technical_questions"])
+    assistant.get_response(STAGE_INPUTS["conclusion"])
+
+
+def build_cases() -> List[Case]:
+    assistant = HiringAssistant()
+    cases = [
+        Case("extract_tech_stack.short", lambda _: assistant.extract_tech_stack(SHORT_STACK)),
+        Case("extract_tech_stack.long", lambda _: assistant.extract_tech_stack(LONG_STACK)),
+        Case(
+            "generate_technical_questions",
+            lambda _: assistant.generate_technical_questions(["Python", "Django", "Aws"], "Backend Developer", "jane@example.com"),
+        ),
+        Case("validate_email.valid", lambda _: assistant.validate_email("jane.doe@example.com")),
+        Case("validate_email.invalid", lambda _: assistant.validate_email("jane.doe@example")),
+        Case("validate_phone", lambda _: assistant.validate_phone("+1 (555) 010-2233")),
+    ]
+
+    for stage in STAGES:
+        blob = _session_at(stage.name)
+        text = STAGE_INPUTS[stage.name]
+        cases.append(Case(
+            f"get_response.{stage.name}",
+            lambda session, text=text: session.get_response(text),
+            lambda blob=blob: HiringAssistant.restore(blob),
+        ))
+
+    cases.append(Case("conversation.end_to_end", _full_conversation))
+    return cases
+
+
+def run_case(case: Case, samples: int, target_sample_time: float) -> Dict[str, float]:
+    # Calibrate how many calls make up one sample so timer overhead is negligible
+    inner = 1
+    while True:
+        args = [case.make_arg() for _ in range(inner)]
+        start = time.perf_counter()
+        for arg in args:
+            case.fn(arg)
+        elapsed = time.perf_counter() - start
+        if elapsed >= target_sample_time or inner >= 1 << 16:
+            break
+        inner *= 2
+
+    per_op = []
+    total_time = 0.0
+    gc.collect()
+    for _ in range(samples):
+        args = [case.make_arg() for _ in range(inner)]
+        start = time.perf_counter()
+        for arg in args:
+            case.fn(arg)
+        elapsed = time.perf_counter() - start
+        total_time += elapsed
+        per_op.append(elapsed / inner)
+
+    # Allocation pass: peak bytes held during one call, and bytes still
+    # held afterwards (a leak shows up as retained bytes growing per call)
+    alloc_calls = 20
+    args = [case.make_arg() for _ in range(alloc_calls)]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    case.fn(args[0])
+    _, peak = tracemalloc.get_traced_memory()
+    for arg in args[1:]:
+        case.fn(arg)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(per_op, n=100) if len(per_op) > 1 else per_op * 99
+    return {
+        "ops_per_sec": samples * inner / total_time,
+        "min_us": min(per_op) * 1e6,
+        "mean_us": statistics.fmean(per_op) * 1e6,
+        "p50_us": quantiles[49] * 1e6,
+        "p95_us": quantiles[94] * 1e6,
+        "p99_us": quantiles[98] * 1e6,
+        "peak_alloc_bytes": max(peak - before, 0),
+        "retained_bytes_per_op": max(after - before, 0) / alloc_calls,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict, threshold: float) -> List[str]:
+    """List cases whose best sample got slower than the baseline's by more than threshold
+
+    The fastest sample is the least sensitive to scheduler noise, so it is
+    what regressions are judged on; percentiles are reported for context.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        if result["min_us"] > base["min_us"] * (1 + threshold):
+            regressions.append(
+                f"{name}: best {result['min_us']:.2f}us vs baseline {base['min_us']:.2f}us "
+                f"(+{(result['min_us'] / base['min_us'] - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the screening core's hot paths")
+    parser.add_argument("-k", "--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--samples", type=int, default=30, help="timed samples per case")
+    parser.add_argument("--quick", action="store_true", help="10 short samples per case")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON path")
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="exit 1 if a case regressed past --threshold")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    samples = 10 if args.quick else args.samples
+    sample_time = 0.002 if args.quick else 0.005
+
+    results = {}
+    for case in build_cases():
+        if args.filter in case.name:
+            results[case.name] = run_case(case, samples, sample_time)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'case':<38}{'ops/sec':>12}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}{'peak B':>9}{'kept B':>8}")
+        for name, r in results.items():
+            print(f"{name:<38}{r['ops_per_sec']:>12.0f}{r['p50_us']:>10.2f}{r['p95_us']:>10.2f}"
+                  f"{r['p99_us']:>10.2f}{r['peak_alloc_bytes']:>9}{r['retained_bytes_per_op']:>8.0f}")
+
+    if args.save:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"no baseline at {args.baseline}; run with --save first", file=sys.stderr)
+            return 2
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
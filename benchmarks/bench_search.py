@@ -0,0 +1,125 @@
+"""
+Recruiter search benchmark for TalentScout Hiring Assistant
+Builds a CandidateIndex over synthetic candidates and reports query latency,
+checking every result against a linear scan of the same candidates
+
+Usage:
+    python benchmarks/bench_search.py --candidates 1000000
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from candidate_index import CandidateIndex, candidate_terms, parse_query  # noqa: E402
+from config import TECH_KEYWORDS  # noqa: E402
+
+POSITIONS = ["Backend Developer", "Frontend Engineer", "Full Stack Developer", "DevOps Engineer",
+             "Data Scientist", "Android Developer", "Software Engineer", "SRE"]
+CITIES = ["Berlin, Germany", "Munich, Germany", "London, UK", "Paris, France", "Bangalore, India",
+          "New York, USA", "San Francisco, USA", "Toronto, Canada", "Remote"] + [f"Town {n}" for n in range(2000)]
+
+QUERIES = [
+    "kubernetes AND aws, devops, berlin",
+    "python, senior",
+    "react | vue, frontend, germany",
+    "rust",
+    "java AND spring boot, 5+ years, completed",
+    "postgresql, data, london | paris",
+    "town 17",
+    "go AND kubernetes AND terraform, devops",
+]
+
+
+def synthetic_candidates(count: int, seed: int) -> List[Dict]:
+    rnd = random.Random(seed)
+    keywords = [keyword for group in TECH_KEYWORDS.values() for keyword in group]
+    # Skewed popularity, like real stacks: a few technologies are everywhere
+    weights = [1.0 / (rank + 1) ** 0.5 for rank in range(len(keywords))]
+    city_weights = [50] * 9 + [1] * 2000
+    return [
+        {
+            "session_id": f"s{n:07d}",
+            "tech_stack": list(dict.fromkeys(rnd.choices(keywords, weights, k=rnd.randint(1, 6)))),
+            "position": rnd.choice(POSITIONS),
+            "location": rnd.choices(CITIES, city_weights)[0],
+            "experience": str(rnd.randint(0, 20)),
+            "completed": rnd.random() < 0.6,
+        }
+        for n in range(count)
+    ]
+
+
+def linear_scan(terms_of: Dict[str, Set[str]], query: str) -> Set[str]:
+    clauses = parse_query(query)
+    return {
+        session_id for session_id, terms in terms_of.items()
+        if all(any(all(term in terms for term in atom) for atom in clause) for clause in clauses)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark boolean candidate search")
+    parser.add_argument("--candidates", type=int, default=200_000)
+    parser.add_argument("--updates", type=float, default=0.2, help="share of candidates saved a second time")
+    parser.add_argument("--repeat", type=int, default=200, help="timed runs per query")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    candidates = synthetic_candidates(args.candidates, args.seed)
+    index = CandidateIndex()
+    terms_of: Dict[str, Set[str]] = {}
+    start = time.perf_counter()
+    for candidate in candidates:
+        terms = candidate_terms(candidate["tech_stack"], candidate["position"], candidate["location"],
+                                candidate["experience"], candidate["completed"])
+        index.add(candidate["session_id"], terms)
+        terms_of[candidate["session_id"]] = set(terms)
+    # Re-saved sessions (more answers, a completed screening) retire their old ids
+    rnd = random.Random(args.seed + 1)
+    for candidate in rnd.sample(candidates, int(len(candidates) * args.updates)):
+        terms = candidate_terms(candidate["tech_stack"], candidate["position"], candidate["location"],
+                                candidate["experience"], True)
+        index.add(candidate["session_id"], terms)
+        terms_of[candidate["session_id"]] = set(terms)
+    build_seconds = time.perf_counter() - start
+    # The linear-scan reference holds millions of objects; keep collector passes out of the timings
+    gc.collect()
+    gc.freeze()
+
+    results = {"candidates": len(index), "build_seconds": round(build_seconds, 2), "queries": {}}
+    for query in QUERIES:
+        result = index.search(query, limit=50)
+        expected = linear_scan(terms_of, query)
+        if result.total != len(expected) or not set(result.session_ids) <= expected:
+            raise SystemExit(f"mismatch for {query!r}: {result.total} vs {len(expected)}")
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            index.search(query, limit=50)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        results["queries"][query] = {
+            "matches": result.total,
+            "p50_ms": round(timings[len(timings) // 2] * 1000, 3),
+            "p99_ms": round(timings[int(len(timings) * 0.99)] * 1000, 3),
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{results['candidates']} candidates indexed in {results['build_seconds']} s")
+    for query, stats in results["queries"].items():
+        print(f"{stats['p50_ms']:>8.3f} ms p50 {stats['p99_ms']:>8.3f} ms p99 {stats['matches']:>8} matches  {query}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Cold-start benchmark for TalentScout Hiring Assistant
+Times importing the screening core, building the question catalog (as the
+servers do before taking traffic) and answering a first turn in fresh
+interpreters, and fails when the median goes over a budget
+
+Usage:
+    python benchmarks/bench_startup.py                       # 15 cold starts, 300 ms budget
+    python benchmarks/bench_startup.py --budget-ms 250 --runs 30
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO = Path(__file__).resolve().parent.parent
+
+# Modules that importing the screening core must not load
+HEAVY_MODULES = ("numpy", "streamlit", "openai", "httpx", "http.server", "asyncio")
+
+# Runs in a fresh interpreter and prints one JSON line
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from assistant import HiringAssistant
+imported = time.perf_counter()
+heavy = [name for name in HEAVY if name in sys.modules]
+from config_artifact import current_catalog
+current_catalog()
+warmed = time.perf_counter()
+assistant = HiringAssistant()
+assistant.get_response("")
+replied = time.perf_counter()
+for turn in ["Jane Doe", "jane@example.com", "+1 555 010 1234", "5", "Backend Developer", "Berlin"]:
+    assistant.get_response(turn)
+profiled = time.perf_counter()
+assistant.get_response("Python, Django, AWS")
+asked = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "catalog_ms": (warmed - imported) * 1000,
+    "first_reply_ms": (replied - warmed) * 1000,
+    "first_question_ms": (asked - profiled) * 1000,
+    "heavy": heavy,
+}))
+"""
+
+
+def cold_start() -> Dict:
+    result = subprocess.run(
+        [sys.executable, "-c", f"HEAVY = {HEAVY_MODULES!r}\n{PROBE}"],
+        cwd=REPO, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def interpreter_ms() -> float:
+    """Bare interpreter start, for reference; not counted against the budget"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check cold-start time of the screening core")
+    parser.add_argument("--runs", type=int, default=15, help="fresh interpreters to start")
+    parser.add_argument("--budget-ms", type=float, default=300.0,
+                        help="allowed median import + catalog build + first reply")
+    parser.add_argument("--turn-budget-ms", type=float, default=20.0,
+                        help="allowed median for the tech-stack turn that picks the first question")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    runs: List[Dict] = [cold_start() for _ in range(args.runs)]
+    medians = {key: statistics.median(run[key] for run in runs)
+               for key in ("import_ms", "catalog_ms", "first_reply_ms", "first_question_ms")}
+    startup = medians["import_ms"] + medians["catalog_ms"] + medians["first_reply_ms"]
+    heavy = sorted({name for run in runs for name in run["heavy"]})
+    results = {
+        **{key: round(value, 2) for key, value in medians.items()},
+        "startup_ms": round(startup, 2),
+        "budget_ms": args.budget_ms,
+        "turn_budget_ms": args.turn_budget_ms,
+        "interpreter_ms": round(statistics.median(interpreter_ms() for _ in range(5)), 2),
+        "heavy_modules_on_import": heavy,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"interpreter start      {results['interpreter_ms']:>8.1f} ms (not counted)")
+        print(f"import assistant       {results['import_ms']:>8.1f} ms")
+        print(f"build catalog          {results['catalog_ms']:>8.1f} ms (matcher, index, scorer, item bank)")
+        print(f"first reply            {results['first_reply_ms']:>8.2f} ms")
+        print(f"startup (median)       {results['startup_ms']:>8.1f} ms, budget {args.budget_ms:.0f} ms")
+        print(f"first question turn    {results['first_question_ms']:>8.2f} ms, budget {args.turn_budget_ms:.0f} ms")
+        if heavy:
+            print(f"loaded by importing assistant: {', '.join(heavy)}")
+
+    failures = []
+    if startup > args.budget_ms:
+        failures.append(f"startup {startup:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+    if medians["first_question_ms"] > args.turn_budget_ms:
+        failures.append(f"first question turn {medians['first_question_ms']:.1f} ms is over the "
+                        f"{args.turn_budget_ms:.0f} ms budget")
+    if heavy:
+        failures.append(f"{', '.join(heavy)} loaded by importing assistant")
+    for line in failures:
+        print(f"OVER BUDGET {line}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
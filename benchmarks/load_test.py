@@ -0,0 +1,251 @@
+"""
+Concurrent-candidate load test for TalentScout Hiring Assistant
+Simulates N virtual candidates driving the real hiring_assistant.py script
+through a local Streamlit stand-in, on one machine with no network
+
+Usage:
+    python benchmarks/load_test.py --candidates 200 --duration 60 --think-mean 2
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from collections import Counter
+from typing import Dict, Iterator, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from streamlit_standin import BrowserSession, ScriptRunner, SessionState, StreamlitStandIn  # noqa: E402
+
+FIRST_NAMES = ["Jane", "Ravi", "Chen", "Amara", "Lukas", "Sofia", "Kenji", "Olu", "Maria", "Noah"]
+POSITIONS = ["Backend Developer", "Frontend Engineer", "Full Stack Developer", "Data Scientist",
+             "DevOps Engineer", "Mobile Developer", "Software Engineer"]
+LOCATIONS = ["Berlin, Germany", "Austin, TX", "Bangalore, India", "Toronto, Canada", "Lagos, Nigeria"]
+TECH = ["Python", "Django", "Flask", "React", "Angular", "Node.js", "Java", "Spring Boot", "AWS",
+        "Docker", "Kubernetes", "PostgreSQL", "MongoDB", "Redis", "Pandas", "NumPy", "TensorFlow"]
+ANSWER_WORDS = ("the cache index request thread memory process database query latency scale "
+                "deploy container test module object function state event error").split()
+
+
+def candidate_turns(rng: random.Random, n: int) -> Iterator[str]:
+    """Answers one candidate types, including mistakes that trigger re-prompts"""
+    name = f"{rng.choice(FIRST_NAMES)} Tester{n}"
+    yield name
+    if rng.random() < 0.2:
+        yield name.split()[0].lower() + "@example"          # invalid email
+    yield f"{name.split()[0].lower()}.{n}@example.com"
+    if rng.random() < 0.2:
+        yield "12345"                                        # invalid phone
+    yield f"+1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+    yield str(rng.randint(0, 15))
+    yield rng.choice(POSITIONS)
+    if rng.random() < 0.05:
+        yield "bye"                                          # abandons mid-way
+        return
+    yield rng.choice(LOCATIONS)
+    if rng.random() < 0.1:
+        yield "lots of things really"                        # no recognizable tech
+    yield ", ".join(rng.sample(TECH, rng.randint(1, 5)))
+    while True:
+        yield " ".join(rng.choice(ANSWER_WORDS) for _ in range(rng.randint(8, 60)))
+
+
+class Metrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.bytes_per_turn: List[int] = []
+        self.errors: Counter = Counter()
+        self.completed = 0
+        self.abandoned = 0
+
+    def record(self, latency: float, bytes_sent: int) -> None:
+        with self.lock:
+            self.latencies.append(latency)
+            self.bytes_per_turn.append(bytes_sent)
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def virtual_candidate(runner: ScriptRunner, metrics: Metrics, seed: int, deadline: float,
+                      think_mean: float, stop: threading.Event, hop_rate: float = 0.0) -> None:
+    rng = random.Random(seed)
+    n = seed * 1000
+
+    def think() -> bool:
+        return not stop.wait(rng.expovariate(1 / think_mean) if think_mean > 0 else 0)
+
+    def interact(chat_input: Optional[str] = None, click: Optional[str] = None) -> None:
+        if hop_rate and rng.random() < hop_rate:
+            # Routed to another replica: only the URL (and the shared store) carry over,
+            # and that replica runs the whole script rather than a fragment
+            session.state = SessionState()
+            session.fragment = None
+        before = session.bytes_sent
+        start = time.perf_counter()
+        try:
+            runner.run(session, chat_input=chat_input, click=click)
+        except Exception as exc:
+            with metrics.lock:
+                metrics.errors[f"{type(exc).__name__}: {exc}"] += 1
+            raise
+        metrics.record(time.perf_counter() - start, session.bytes_sent - before)
+
+    while time.time() < deadline and not stop.is_set():
+        n += 1
+        session = BrowserSession()
+        try:
+            interact()                                   # page load
+            if not think():
+                return
+            interact(click="Start Screening")
+            for turn in candidate_turns(rng, n):
+                if not think() or time.time() >= deadline:
+                    return
+                interact(chat_input=turn)
+                assistant = session.state.assistant
+                if assistant.conversation_ended or assistant.get_current_stage() == "conclusion":
+                    with metrics.lock:
+                        if assistant.conversation_ended:
+                            metrics.abandoned += 1
+                        else:
+                            metrics.completed += 1
+                    break
+        except Exception:
+            # Counted in interact(); wait, then start over with a fresh tab
+            if not think():
+                return
+
+
+def percentile(values: List[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[pct - 1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test the hiring assistant with virtual candidates")
+    parser.add_argument("--candidates", type=int, default=100, help="concurrent virtual candidates")
+    parser.add_argument("--duration", type=float, default=30.0, help="test length in seconds")
+    parser.add_argument("--think-mean", type=float, default=2.0, help="mean think time between turns (s)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which candidates arrive")
+    parser.add_argument("--sample-interval", type=float, default=5.0, help="memory sampling period (s)")
+    parser.add_argument("--question-backend", choices=["templates", "local"], default="templates")
+    parser.add_argument("--session-store", choices=["process", "sqlite", "redis"], default="process",
+                        help="where sessions live; redis starts a local stand-in")
+    parser.add_argument("--hop-rate", type=float, default=0.0,
+                        help="chance a turn lands on a different replica (needs a shared store or --event-log)")
+    parser.add_argument("--event-log", action="store_true",
+                        help="log every turn; with the process store, hops are rebuilt from the log")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="talentscout-load-")
+    os.environ["TALENTSCOUT_DB"] = os.path.join(workdir, "load.db")
+    if args.question_backend == "local":
+        os.environ["TALENTSCOUT_QUESTION_BACKEND"] = "local"
+    if args.session_store == "sqlite":
+        os.environ["TALENTSCOUT_SESSION_STORE"] = os.path.join(workdir, "sessions.db")
+    elif args.session_store == "redis":
+        from redis_standin import start_in_thread
+        _, redis_port = start_in_thread()
+        os.environ["TALENTSCOUT_SESSION_STORE"] = f"redis://127.0.0.1:{redis_port}"
+    elif args.hop_rate and not args.event_log:
+        parser.error("--hop-rate needs --session-store sqlite or redis, or --event-log")
+    if args.event_log:
+        os.environ["TALENTSCOUT_EVENT_LOG"] = os.path.join(workdir, "events")
+
+    standin = StreamlitStandIn()
+    standin.install()
+    runner = ScriptRunner(standin, ROOT / "hiring_assistant.py")
+    metrics = Metrics()
+    stop = threading.Event()
+
+    start = time.time()
+    deadline = start + args.duration
+    threads = []
+    for i in range(args.candidates):
+        thread = threading.Thread(
+            target=virtual_candidate,
+            args=(runner, metrics, args.seed * 100003 + i, deadline, args.think_mean, stop, args.hop_rate),
+            daemon=True,
+        )
+        threads.append(thread)
+
+    memory_samples: List[Dict[str, float]] = [{"t": 0.0, "rss_mb": rss_bytes() / 2**20, "turns": 0}]
+    for thread in threads:
+        # Spread arrivals over the ramp period
+        stop.wait(args.ramp / max(args.candidates, 1) if args.ramp else 0)
+        thread.start()
+
+    next_sample = time.time() + args.sample_interval
+    while time.time() < deadline:
+        time.sleep(min(0.2, max(deadline - time.time(), 0)))
+        if time.time() >= next_sample:
+            with metrics.lock:
+                turns = len(metrics.latencies)
+            memory_samples.append({"t": time.time() - start, "rss_mb": rss_bytes() / 2**20, "turns": turns})
+            next_sample += args.sample_interval
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    elapsed = time.time() - start
+
+    latencies_ms = [latency * 1000 for latency in metrics.latencies]
+    report = {
+        "candidates": args.candidates,
+        "duration_s": round(elapsed, 1),
+        "turns": len(latencies_ms),
+        "throughput_turns_per_s": len(latencies_ms) / elapsed,
+        "latency_ms": {
+            "p50": percentile(latencies_ms, 50),
+            "p95": percentile(latencies_ms, 95),
+            "p99": percentile(latencies_ms, 99),
+            "max": max(latencies_ms, default=0.0),
+        },
+        "bytes_per_turn": {
+            "p50": percentile(metrics.bytes_per_turn, 50),
+            "max": max(metrics.bytes_per_turn, default=0),
+        },
+        "screenings_completed": metrics.completed,
+        "screenings_abandoned": metrics.abandoned,
+        "errors": dict(metrics.errors),
+        "memory": memory_samples,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{args.candidates} candidates, {report['duration_s']}s, think mean {args.think_mean}s")
+    print(f"turns: {report['turns']}  throughput: {report['throughput_turns_per_s']:.1f} turns/s  errors: {sum(metrics.errors.values())}")
+    print("turn latency ms: p50 {p50:.2f}  p95 {p95:.2f}  p99 {p99:.2f}  max {max:.2f}".format(**report["latency_ms"]))
+    print(f"bytes rendered per turn: p50 {report['bytes_per_turn']['p50']:.0f}  max {report['bytes_per_turn']['max']}")
+    print(f"screenings completed: {metrics.completed}  abandoned: {metrics.abandoned}")
+    for message, count in metrics.errors.most_common(5):
+        print(f"  {count} x {message}")
+    print(f"{'t (s)':>8}{'rss MB':>10}{'turns':>10}")
+    for sample in memory_samples:
+        print(f"{sample['t']:>8.1f}{sample['rss_mb']:>10.1f}{sample['turns']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Minimal in-process Redis stand-in for TalentScout Hiring Assistant
+Speaks enough RESP for RedisSessionStore (strings with expiry), so shared
+session storage can be exercised on one machine without a Redis server
+
+Usage:
+    python benchmarks/redis_standin.py --port 6379
+    TALENTSCOUT_SESSION_STORE=redis://127.0.0.1:6379 streamlit run hiring_assistant.py
+"""
+
+import argparse
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _glob(pattern: bytes) -> "re.Pattern[bytes]":
+    """Redis glob pattern (* ? [...], backslash escapes) as a regex; fnmatch has no escapes"""
+    out, i = [], 0
+    while i < len(pattern):
+        c = pattern[i:i + 1]
+        end = pattern.find(b"]", i + 2) if c == b"[" else -1
+        if c == b"\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1:i + 2]))
+            i += 2
+            continue
+        if c == b"*":
+            out.append(b".*")
+        elif c == b"?":
+            out.append(b".")
+        elif end != -1:
+            body = pattern[i + 1:end]
+            negate = body.startswith(b"^")
+            chars = [body[j:j + 1] for j in range(1 if negate else 0, len(body))]
+            out.append(b"[" + (b"^" if negate else b"")
+                       + b"".join(ch if ch == b"-" else re.escape(ch) for ch in chars) + b"]")
+            i = end + 1
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile(b"".join(out) + b"\\Z", re.DOTALL)
+
+
+class RedisStandIn:
+    """Keyspace plus command handlers; GET/SET/GETEX/DEL/EXPIRE/TTL/EXISTS/SCAN/DBSIZE/FLUSHALL/PING"""
+
+    def __init__(self):
+        # key -> (value, absolute expiry or None)
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.commands = 0
+
+    def _live(self, key: bytes) -> Optional[Tuple[bytes, Optional[float]]]:
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.time():
+            del self.data[key]
+            return None
+        return entry
+
+    def sweep(self) -> int:
+        now = time.time()
+        expired = [key for key, (_, expires_at) in self.data.items() if expires_at is not None and expires_at <= now]
+        for key in expired:
+            del self.data[key]
+        return len(expired)
+
+    @staticmethod
+    def _expiry(options: List[bytes]) -> Optional[float]:
+        for i in range(0, len(options) - 1):
+            name = options[i].upper()
+            if name == b"EX":
+                return time.time() + int(options[i + 1])
+            if name == b"PX":
+                return time.time() + int(options[i + 1]) / 1000
+        return None
+
+    def execute(self, args: List[bytes]) -> Any:
+        self.commands += 1
+        name = args[0].upper()
+        if name == b"PING":
+            return "PONG"
+        if name in (b"SELECT", b"AUTH"):
+            return "OK"
+        if name == b"GET":
+            entry = self._live(args[1])
+            return entry[0] if entry else None
+        if name == b"GETEX":
+            entry = self._live(args[1])
+            if entry is None:
+                return None
+            expires_at = self._expiry(args[2:])
+            if expires_at is not None:
+                self.data[args[1]] = (entry[0], expires_at)
+            return entry[0]
+        if name == b"SET":
+            self.data[args[1]] = (args[2], self._expiry(args[3:]))
+            return "OK"
+        if name == b"DEL":
+            return sum(self.data.pop(key, None) is not None for key in args[1:])
+        if name == b"EXISTS":
+            return sum(self._live(key) is not None for key in args[1:])
+        if name in (b"EXPIRE", b"PEXPIRE"):
+            entry = self._live(args[1])
+            if entry is None:
+                return 0
+            seconds = int(args[2]) / (1000 if name == b"PEXPIRE" else 1)
+            self.data[args[1]] = (entry[0], time.time() + seconds)
+            return 1
+        if name == b"TTL":
+            entry = self._live(args[1])
+            if entry is None:
+                return -2
+            return -1 if entry[1] is None else int(entry[1] - time.time())
+        if name == b"SCAN":
+            # The whole keyspace in one page, so the cursor is always 0
+            options = {args[i].upper(): args[i + 1] for i in range(2, len(args) - 1, 2)}
+            pattern = options.get(b"MATCH", b"*")
+            self.sweep()
+            matcher = _glob(pattern)
+            return [b"0", [key for key in self.data if matcher.match(key)]]
+        if name == b"DBSIZE":
+            self.sweep()
+            return len(self.data)
+        if name == b"FLUSHALL":
+            self.data.clear()
+            return "OK"
+        return Exception(f"ERR unknown command '{args[0].decode(errors='replace')}'")
+
+
+def _encode(value: Any) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, Exception):
+        return f"-{value}\r\n".encode()
+    if isinstance(value, str):
+        return f"+{value}\r\n".encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode(item) for item in value)
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+async def _read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # Inline command, as typed into telnet
+        return line.split()
+    args = []
+    for _ in range(int(line[1:-2])):
+        header = await reader.readline()
+        length = int(header[1:-2])
+        args.append((await reader.readexactly(length + 2))[:-2])
+    return args
+
+
+async def _handle(standin: RedisStandIn, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            args = await _read_command(reader)
+            if args is None:
+                break
+            if not args:
+                continue
+            if args[0].upper() == b"QUIT":
+                writer.write(_encode("OK"))
+                break
+            writer.write(_encode(standin.execute(args)))
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 6379, standin: Optional[RedisStandIn] = None,
+                ready: Optional[threading.Event] = None, bound: Optional[list] = None) -> None:
+    standin = standin or RedisStandIn()
+    server = await asyncio.start_server(lambda r, w: _handle(standin, r, w), host, port)
+    if bound is not None:
+        bound.append(server.sockets[0].getsockname()[1])
+    if ready is not None:
+        ready.set()
+
+    async def sweeper():
+        while True:
+            await asyncio.sleep(1.0)
+            standin.sweep()
+
+    sweep_task = asyncio.ensure_future(sweeper())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        sweep_task.cancel()
+
+
+def start_in_thread(host: str = "127.0.0.1", port: int = 0) -> Tuple[RedisStandIn, int]:
+    """Run a stand-in on a daemon thread; port 0 picks a free port. Returns (stand-in, port)"""
+    standin = RedisStandIn()
+    ready, bound = threading.Event(), []
+    thread = threading.Thread(
+        target=lambda: asyncio.run(serve(host, port, standin, ready, bound)), name="redis-standin", daemon=True
+    )
+    thread.start()
+    ready.wait(5)
+    return standin, bound[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a minimal Redis-protocol server for local testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Per-session memory benchmark for TalentScout Hiring Assistant
+Reports the bytes retained by each active HiringAssistant session
+
+Usage:
+    python benchmarks/session_memory.py --sessions 5000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from assistant import HiringAssistant  # noqa: E402
+from config_artifact import current_catalog  # noqa: E402
+
+# Turns that take a session through each phase of the screening
+PHASES = {
+    "greeted": [""],
+    "profiled": [
+        "",
+        "Candidate {n}",
+        "candidate{n}@example.com",
+        "+1 555 010 {n:04d}",
+        "4",
+        "Software Engineer",
+        "Berlin, Germany",
+    ],
+    "questioning": [
+        "",
+        "Candidate {n}",
+        "candidate{n}@example.com",
+        "+1 555 010 {n:04d}",
+        "4",
+        "Software Engineer",
+        "Berlin, Germany",
+        "Python, Django, AWS, Docker",
+        "Tuples are immutable while lists can be changed in place.",
+    ],
+}
+
+
+def build_sessions(turns: List[str], count: int) -> List[HiringAssistant]:
+    sessions = []
+    for n in range(count):
+        assistant = HiringAssistant()
+        for turn in turns:
+            assistant.get_response(turn.format(n=n % 10000))
+        sessions.append(assistant)
+    return sessions
+
+
+def measure_phase(turns: List[str], count: int) -> Dict[str, float]:
+    """Return the bytes retained per session after replaying turns"""
+    # The catalog is shared by every session and built on first use; build it
+    # before tracing so it is not counted as per-session memory
+    current_catalog()
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    sessions = build_sessions(turns, count)
+    gc.collect()
+    retained = sum(
+        stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename")
+    )
+    tracemalloc.stop()
+
+    snapshot_bytes = sum(len(session.snapshot()) for session in sessions) / count
+    del sessions
+    return {
+        "bytes_per_session": retained / count,
+        "snapshot_bytes": snapshot_bytes,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure bytes retained per active screening session")
+    parser.add_argument("--sessions", type=int, default=5000, help="number of concurrent sessions to simulate")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = {phase: measure_phase(turns, args.sessions) for phase, turns in PHASES.items()}
+
+    if args.json:
+        print(json.dumps({"sessions": args.sessions, "phases": results}, indent=2))
+        return 0
+
+    print(f"{args.sessions} sessions")
+    print(f"{'phase':<14}{'bytes/session':>16}{'snapshot bytes':>16}")
+    for phase, result in results.items():
+        print(f"{phase:<14}{result['bytes_per_session']:>16.0f}{result['snapshot_bytes']:>16.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
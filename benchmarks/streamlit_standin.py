@@ -0,0 +1,252 @@
+"""
+Minimal in-process stand-in for Streamlit, for load tests and benchmarks
+Runs the real hiring_assistant.py script with per-session state, the
+rerun cycle and fragment reruns, without a server, browser or network
+
+Only the parts of the Streamlit API that hiring_assistant.py uses exist.
+Everything rendered is counted (elements and bytes) but not displayed.
+"""
+
+import sys
+import threading
+import types
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class RerunRequested(Exception):
+    """Raised by st.rerun() to stop the current script run"""
+
+
+class SessionState(dict):
+    """dict with attribute access, like st.session_state"""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        del self[name]
+
+
+class BrowserSession:
+    """One browser tab: its session state and URL query parameters, plus the widget events of the next run"""
+
+    def __init__(self):
+        self.state = SessionState()
+        self.query_params: Dict[str, str] = {}
+        self.chat_input: Optional[str] = None
+        self.click: Optional[str] = None
+        # Fragment drawn on the last script run, as (function, args, kwargs)
+        self.fragment = None
+        self.in_fragment = False
+        self.elements = 0
+        self.bytes_sent = 0
+        self.reruns = 0
+
+
+class _Placeholder:
+    def __init__(self, standin: "StreamlitStandIn"):
+        self._standin = standin
+
+    def markdown(self, body: str, unsafe_allow_html: bool = False) -> None:
+        self._standin._emit(body)
+
+    @contextmanager
+    def container(self):
+        yield self
+
+
+class _Container(_Placeholder):
+    """st.container(); elements written inside it are counted like any other"""
+
+    def __enter__(self) -> "_Container":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+class _SessionStateProxy:
+    """Module-level st.session_state (or st.query_params) that resolves to the running session"""
+
+    def __init__(self, standin: "StreamlitStandIn", field: str = "state"):
+        object.__setattr__(self, "_standin", standin)
+        object.__setattr__(self, "_field", field)
+
+    def _state(self) -> SessionState:
+        session = object.__getattribute__(self, "_standin").current()
+        return getattr(session, object.__getattribute__(self, "_field"))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._state(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._state(), name, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._state()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._state()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._state()[key] = value
+
+
+class StreamlitStandIn:
+    def __init__(self):
+        self._local = threading.local()
+        self._resources: Dict[Any, Any] = {}
+        self._resource_lock = threading.RLock()  # cached resources may use each other
+        self.module = self._build_module()
+
+    def install(self) -> None:
+        """Make `import streamlit` resolve to this stand-in"""
+        sys.modules["streamlit"] = self.module
+
+    def current(self) -> BrowserSession:
+        return self._local.session
+
+    def _emit(self, body: Any = "") -> None:
+        session = self.current()
+        session.elements += 1
+        session.bytes_sent += len(str(body))
+
+    def _build_module(self) -> types.ModuleType:
+        st = types.ModuleType("streamlit")
+        standin = self
+
+        def emit(body: Any = "", *args, **kwargs) -> None:
+            standin._emit(body)
+
+        def button(label: str, *args, **kwargs) -> bool:
+            standin._emit(label)
+            session = standin.current()
+            if session.click and session.click in label:
+                session.click = None
+                return True
+            return False
+
+        def chat_input(placeholder: str = "", *args, **kwargs) -> Optional[str]:
+            standin._emit(placeholder)
+            session = standin.current()
+            value, session.chat_input = session.chat_input, None
+            return value
+
+        def rerun(*args, **kwargs) -> None:
+            raise RerunRequested()
+
+        def empty() -> _Placeholder:
+            standin._emit()
+            return _Placeholder(standin)
+
+        def container() -> _Container:
+            standin._emit()
+            return _Container(standin)
+
+        def fragment(func=None, **kwargs):
+            def decorate(fn):
+                def wrapper(*args, **kw):
+                    # Remembered so that the next chat message reruns only this
+                    session = standin.current()
+                    session.fragment = (fn, args, kw)
+                    session.in_fragment = True
+                    try:
+                        return fn(*args, **kw)
+                    finally:
+                        session.in_fragment = False
+                return wrapper
+            return decorate(func) if func is not None else decorate
+
+        @contextmanager
+        def spinner(text: str = ""):
+            yield
+
+        def cache_resource(func=None, **kwargs):
+            def decorate(fn):
+                # The script is compiled once, so the code object identifies
+                # the function across reruns and sessions
+                def wrapper(*args):
+                    key = (fn.__code__, args)
+                    with standin._resource_lock:
+                        if key not in standin._resources:
+                            standin._resources[key] = fn(*args)
+                        return standin._resources[key]
+                return wrapper
+            return decorate(func) if func is not None else decorate
+
+        class _Sidebar:
+            __enter__ = lambda self: None
+            __exit__ = lambda self, *exc: False
+
+        st.set_page_config = lambda *args, **kwargs: None
+        st.markdown = emit
+        st.write = emit
+        st.header = emit
+        st.success = emit
+        st.progress = emit
+        st.button = button
+        st.chat_input = chat_input
+        st.rerun = rerun
+        st.empty = empty
+        st.container = container
+        st.fragment = fragment
+        st.spinner = spinner
+        st.cache_resource = cache_resource
+        st.sidebar = _Sidebar()
+        st.session_state = _SessionStateProxy(standin)
+        st.query_params = _SessionStateProxy(standin, "query_params")
+        return st
+
+
+class ScriptRunner:
+    """Executes a Streamlit script for a session the way the server would"""
+
+    MAX_RERUNS = 10
+
+    def __init__(self, standin: StreamlitStandIn, script_path: Path):
+        self.standin = standin
+        self.script_path = str(script_path)
+        self.code = compile(Path(script_path).read_text(encoding="utf-8"), self.script_path, "exec")
+
+    def run(self, session: BrowserSession, chat_input: Optional[str] = None,
+            click: Optional[str] = None) -> None:
+        """One user interaction: a script run plus any st.rerun() it triggers
+
+        A chat message to an input drawn in a fragment reruns only that
+        fragment, as Streamlit does; st.rerun() from it reruns the script.
+        """
+        session.chat_input = chat_input
+        session.click = click
+        self.standin._local.session = session
+        try:
+            if chat_input is not None and click is None and session.fragment is not None:
+                fn, args, kwargs = session.fragment
+                session.in_fragment = True
+                try:
+                    fn(*args, **kwargs)
+                    return
+                except RerunRequested:
+                    session.reruns += 1
+                    session.chat_input = None
+                finally:
+                    session.in_fragment = False
+            for _ in range(self.MAX_RERUNS):
+                session.fragment = None
+                try:
+                    exec(self.code, {"__name__": "__main__", "__file__": self.script_path})
+                    return
+                except RerunRequested:
+                    session.reruns += 1
+                    session.chat_input = None
+                    session.click = None
+            raise RuntimeError("script kept requesting reruns")
+        finally:
+            self.standin._local.session = None
@@ -0,0 +1,386 @@
+"""
+Streaming export of screened candidates for TalentScout Hiring Assistant
+Reads the candidate store in keyset-paginated chunks and writes JSONL, CSV or
+Parquet with constant memory; a cursor file makes interrupted exports resumable
+
+Usage:
+    python candidate_export.py --db talentscout.db --format jsonl -o today.jsonl --since 2026-10-18
+    python candidate_export.py --format csv -o ats.csv --cursor-file ats.cursor      # rerun to resume/sync
+    python candidate_export.py --format parquet -o warehouse/ --cursor-file warehouse.cursor
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from assistant import question_text
+from candidate_store import connect, ensure_schema
+from config_artifact import current_catalog
+
+FORMATS = ("jsonl", "csv", "parquet")
+
+CSV_COLUMNS = [
+    "session_id", "full_name", "email", "phone", "experience_years", "desired_position",
+    "location", "tech_stack", "stage", "completed", "created_at", "updated_at",
+    "answer_count", "average_score", "answers",
+]
+
+# (updated_at, session_id) of the last exported candidate
+Cursor = Tuple[float, str]
+
+
+def _timestamp(value: float) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _question(question_id: str, stored: str) -> Optional[str]:
+    if stored:
+        return stored
+    try:
+        # Rows written before the store kept question text
+        return question_text(question_id)
+    except KeyError:
+        return None
+
+
+def iter_chunks(conn, cursor: Optional[Cursor] = None, until: Optional[float] = None,
+                completed_only: bool = False, chunk_size: int = 1000) -> Iterator[Tuple[List[Dict], Cursor]]:
+    """Yield (records, cursor after the chunk) in (updated_at, session_id) order
+
+    Each chunk is read in its own transaction, so its candidates, tech stacks
+    and answers are consistent with each other while the app keeps writing.
+    """
+    after = cursor or (float("-inf"), "")
+    filters, params = "", []
+    if until is not None:
+        filters += " AND updated_at < ?"
+        params.append(until)
+    if completed_only:
+        filters += " AND completed = 1"
+
+    while True:
+        conn.execute("BEGIN")
+        try:
+            rows = conn.execute(
+                f"SELECT * FROM candidates WHERE (updated_at, session_id) > (?, ?){filters}"
+                " ORDER BY updated_at, session_id LIMIT ?",
+                (*after, *params, chunk_size),
+            ).fetchall()
+            if not rows:
+                return
+            ids = [row["session_id"] for row in rows]
+            marks = ",".join("?" * len(ids))
+            tech: Dict[str, List[str]] = {}
+            for row in conn.execute(
+                f"SELECT session_id, tech FROM candidate_tech WHERE session_id IN ({marks}) ORDER BY session_id, position",
+                ids,
+            ):
+                tech.setdefault(row["session_id"], []).append(row["tech"])
+            answers: Dict[str, List[Tuple[str, str, str]]] = {}
+            for row in conn.execute(
+                f"SELECT session_id, question_id, question, answer FROM answers WHERE session_id IN ({marks})"
+                " ORDER BY session_id, position",
+                ids,
+            ):
+                answers.setdefault(row["session_id"], []).append((row["question_id"], row["question"], row["answer"]))
+        finally:
+            conn.execute("COMMIT")
+
+        # One scoring batch per chunk
+        flat = [(session_id, qid, answer) for session_id in ids for qid, _, answer in answers.get(session_id, ())]
+        scores = iter(current_catalog().answer_scorer.score([qid for _, qid, _ in flat], [answer for _, _, answer in flat]).tolist())
+
+        records = []
+        for row in rows:
+            session_answers = [
+                {"question_id": qid, "question": _question(qid, question), "answer": answer,
+                 "score": _score(next(scores))}
+                for qid, question, answer in answers.get(row["session_id"], ())
+            ]
+            records.append({
+                "session_id": row["session_id"],
+                "full_name": row["full_name"],
+                "email": row["email"],
+                "phone": row["phone"],
+                "experience_years": row["experience_years"],
+                "desired_position": row["desired_position"],
+                "location": row["location"],
+                "tech_stack": tech.get(row["session_id"], []),
+                "stage": row["stage"],
+                "completed": bool(row["completed"]),
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+                "answers": session_answers,
+            })
+        after = (rows[-1]["updated_at"], rows[-1]["session_id"])
+        yield records, after
+        if len(rows) < chunk_size:
+            return
+
+
+def _score(value: float) -> Optional[float]:
+    return None if value != value else round(value, 4)
+
+
+def _average(answers: List[Dict]) -> Optional[float]:
+    scores = [answer["score"] for answer in answers if answer["score"] is not None]
+    return round(sum(scores) / len(scores), 4) if scores else None
+
+
+class JsonlWriter:
+    """One JSON object per candidate; timestamps as ISO 8601 UTC"""
+
+    def __init__(self, stream: io.TextIOBase):
+        self.stream = stream
+
+    def write(self, records: List[Dict]) -> None:
+        lines = []
+        for record in records:
+            record = dict(record, created_at=_timestamp(record["created_at"]),
+                          updated_at=_timestamp(record["updated_at"]),
+                          average_score=_average(record["answers"]))
+            lines.append(json.dumps(record, ensure_ascii=False))
+        self.stream.write("\n".join(lines) + "\n")
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class CsvWriter:
+    """One row per candidate for ATS imports; answers are a JSON array cell
+
+    append continues a file that already has its header row.
+    """
+
+    def __init__(self, stream: io.TextIOBase, append: bool = False):
+        self.stream = stream
+        self._writer = csv.writer(stream)
+        if not append:
+            self._writer.writerow(CSV_COLUMNS)
+
+    def write(self, records: List[Dict]) -> None:
+        self._writer.writerows(
+            [
+                record["session_id"], record["full_name"], record["email"], record["phone"],
+                record["experience_years"], record["desired_position"], record["location"],
+                "; ".join(record["tech_stack"]), record["stage"], int(record["completed"]),
+                _timestamp(record["created_at"]), _timestamp(record["updated_at"]),
+                len(record["answers"]), _average(record["answers"]),
+                json.dumps(record["answers"], ensure_ascii=False),
+            ]
+            for record in records
+        )
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class ParquetWriter:
+    """Columnar part files in a directory, one row group per chunk
+
+    A part is only renamed into place when it is complete, after which the
+    cursor can move past it; rows_per_file bounds how much a crash can redo.
+    """
+
+    def __init__(self, directory: str, part: int = 0, rows_per_file: int = 1_000_000):
+        # Imported here so JSONL/CSV exports do not need pyarrow installed
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._pq = pq
+        self.directory = directory
+        self.part = part
+        self.rows_per_file = rows_per_file
+        self.schema = pa.schema([
+            ("session_id", pa.string()),
+            ("full_name", pa.string()),
+            ("email", pa.string()),
+            ("phone", pa.string()),
+            ("experience_years", pa.string()),
+            ("desired_position", pa.string()),
+            ("location", pa.string()),
+            ("tech_stack", pa.list_(pa.string())),
+            ("stage", pa.string()),
+            ("completed", pa.bool_()),
+            ("created_at", pa.timestamp("ms", tz="UTC")),
+            ("updated_at", pa.timestamp("ms", tz="UTC")),
+            ("average_score", pa.float32()),
+            ("answers", pa.list_(pa.struct([
+                ("question_id", pa.string()),
+                ("question", pa.string()),
+                ("answer", pa.string()),
+                ("score", pa.float32()),
+            ]))),
+        ])
+        os.makedirs(directory, exist_ok=True)
+        self._writer = None
+        self._rows = 0
+
+    def _path(self, part: int) -> str:
+        return os.path.join(self.directory, f"candidates-{part:05d}.parquet")
+
+    def write(self, records: List[Dict]) -> None:
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path(self.part) + ".tmp", self.schema, compression="zstd")
+        columns = {name: [] for name in self.schema.names}
+        for record in records:
+            for name in self.schema.names:
+                if name in ("created_at", "updated_at"):
+                    columns[name].append(int(record[name] * 1000))
+                elif name == "average_score":
+                    columns[name].append(_average(record["answers"]))
+                else:
+                    columns[name].append(record[name])
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self.schema))
+        self._rows += len(records)
+
+    def file_complete(self) -> bool:
+        """Close the current part once it is full; True when a part was finished"""
+        if self._writer is None or self._rows < self.rows_per_file:
+            return False
+        self._finish_part()
+        return True
+
+    def _finish_part(self) -> None:
+        self._writer.close()
+        os.replace(self._path(self.part) + ".tmp", self._path(self.part))
+        self._writer = None
+        self._rows = 0
+        self.part += 1
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._finish_part()
+
+
+def _load_state(path: Optional[str]) -> Dict:
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def _save_state(path: str, state: Dict) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def export(db: str, fmt: str, output: str, cursor_file: Optional[str] = None,
+           since: Optional[float] = None, until: Optional[float] = None,
+           completed_only: bool = False, chunk_size: int = 1000,
+           rows_per_file: int = 1_000_000) -> int:
+    """Export candidates updated in [since, until); returns how many were written
+
+    With a cursor file, progress is checkpointed after every chunk (every part
+    file for Parquet). Running the same command again resumes after the last
+    checkpoint, and once finished it picks up candidates added or updated since.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    if fmt == "parquet" and output == "-":
+        raise ValueError("parquet output must be a directory")
+
+    state = _load_state(cursor_file)
+    if state and (state.get("format"), state.get("output")) != (fmt, output):
+        raise ValueError(f"cursor file {cursor_file} belongs to a {state.get('format')} export to {state.get('output')}")
+    cursor: Optional[Cursor] = tuple(state["cursor"]) if state.get("cursor") else None
+    if cursor is None and since is not None:
+        cursor = (since, "")
+
+    conn = connect(db)
+    conn.isolation_level = None  # transactions are managed per chunk
+    ensure_schema(conn)
+
+    stream = None
+    if fmt == "parquet":
+        writer = ParquetWriter(output, state.get("part", 0), rows_per_file)
+    elif output == "-":
+        stream = sys.stdout
+        writer = JsonlWriter(stream) if fmt == "jsonl" else CsvWriter(stream)
+    else:
+        # Drop anything written after the last checkpoint, then append
+        offset = state.get("offset", 0)
+        stream = open(output, "r+" if offset else "w", encoding="utf-8", newline="")
+        if offset:
+            stream.seek(offset)
+            stream.truncate()
+        writer = JsonlWriter(stream) if fmt == "jsonl" else CsvWriter(stream, append=bool(offset))
+
+    written = 0
+    checkpoint_rows = state.get("rows", 0)
+    try:
+        for records, after in iter_chunks(conn, cursor, until, completed_only, chunk_size):
+            writer.write(records)
+            written += len(records)
+            part_done = fmt == "parquet" and writer.file_complete()
+            if cursor_file is None:
+                continue
+            if fmt == "parquet":
+                if not part_done:
+                    continue
+                checkpoint = {"part": writer.part}
+            else:
+                stream.flush()
+                os.fsync(stream.fileno())
+                checkpoint = {"offset": stream.tell()}
+            _save_state(cursor_file, {
+                "format": fmt, "output": output, "cursor": list(after),
+                "rows": checkpoint_rows + written, **checkpoint,
+            })
+        writer.close()
+        if cursor_file is not None and written:
+            final = {"part": writer.part} if fmt == "parquet" else {"offset": stream.tell()}
+            _save_state(cursor_file, {
+                "format": fmt, "output": output, "cursor": list(after),
+                "rows": checkpoint_rows + written, **final,
+            })
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+        conn.close()
+    return written
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds, or an ISO date/datetime (UTC unless it has an offset)"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stream screened candidates to JSONL, CSV or Parquet")
+    parser.add_argument("--db", default=os.getenv("TALENTSCOUT_DB", "talentscout.db"), help="candidate store SQLite file")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("-o", "--output", default="-", help="output file ('-' for stdout), or directory for parquet")
+    parser.add_argument("--cursor-file", help="checkpoint file; rerun with it to resume or fetch new candidates")
+    parser.add_argument("--since", help="only candidates updated at/after this time (ISO date or epoch)")
+    parser.add_argument("--until", help="only candidates updated before this time")
+    parser.add_argument("--completed-only", action="store_true", help="skip unfinished screenings")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="candidates read and written per chunk")
+    parser.add_argument("--rows-per-file", type=int, default=1_000_000, help="rows per Parquet part file")
+    args = parser.parse_args()
+
+    written = export(args.db, args.format, args.output, args.cursor_file, _parse_time(args.since),
+                     _parse_time(args.until), args.completed_only, args.chunk_size, args.rows_per_file)
+    print(f"exported {written} candidates", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
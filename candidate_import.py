@@ -0,0 +1,228 @@
+"""
+Bulk candidate import for TalentScout Hiring Assistant
+Streams referral and job-fair lists (CSV or JSONL) in chunks, validates and
+normalizes them in batches and writes pre-filled CandidateInfo records, so
+screenings only ask for what is missing; bad rows go to a reject file
+
+Usage:
+    python candidate_import.py referrals.csv -o candidates.jsonl --rejects rejects.jsonl
+    python candidate_import.py job-fair.jsonl -o candidates.jsonl --chunk-size 5000
+"""
+
+import argparse
+import csv
+import json
+import sys
+from dataclasses import fields
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from assistant import CandidateInfo, validate_emails, validate_phones
+from config_artifact import current_catalog
+from duplicate_index import email_key, phone_digits
+
+FORMATS = ("csv", "jsonl")
+
+# Accepted column names for each CandidateInfo field, compared case-insensitively
+# with "_" and "-" read as spaces; "skills" is free text run through the tech matcher
+COLUMN_ALIASES = {
+    "full_name": ("full name", "name", "candidate", "candidate name"),
+    "email": ("email", "e mail", "email address", "mail"),
+    "phone": ("phone", "phone number", "mobile", "telephone", "tel"),
+    "experience_years": ("experience years", "experience", "years", "years of experience"),
+    "desired_position": ("desired position", "position", "role", "title", "job title"),
+    "location": ("location", "city"),
+    "skills": ("skills", "tech stack", "technologies", "tech"),
+}
+_FIELD_OF = {alias: name for name, aliases in COLUMN_ALIASES.items() for alias in aliases}
+_CANDIDATE_FIELDS = {f.name for f in fields(CandidateInfo)}
+
+# (line number in the input, raw record)
+Row = Tuple[int, Dict]
+
+
+@lru_cache(maxsize=1024)
+def _field_of(column: str) -> Optional[str]:
+    """CandidateInfo field (or "skills") an input column holds"""
+    return _FIELD_OF.get(" ".join(str(column).lower().replace("_", " ").replace("-", " ").split()))
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return " ".join(str(value).split())
+
+
+def normalize_email(email: str) -> str:
+    """Address with surrounding spaces removed and the domain lowercased"""
+    local, at, domain = email.strip().rpartition("@")
+    return f"{local}@{domain.lower()}" if at else email.strip()
+
+
+def normalize_phone(phone: str) -> str:
+    """Digits only, keeping a leading '+' for international numbers"""
+    digits = phone_digits(phone)
+    return "+" + digits if phone.lstrip().startswith("+") else digits
+
+
+def load_candidate_info(data: Dict) -> CandidateInfo:
+    """Build a CandidateInfo from a JSON object such as an import record; raises ValueError"""
+    unknown = set(data) - _CANDIDATE_FIELDS
+    if unknown:
+        raise ValueError(f"unknown candidate fields: {', '.join(sorted(unknown))}")
+    tech_stack = data.get("tech_stack") or []
+    if not isinstance(tech_stack, list) or not all(isinstance(tech, str) for tech in tech_stack):
+        raise ValueError("'tech_stack' must be a list of strings")
+    values = {name: value for name, value in data.items() if name != "tech_stack"}
+    if not all(isinstance(value, str) for value in values.values()):
+        raise ValueError("candidate fields must be strings")
+    return CandidateInfo(**values, tech_stack=list(tech_stack))
+
+
+def read_csv(source: TextIO) -> Iterator[Row]:
+    reader = csv.DictReader(source)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def read_jsonl(source: TextIO) -> Iterator[Row]:
+    for line_number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        # Not an object: passed on as a raw line for the reject file
+        yield line_number, record if isinstance(record, dict) else {"_raw": line.rstrip("\n")}
+
+
+def _chunked(rows: Iterable[Row], chunk_size: int) -> Iterator[List[Row]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class CandidateImporter:
+    """Validates and normalizes import rows a chunk at a time
+
+    Each chunk is checked column by column with the batch validators, and
+    distinct skills texts go through the tech matcher once. Emails already
+    seen earlier in the import are rejected as duplicates.
+    """
+
+    def __init__(self):
+        self._seen_emails: Dict[str, int] = {}
+        self.imported = 0
+        self.rejected = 0
+
+    def process(self, rows: List[Row]) -> Tuple[List[Dict], List[Dict]]:
+        """Return (import records, reject records) for one chunk of rows"""
+        columns = {name: [""] * len(rows) for name in COLUMN_ALIASES}
+        malformed = set()
+        for i, (_, record) in enumerate(rows):
+            if "_raw" in record:
+                malformed.add(i)
+                continue
+            for column, value in record.items():
+                name = _field_of(column)
+                if name is not None and not columns[name][i]:
+                    columns[name][i] = _text(value)
+
+        emails = [normalize_email(email) for email in columns["email"]]
+        valid_email = validate_emails(emails)
+        phones = columns["phone"]
+        valid_phone = validate_phones(phones)
+        skills = columns["skills"]
+        distinct = list(dict.fromkeys(text for text in skills if text))
+        tech_of = dict(zip(distinct, current_catalog().tech_matcher.extract_many(distinct)))
+
+        imported: List[Dict] = []
+        rejected: List[Dict] = []
+        for i, (line, record) in enumerate(rows):
+            reasons = []
+            if i in malformed:
+                reasons.append("not a JSON object")
+            else:
+                if not columns["full_name"][i]:
+                    reasons.append("missing name")
+                if not emails[i]:
+                    reasons.append("missing email")
+                elif not valid_email[i]:
+                    reasons.append("invalid email")
+                if phones[i] and not valid_phone[i]:
+                    reasons.append("invalid phone")
+                if not reasons:
+                    # Only accepted rows count, so a fixed-up repeat of a bad row still imports
+                    first = self._seen_emails.setdefault(email_key(emails[i]), line)
+                    if first != line:
+                        reasons.append(f"duplicate email (line {first})")
+            if reasons:
+                rejected.append({"line": line, "reasons": reasons, "record": record})
+                continue
+
+            # Same keys as asdict(CandidateInfo), built directly since asdict deep-copies
+            imported.append({"line": line, "candidate_info": {
+                "full_name": columns["full_name"][i],
+                "email": emails[i],
+                "phone": normalize_phone(phones[i]) if phones[i] else "",
+                "experience_years": columns["experience_years"][i],
+                "desired_position": columns["desired_position"][i],
+                "location": columns["location"][i],
+                "tech_stack": list(tech_of.get(skills[i], ())),
+            }})
+
+        self.imported += len(imported)
+        self.rejected += len(rejected)
+        return imported, rejected
+
+    def run(self, rows: Iterable[Row], chunk_size: int = 1000) -> Iterator[Tuple[List[Dict], List[Dict]]]:
+        for chunk in _chunked(rows, chunk_size):
+            yield self.process(chunk)
+
+
+def import_file(source: TextIO, fmt: str, sink: TextIO, rejects: Optional[TextIO] = None,
+                chunk_size: int = 1000) -> CandidateImporter:
+    """Import a whole file, writing JSONL records to sink and rejects to rejects"""
+    rows = read_csv(source) if fmt == "csv" else read_jsonl(source)
+    importer = CandidateImporter()
+    for imported, rejected in importer.run(rows, chunk_size):
+        sink.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in imported)
+        if rejects is not None:
+            rejects.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in rejected)
+    return importer
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate a candidate list into pre-filled screening records")
+    parser.add_argument("input", help="CSV or JSONL file of candidates ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file for imported candidates ('-' for stdout)")
+    parser.add_argument("--rejects", help="JSONL file for rejected rows and their reasons")
+    parser.add_argument("--format", choices=FORMATS, help="input format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="rows validated per batch")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv")
+    # utf-8-sig drops the byte order mark spreadsheet exports start with
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8-sig", newline="")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+    try:
+        importer = import_file(source, fmt, sink, rejects, args.chunk_size)
+    finally:
+        for handle in (source, sink, rejects):
+            if handle is not None and handle not in (sys.stdin, sys.stdout):
+                handle.close()
+    print(f"imported {importer.imported} candidates, rejected {importer.rejected}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
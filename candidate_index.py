@@ -0,0 +1,424 @@
+"""
+Recruiter search index for TalentScout Hiring Assistant
+In-memory inverted index over stored candidates: tech stack, position family,
+location tokens, experience band and completion, with boolean queries such as
+"Kubernetes AND AWS, devops, Berlin"
+
+Usage:
+    python candidate_index.py --db talentscout.db "kubernetes AND aws, devops, berlin"
+"""
+
+import argparse
+import re
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import POSITION_TECH_MAPPING
+from question_cache import EXPERIENCE_BANDS, experience_band
+from question_index import GENERAL_FAMILY, position_family
+# The startup matcher rather than the current config_artifact catalog, so the
+# terms of indexed candidates and of queries never drift apart
+from tech_matcher import TECH_MATCHER
+
+EXPERIENCE_BAND_NAMES = [band for _, band in EXPERIENCE_BANDS] + ["staff"]
+
+# Explicit field prefixes accepted in queries ("loc:paris", "exp:senior")
+FIELD_PREFIXES = {
+    "tech": "tech", "family": "family", "position": "family", "location": "loc", "loc": "loc",
+    "experience": "exp", "exp": "exp", "status": "status",
+}
+
+# A posting becomes a bitmap once it averages an id per 64-bit word, where the
+# bitmap is no larger than the id array and ANDs beat per-id lookups
+_DENSE_MIN = 1024
+
+_LOCATION_TOKEN = re.compile(r"[^\W_]+")
+_CLAUSE_SPLIT = re.compile(r"\s*(?:,|&|\bAND\b)\s*", re.IGNORECASE)
+_ATOM_SPLIT = re.compile(r"\s*(?:\||\bOR\b)\s*", re.IGNORECASE)
+_YEARS = re.compile(r"^(\d+(?:\.\d+)?)\s*(\+)?\s*(?:years?|yrs?)?$")
+
+_popcount = getattr(np, "bitwise_count", None)
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# A query is an AND of clauses; a clause is an OR of atoms; an atom is an AND of terms
+Atom = Tuple[str, ...]
+Clause = List[Atom]
+
+
+@lru_cache(maxsize=4096)
+def _tech_term(name: str) -> str:
+    name = " ".join(name.lower().split())
+    return "tech:" + (TECH_MATCHER.canonical(name) or name)
+
+
+def candidate_terms(tech_stack: Iterable[str], position: str, location: str,
+                    experience: str, completed: bool) -> List[str]:
+    """Index terms of one candidate"""
+    terms = [_tech_term(tech) for tech in tech_stack if tech.strip()]
+    terms.append("family:" + position_family(position))
+    terms.extend("loc:" + token for token in _LOCATION_TOKEN.findall(location.lower()))
+    terms.append("exp:" + experience_band(experience))
+    if completed:
+        terms.append("status:completed")
+    return list(dict.fromkeys(terms))
+
+
+def _parse_atom(text: str) -> List[Atom]:
+    """Terms for one query word or phrase; several atoms mean any of them"""
+    lowered = " ".join(text.lower().split())
+    field, sep, value = lowered.partition(":")
+    if sep and field in FIELD_PREFIXES:
+        field = FIELD_PREFIXES[field]
+        if field == "tech":
+            return [(_tech_term(value),)]
+        if field == "loc":
+            return [tuple("loc:" + token for token in _LOCATION_TOKEN.findall(value))]
+        if field == "family" and value not in POSITION_TECH_MAPPING:
+            value = position_family(value)
+        if field == "exp" and value not in EXPERIENCE_BAND_NAMES:
+            return _parse_atom(value)
+        return [(f"{field}:{value}",)]
+
+    if lowered in ("completed", "complete", "finished"):
+        return [("status:completed",)]
+    if lowered in EXPERIENCE_BAND_NAMES:
+        return [("exp:" + lowered,)]
+    years = _YEARS.match(lowered)
+    if years:
+        if not years.group(2):
+            return [("exp:" + experience_band(years.group(1)),)]
+        # "5+ years": every band that reaches 5 years
+        minimum = float(years.group(1))
+        bands = [band for upper, band in EXPERIENCE_BANDS if upper >= minimum] + ["staff"]
+        return [("exp:" + band,) for band in bands]
+    if lowered in POSITION_TECH_MAPPING:
+        return [("family:" + lowered,)]
+    canonical = TECH_MATCHER.canonical(lowered)
+    if canonical is not None:
+        return [("tech:" + canonical,)]
+    found = TECH_MATCHER.extract(lowered)
+    if len(found) == 1:
+        return [(_tech_term(found[0]),)]
+    family = position_family(lowered)
+    if family != GENERAL_FAMILY:
+        return [("family:" + family,)]
+    return [tuple("loc:" + token for token in _LOCATION_TOKEN.findall(lowered))]
+
+
+def parse_query(query: str) -> List[Clause]:
+    """Parse "Kubernetes AND AWS, devops, Berlin | Munich" into clauses
+
+    Clauses are separated by ",", "&" or AND, and alternatives within one by
+    "|" or OR. Words are assigned to a field by what they match (status,
+    experience band or "N years", position family, technology, otherwise
+    location); "tech:", "family:", "loc:", "exp:" and "status:" force a field.
+    """
+    clauses = []
+    for part in _CLAUSE_SPLIT.split(query.strip()):
+        if not part:
+            continue
+        clause = []
+        for alternative in _ATOM_SPLIT.split(part):
+            if alternative:
+                clause.extend(atom for atom in _parse_atom(alternative) if atom)
+        if clause:
+            clauses.append(clause)
+    return clauses
+
+
+class _Posting:
+    """Document ids of one term: an ascending id array, or a bitmap once dense"""
+
+    __slots__ = ("ids", "bits", "size")
+
+    def __init__(self):
+        self.ids: Optional[array] = array("q")
+        self.bits: Optional[np.ndarray] = None
+        self.size = 0
+
+    def array(self) -> np.ndarray:
+        if self.bits is None:
+            return np.frombuffer(self.ids, dtype=np.int64)
+        return _bitmap_ids(self.bits)
+
+    def contains(self, ids: np.ndarray) -> np.ndarray:
+        if self.bits is not None:
+            return ((self.bits[ids >> 6] >> (ids & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+        posting = np.frombuffer(self.ids, dtype=np.int64)
+        if not posting.size:
+            return np.zeros(ids.shape, dtype=bool)
+        found = np.searchsorted(posting, ids)
+        found[found == posting.size] = 0
+        return posting[found] == ids
+
+    def bitmap(self, words: int) -> np.ndarray:
+        if self.bits is not None:
+            return self.bits
+        return _ids_bitmap(np.frombuffer(self.ids, dtype=np.int64), words)
+
+
+def _dense(size: int, words: int) -> bool:
+    return size >= _DENSE_MIN and size >= words
+
+
+def _ids_bitmap(ids: np.ndarray, words: int) -> np.ndarray:
+    """Bitmap of ascending, distinct ids"""
+    bits = np.zeros(words, dtype=np.uint64)
+    if ids.size:
+        word = ids >> 6
+        starts = np.flatnonzero(np.concatenate(([True], word[1:] != word[:-1])))
+        # Bits within a word are distinct, so their sum is their OR
+        bits[word[starts]] = np.add.reduceat(np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)), starts)
+    return bits
+
+
+def _bitmap_ids(bits: np.ndarray, last: int = 0) -> np.ndarray:
+    """Ascending ids of the set bits; only the highest `last` ids when last > 0"""
+    nonzero = np.flatnonzero(bits)
+    if last:
+        # Every nonzero word holds at least one id
+        nonzero = nonzero[-last:]
+    unpacked = np.unpackbits(bits[nonzero].astype("<u8").view(np.uint8), bitorder="little").reshape(-1, 64)
+    rows, offsets = np.nonzero(unpacked)
+    ids = nonzero[rows] * 64 + offsets
+    return ids[-last:] if last else ids
+
+
+def _count(bits: np.ndarray) -> int:
+    if _popcount is not None:
+        return int(_popcount(bits).sum())
+    return int(_POPCOUNT8[bits.view(np.uint8)].sum())
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    total: int
+    session_ids: List[str]
+
+
+class CandidateIndex:
+    """Inverted index from terms to candidates, kept current as sessions are saved
+
+    Every save of a session gives it a new, higher document id and retires
+    the old one, so postings only ever grow at the end (ascending arrays
+    stay sorted without work) and id order is recency order. Retired ids are
+    filtered out through a live bitmap and dropped by compact() once they
+    outnumber the live ones.
+
+    Queries intersect clauses smallest first. When the smallest clause is a
+    short id array, its ids are checked against the others (cost
+    proportional to that clause); otherwise whole bitmaps are ANDed word by
+    word.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, _Posting] = {}
+        self._doc_of: Dict[str, int] = {}
+        self._session_of: List[Optional[str]] = []
+        self._words = 1024
+        self._live = np.zeros(self._words, dtype=np.uint64)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    @classmethod
+    def from_connection(cls, conn) -> "CandidateIndex":
+        """Build from a candidate store connection, oldest update first"""
+        index = cls()
+        rows = conn.execute(
+            "SELECT c.session_id, c.desired_position, c.location, c.experience_years, c.completed,"
+            " group_concat(t.tech, char(31)) AS techs"
+            " FROM candidates c LEFT JOIN candidate_tech t ON t.session_id = c.session_id"
+            " GROUP BY c.session_id ORDER BY c.updated_at, c.session_id"
+        )
+        for row in rows:
+            index.add(row["session_id"], candidate_terms(
+                (row["techs"] or "").split("\x1f"), row["desired_position"], row["location"],
+                row["experience_years"], bool(row["completed"]),
+            ))
+        return index
+
+    def _grow(self, words: int) -> None:
+        words = max(words, self._words + self._words // 2)
+        for posting in self._postings.values():
+            if posting.bits is not None:
+                posting.bits = np.concatenate([posting.bits, np.zeros(words - self._words, dtype=np.uint64)])
+        self._live = np.concatenate([self._live, np.zeros(words - self._words, dtype=np.uint64)])
+        self._words = words
+
+    def add(self, session_id: str, terms: Iterable[str]) -> None:
+        """Index (or re-index) a session under the given terms"""
+        with self._lock:
+            self._retire(session_id)
+            doc = len(self._session_of)
+            word, bit = doc >> 6, np.uint64(1 << (doc & 63))
+            if word >= self._words:
+                self._grow(word + 1)
+            self._session_of.append(session_id)
+            self._doc_of[session_id] = doc
+            self._live[word] |= bit
+            for term in terms:
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = _Posting()
+                posting.size += 1
+                if posting.bits is not None:
+                    posting.bits[word] |= bit
+                    continue
+                posting.ids.append(doc)
+                if _dense(posting.size, self._words):
+                    posting.bits = _ids_bitmap(np.frombuffer(posting.ids, dtype=np.int64), self._words)
+                    posting.ids = None
+
+    def update(self, record) -> None:
+        """Re-index a saved session; record is a candidate_store.CandidateRecord"""
+        self.add(record.session_id, candidate_terms(
+            record.tech_stack, record.desired_position, record.location,
+            record.experience_years, record.completed,
+        ))
+
+    def remove(self, session_id: str) -> None:
+        with self._lock:
+            self._retire(session_id)
+
+    def _retire(self, session_id: str) -> None:
+        doc = self._doc_of.pop(session_id, None)
+        if doc is None:
+            return
+        self._session_of[doc] = None
+        self._live[doc >> 6] &= ~np.uint64(1 << (doc & 63))
+        if len(self._session_of) - len(self._doc_of) > max(len(self._doc_of), 4096):
+            self._compact()
+
+    def compact(self) -> None:
+        """Renumber live documents densely, dropping retired ids from every posting"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        total = len(self._session_of)
+        live = np.unpackbits(self._live.astype("<u8").view(np.uint8), bitorder="little")[:total].astype(bool)
+        new_id = np.cumsum(live) - 1
+        self._session_of = [session_id for session_id in self._session_of if session_id is not None]
+        self._doc_of = {session_id: doc for doc, session_id in enumerate(self._session_of)}
+        self._words = max(1024, -(-len(self._session_of) // 64) * 2)
+        self._live = _ids_bitmap(np.arange(len(self._session_of), dtype=np.int64), self._words)
+
+        postings = {}
+        for term, posting in self._postings.items():
+            ids = posting.array()
+            ids = new_id[ids[live[ids]]]
+            if not ids.size:
+                continue
+            compacted = postings[term] = _Posting()
+            compacted.size = ids.size
+            if _dense(ids.size, self._words):
+                compacted.bits = _ids_bitmap(ids, self._words)
+                compacted.ids = None
+            else:
+                compacted.ids = array("q", ids.tobytes())
+        self._postings = postings
+
+    def terms(self) -> Dict[str, int]:
+        """Postings size per term, retired ids included"""
+        with self._lock:
+            return {term: posting.size for term, posting in self._postings.items()}
+
+    def _atom_ids(self, atom: Atom) -> np.ndarray:
+        postings = sorted((self._postings[term] for term in atom), key=lambda posting: posting.size)
+        ids = postings[0].array()
+        for posting in postings[1:]:
+            ids = ids[posting.contains(ids)]
+        return ids
+
+    def _atom_bitmap(self, atom: Atom) -> np.ndarray:
+        bits = self._postings[atom[0]].bitmap(self._words)
+        for term in atom[1:]:
+            bits = bits & self._postings[term].bitmap(self._words)
+        return bits
+
+    def _clause_contains(self, clause: Clause, ids: np.ndarray) -> np.ndarray:
+        mask = np.zeros(ids.shape, dtype=bool)
+        for atom in clause:
+            atom_mask = self._postings[atom[0]].contains(ids)
+            for term in atom[1:]:
+                atom_mask &= self._postings[term].contains(ids)
+            mask |= atom_mask
+        return mask
+
+    def match(self, clauses: Sequence[Clause], limit: int = 100) -> SearchResult:
+        """Evaluate parsed clauses; session ids are most recently saved first"""
+        with self._lock:
+            # Atoms with an unknown term match nothing
+            clauses = [[atom for atom in clause if all(term in self._postings for term in atom)]
+                       for clause in clauses]
+            if not clauses or not all(clauses):
+                return SearchResult(0, [])
+
+            def estimate(clause: Clause) -> int:
+                return sum(min(self._postings[term].size for term in atom) for atom in clause)
+
+            def sparse(atom: Atom) -> bool:
+                return min((self._postings[term] for term in atom), key=lambda posting: posting.size).bits is None
+
+            clauses = sorted(clauses, key=estimate)
+            if estimate(clauses[0]) <= self._words and all(sparse(atom) for atom in clauses[0]):
+                first = clauses[0]
+                ids = self._atom_ids(first[0])
+                if len(first) > 1:
+                    ids = np.unique(np.concatenate([ids] + [self._atom_ids(atom) for atom in first[1:]]))
+                ids = ids[((self._live[ids >> 6] >> (ids & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)]
+                for clause in clauses[1:]:
+                    if not ids.size:
+                        break
+                    ids = ids[self._clause_contains(clause, ids)]
+                total = int(ids.size)
+                top = ids[-limit:] if limit else ids[:0]
+            else:
+                bits = self._live
+                for clause in clauses:
+                    clause_bits = self._atom_bitmap(clause[0])
+                    for atom in clause[1:]:
+                        clause_bits = clause_bits | self._atom_bitmap(atom)
+                    bits = bits & clause_bits
+                total = _count(bits)
+                top = _bitmap_ids(bits, limit) if limit and total else np.zeros(0, dtype=np.int64)
+            session_of = self._session_of
+            return SearchResult(total, [session_of[doc] for doc in top[::-1].tolist()])
+
+    def search(self, query: str, limit: int = 100) -> SearchResult:
+        return self.match(parse_query(query), limit)
+
+
+def main() -> None:
+    from candidate_store import connect
+
+    parser = argparse.ArgumentParser(description="Search stored candidates by tech, position, location and experience")
+    parser.add_argument("query", help='e.g. "kubernetes AND aws, devops, berlin | munich, 5+ years"')
+    parser.add_argument("--db", default="talentscout.db", help="candidate store SQLite file")
+    parser.add_argument("--limit", type=int, default=20, help="how many session ids to print")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = CandidateIndex.from_connection(connect(args.db))
+    built = time.perf_counter() - start
+    clauses = parse_query(args.query)
+    start = time.perf_counter()
+    result = index.match(clauses, args.limit)
+    elapsed = time.perf_counter() - start
+    print(f"indexed {len(index)} candidates in {built:.2f} s")
+    print("query: " + " AND ".join("(" + " OR ".join(" ".join(atom) for atom in clause) + ")" for clause in clauses))
+    print(f"{result.total} matches in {elapsed * 1000:.3f} ms")
+    for session_id in result.session_ids:
+        print(session_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Durable candidate store for TalentScout Hiring Assistant
+Persists screenings to SQLite (WAL mode) from a background writer thread
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from assistant import HiringAssistant
+from duplicate_index import phone_digits
+
+if TYPE_CHECKING:
+    from candidate_index import SearchResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    session_id       TEXT PRIMARY KEY,
+    full_name        TEXT NOT NULL DEFAULT '',
+    email            TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+    phone            TEXT NOT NULL DEFAULT '',
+    phone_digits     TEXT NOT NULL DEFAULT '',
+    experience_years TEXT NOT NULL DEFAULT '',
+    desired_position TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+    location         TEXT NOT NULL DEFAULT '',
+    stage            TEXT NOT NULL,
+    completed        INTEGER NOT NULL DEFAULT 0,
+    created_at       REAL NOT NULL,
+    updated_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_email ON candidates(email);
+CREATE INDEX IF NOT EXISTS idx_candidates_phone_digits ON candidates(phone_digits);
+CREATE INDEX IF NOT EXISTS idx_candidates_position ON candidates(desired_position);
+CREATE INDEX IF NOT EXISTS idx_candidates_updated ON candidates(updated_at, session_id);
+
+CREATE TABLE IF NOT EXISTS candidate_tech (
+    session_id TEXT NOT NULL,
+    tech       TEXT NOT NULL COLLATE NOCASE,
+    position   INTEGER NOT NULL,
+    PRIMARY KEY (session_id, tech)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_candidate_tech_tech ON candidate_tech(tech);
+
+CREATE TABLE IF NOT EXISTS answers (
+    session_id  TEXT NOT NULL,
+    position    INTEGER NOT NULL,
+    question_id TEXT NOT NULL,
+    question    TEXT NOT NULL DEFAULT '',
+    answer      TEXT NOT NULL,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+"""
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CandidateRecord:
+    """Immutable copy of a session's state, safe to hand to the writer thread"""
+    session_id: str
+    full_name: str
+    email: str
+    phone: str
+    experience_years: str
+    desired_position: str
+    location: str
+    tech_stack: Tuple[str, ...]
+    # (question id, question text, answer); the text is kept so generated
+    # questions can be read back by other processes and after a restart
+    answers: Tuple[Tuple[str, str, str], ...]
+    stage: str
+    completed: bool
+    updated_at: float
+
+    @classmethod
+    def from_assistant(cls, session_id: str, assistant: HiringAssistant) -> "CandidateRecord":
+        info = assistant.candidate_info
+        return cls(
+            session_id=session_id,
+            full_name=info.full_name,
+            email=info.email,
+            phone=info.phone,
+            experience_years=info.experience_years,
+            desired_position=info.desired_position,
+            location=info.location,
+            tech_stack=tuple(info.tech_stack),
+            answers=tuple(
+                (qid, assistant.question_text(qid), answer)
+                for qid, answer in zip(assistant.question_ids, assistant.answers)
+            ),
+            stage=assistant.get_current_stage(),
+            completed=assistant.get_current_stage() == "conclusion",
+            updated_at=time.time(),
+        )
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """Create the tables, adding columns that stores from older versions lack"""
+    conn.executescript(SCHEMA)
+    if "question" not in {row[1] for row in conn.execute("PRAGMA table_info(answers)")}:
+        conn.execute("ALTER TABLE answers ADD COLUMN question TEXT NOT NULL DEFAULT ''")
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a connection with the pragmas every store connection uses"""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+class CandidateStore:
+    """Batched, write-behind persistence for screening sessions
+
+    save() only copies the session state and enqueues it, so it never
+    touches the disk on the candidate's turn. A writer thread drains the
+    queue and commits up to batch_size records per transaction, keeping
+    only the latest state of each session within a batch. A batch that
+    fails is logged and dropped; the writer carries on, and the next
+    flush() raises the error.
+    """
+
+    def __init__(self, path: str = "talentscout.db", batch_size: int = 200,
+                 flush_interval: float = 0.25, index: bool = False):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._write_conn = connect(path)
+        ensure_schema(self._write_conn)
+        self._read_conn = connect(path)
+        self._read_lock = threading.Lock()
+        # Loaded from the store, then kept current by the writer thread
+        self.index = None
+        if index:
+            # Imported here so that stores without search do not load NumPy
+            from candidate_index import CandidateIndex
+            self.index = CandidateIndex.from_connection(self._read_conn)
+
+        self._queue: "queue.Queue[Optional[CandidateRecord]]" = queue.Queue()
+        self._closed = False
+        self._error: Optional[Exception] = None
+        self._error_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._run_writer, name="candidate-store-writer", daemon=True)
+        self._writer.start()
+
+    def save(self, session_id: str, assistant: HiringAssistant) -> None:
+        """Queue the current state of a session for writing"""
+        if self._closed:
+            raise RuntimeError("CandidateStore is closed")
+        self._queue.put(CandidateRecord.from_assistant(session_id, assistant))
+
+    def flush(self) -> None:
+        """Block until everything queued so far has been written
+
+        Raises RuntimeError if a batch failed since the last flush().
+        """
+        self._queue.join()
+        with self._error_lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise RuntimeError(f"Failed to write candidate records: {error}") from error
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        self._write_conn.close()
+        self._read_conn.close()
+
+    def _run_writer(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is None
+            records = [record for record in batch if record is not None]
+            try:
+                if records:
+                    self._write_batch(records)
+                    if self.index is not None:
+                        for record in records:
+                            self.index.update(record)
+            except Exception as e:
+                # Anything escaping here would end the thread and leave flush() waiting forever
+                logger.exception("Failed to write %d candidate records", len(records))
+                with self._error_lock:
+                    self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, records: List[CandidateRecord]) -> None:
+        # Later saves of the same session supersede earlier ones in the batch
+        latest: Dict[str, CandidateRecord] = {}
+        for record in records:
+            latest[record.session_id] = record
+        records = list(latest.values())
+        session_ids = [(record.session_id,) for record in records]
+
+        with self._write_conn:
+            self._write_conn.executemany(
+                """
+                INSERT INTO candidates (session_id, full_name, email, phone, phone_digits,
+                    experience_years, desired_position, location, stage, completed,
+                    created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    full_name = excluded.full_name,
+                    email = excluded.email,
+                    phone = excluded.phone,
+                    phone_digits = excluded.phone_digits,
+                    experience_years = excluded.experience_years,
+                    desired_position = excluded.desired_position,
+                    location = excluded.location,
+                    stage = excluded.stage,
+                    completed = excluded.completed,
+                    updated_at = excluded.updated_at
+                """,
+                [
+                    (
+                        r.session_id, r.full_name, r.email, r.phone, phone_digits(r.phone),
+                        r.experience_years, r.desired_position, r.location, r.stage,
+                        int(r.completed), r.updated_at, r.updated_at,
+                    )
+                    for r in records
+                ],
+            )
+            self._write_conn.executemany("DELETE FROM candidate_tech WHERE session_id = ?", session_ids)
+            self._write_conn.executemany(
+                "INSERT OR IGNORE INTO candidate_tech (session_id, tech, position) VALUES (?, ?, ?)",
+                [
+                    (r.session_id, tech, position)
+                    for r in records
+                    for position, tech in enumerate(r.tech_stack)
+                ],
+            )
+            self._write_conn.executemany("DELETE FROM answers WHERE session_id = ?", session_ids)
+            self._write_conn.executemany(
+                "INSERT INTO answers (session_id, position, question_id, question, answer) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (r.session_id, position, question_id, question, answer)
+                    for r in records
+                    for position, (question_id, question, answer) in enumerate(r.answers)
+                ],
+            )
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        with self._read_lock:
+            return self._read_conn.execute(sql, params).fetchall()
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        """Return a stored candidate with tech stack and answers, or None"""
+        rows = self._query("SELECT * FROM candidates WHERE session_id = ?", (session_id,))
+        if not rows:
+            return None
+        candidate = dict(rows[0])
+        candidate["completed"] = bool(candidate["completed"])
+        candidate["tech_stack"] = [
+            row["tech"] for row in self._query(
+                "SELECT tech FROM candidate_tech WHERE session_id = ? ORDER BY position", (session_id,)
+            )
+        ]
+        candidate["answers"] = [
+            {"question_id": row["question_id"], "question": row["question"], "answer": row["answer"]}
+            for row in self._query(
+                "SELECT question_id, question, answer FROM answers WHERE session_id = ? ORDER BY position",
+                (session_id,),
+            )
+        ]
+        return candidate
+
+    def find(self, email: Optional[str] = None, phone: Optional[str] = None,
+             position: Optional[str] = None, tech: Optional[str] = None,
+             limit: int = 100) -> List[str]:
+        """Return session ids matching every given filter, newest first"""
+        clauses, params = [], []
+        if email:
+            clauses.append("c.email = ?")
+            params.append(email.strip())
+        if phone:
+            clauses.append("c.phone_digits = ?")
+            params.append(phone_digits(phone))
+        if position:
+            clauses.append("c.desired_position = ?")
+            params.append(position.strip())
+        if tech:
+            clauses.append("c.session_id IN (SELECT session_id FROM candidate_tech WHERE tech = ?)")
+            params.append(tech.strip())
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(
+            f"SELECT c.session_id FROM candidates c {where} ORDER BY c.updated_at DESC LIMIT ?",
+            (*params, limit),
+        )
+        return [row["session_id"] for row in rows]
+
+    def search(self, query: str, limit: int = 100) -> "SearchResult":
+        """Boolean search such as "kubernetes AND aws, devops, berlin"; needs index=True"""
+        if self.index is None:
+            raise RuntimeError("CandidateStore was opened without index=True")
+        return self.index.search(query, limit)
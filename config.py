@@ -44,9 +44,46 @@ TECH_KEYWORDS = {
     'testing_tools': [
         'jest', 'pytest', 'junit', 'selenium', 'cypress', 'mocha', 'chai',
         'postman', 'insomnia', 'swagger'
+    ],
+    'web_technologies': [
+        'html', 'css', 'graphql', 'rest api'
     ]
 }
 
+# Other names candidates use for a TECH_KEYWORDS entry. Spacing, hyphen and
+# ".js" variants ("nodejs", "spring-boot", "reactjs") are derived in
+# tech_matcher, so only spellings that cannot be derived belong here.
+TECH_ALIASES = {
+    'k8s': 'kubernetes',
+    'kube': 'kubernetes',
+    'golang': 'go',
+    'postgres': 'postgresql',
+    'postgre': 'postgresql',
+    'psql': 'postgresql',
+    'mongo': 'mongodb',
+    'csharp': 'c#',
+    'c sharp': 'c#',
+    'cpp': 'c++',
+    'js': 'javascript',
+    'ecmascript': 'javascript',
+    'node': 'node.js',
+    'vue.js': 'vue',
+    'sklearn': 'scikit-learn',
+    'google cloud': 'gcp',
+    'google cloud platform': 'gcp',
+    'amazon web services': 'aws',
+    'mssql': 'sql server',
+    'ruby on rails': 'rails',
+    'spark': 'apache spark',
+    'pyspark': 'apache spark',
+    'tailwindcss': 'tailwind',
+    'mui': 'material-ui',
+    'objc': 'objective-c',
+    'obj-c': 'objective-c',
+    'elastic': 'elasticsearch',
+    'restful api': 'rest api',
+}
+
 # Comprehensive Question Database
 QUESTION_TEMPLATES = {
     # Programming Languages
@@ -318,6 +355,308 @@ GENERAL_QUESTIONS = [
     "How do you handle security considerations in your applications?"
 ]
 
+# Reference keypoints for scoring technical answers, aligned index-for-index
+# with QUESTION_TEMPLATES (GENERAL_QUESTION_KEYPOINTS with GENERAL_QUESTIONS).
+# An answer covers a keypoint when it uses the keypoint's terms.
+QUESTION_KEYPOINTS = {
+    'Python': [
+        ["list mutable", "tuple immutable", "tuple hashable dictionary key", "tuple faster less memory"],
+        ["global interpreter lock mutex", "one thread executes bytecode", "cpu bound threads multiprocessing", "io bound threads release"],
+        ["try except block", "finally cleanup", "raise custom exception", "specific exception types"],
+        ["function wraps function", "@ syntax", "functools wraps", "logging caching authentication"],
+        ["shallow copy references nested objects", "deep copy recursive", "copy module deepcopy", "nested mutable objects"],
+        ["__str__ readable users", "__repr__ unambiguous developers", "repr recreate object", "print str fallback repr"],
+        ["reference counting", "cyclic garbage collector", "generations", "gc module"],
+        ["yield lazy values", "iterator protocol", "memory efficient large sequences", "generator expression"],
+    ],
+    'Java': [
+        ["jvm executes bytecode", "jre runtime libraries", "jdk compiler tools", "javac"],
+        ["method overriding runtime", "method overloading compile time", "superclass reference subclass object", "dynamic dispatch"],
+        ["encapsulation", "inheritance", "polymorphism", "abstraction"],
+        ["abstract class constructor state", "interface contract", "multiple interfaces implement", "default methods"],
+        ["heap objects", "stack method frames", "garbage collector generations", "young old generation"],
+        ["single inheritance", "multilevel inheritance", "hierarchical inheritance", "multiple inheritance interfaces"],
+        ["try catch finally", "checked unchecked exceptions", "throws declaration", "try with resources"],
+        ["final variable constant", "final method override", "final class extended", "immutable"],
+    ],
+    'Javascript': [
+        ["== type coercion", "=== strict equality", "same type value", "prefer ==="],
+        ["function remembers lexical scope", "outer variables", "private state", "counter example"],
+        ["single threaded call stack", "callback queue", "microtask queue promises", "non blocking async"],
+        ["pending fulfilled rejected", "then catch", "async await", "chaining"],
+        ["declarations moved top", "var hoisted undefined", "function declarations hoisted", "temporal dead zone let const"],
+        ["var function scope", "let block scope", "const reassignment", "hoisting"],
+        ["depends how function called", "method object", "call apply bind", "arrow lexical this"],
+        ["shorter syntax", "lexical this", "no arguments object", "constructor new"],
+    ],
+    'React': [
+        ["state internal component", "props passed parent", "props read only", "state change re render"],
+        ["mounting componentDidMount", "updating componentDidUpdate", "unmounting componentWillUnmount", "useEffect hooks equivalent"],
+        ["state function components", "useState", "useEffect side effects", "reuse logic custom hooks"],
+        ["virtual dom memory", "diffing reconciliation", "batch updates real dom", "keys lists"],
+        ["controlled state value", "onChange handler", "uncontrolled ref dom", "form inputs"],
+        ["avoid prop drilling", "provider consumer", "useContext", "theme authentication global"],
+        ["function takes component returns component", "reuse logic", "wrapper", "hooks alternative"],
+        ["memo useMemo useCallback", "avoid unnecessary re renders", "code splitting lazy", "virtualize long lists"],
+    ],
+    'Angular': [
+        ["angularjs javascript", "angular typescript", "component based architecture", "angularjs scope controllers"],
+        ["injector provides services", "constructor injection", "providers", "singleton root"],
+        ["component directives", "structural directives ngIf ngFor", "attribute directives", "custom directive"],
+        ["interpolation", "property binding", "event binding", "two way ngModel"],
+        ["share logic components", "injectable", "http data access", "singleton"],
+        ["ngOnInit", "ngOnChanges", "ngOnDestroy", "ngAfterViewInit"],
+        ["reactive programming observables", "operators map filter", "subscribe unsubscribe", "http client"],
+        ["template driven forms", "reactive forms", "form validation", "FormGroup FormControl"],
+    ],
+    'Vue': [
+        ["progressive framework", "reactive data binding", "components", "virtual dom"],
+        ["reactive proxies", "dependency tracking", "computed properties", "watchers re render"],
+        ["v-if conditional rendering dom", "v-show css display", "toggle cost", "initial render cost"],
+        ["v-on directive", "@ shorthand", "event modifiers", "emit custom events"],
+        ["reusable components", "props parent child", "emit events child parent", "vuex provide inject"],
+        ["created", "mounted", "updated", "unmounted destroyed"],
+        ["centralized state management", "mutations actions", "getters", "large applications shared state"],
+        ["directive hooks", "bind inserted mounted", "el binding", "register globally locally"],
+    ],
+    'Node.js': [
+        ["event loop", "event emitter", "non blocking io", "callbacks listeners"],
+        ["synchronous blocks", "asynchronous continues", "callbacks promises", "io operations"],
+        ["callback function", "promise then catch", "async await", "callback hell"],
+        ["single thread event loop", "non blocking io", "libuv thread pool", "cluster worker threads"],
+        ["project metadata", "dependencies versions", "scripts", "npm install"],
+        ["require module exports", "commonjs", "es modules import", "module cache"],
+        ["readable writable", "pipe", "chunks memory", "duplex transform"],
+        ["try catch async await", "error first callbacks", "promise catch", "unhandled rejection process"],
+    ],
+    'Django': [
+        ["models python classes tables", "querysets", "lazy evaluation", "database abstraction sql"],
+        ["model view template", "models data", "views logic", "templates presentation"],
+        ["process request response", "settings middleware order", "authentication sessions csrf", "custom middleware"],
+        ["makemigrations", "migrate", "migration files version control", "schema changes"],
+        ["form manual fields", "modelform model fields", "validation", "save instance"],
+        ["user model", "login logout", "permissions groups", "password hashing"],
+        ["decoupled notifications", "post_save pre_save", "receiver", "sender"],
+        ["select_related prefetch_related", "avoid n+1 queries", "caching", "database indexes"],
+    ],
+    'Flask': [
+        ["microframework", "lightweight flexible", "django batteries included", "extensions"],
+        ["application context current_app g", "request context request session", "pushed per request", "app_context"],
+        ["route decorator", "url rules variables", "http methods", "url_for"],
+        ["modular application", "register_blueprint", "url prefix", "large applications"],
+        ["sqlalchemy", "session commit", "connection", "migrations alembic"],
+        ["orm integration", "models", "session management", "configuration"],
+        ["flask-login", "session", "password hashing", "jwt tokens"],
+        ["jinja2", "render_template", "template inheritance", "autoescaping"],
+    ],
+    'Spring': [
+        ["inversion of control container", "dependency injection", "aop aspect oriented", "transaction management"],
+        ["container injects dependencies", "constructor injection", "setter field injection", "autowired"],
+        ["@Component generic bean", "@Service business logic", "@Repository data access", "exception translation"],
+        ["auto configuration", "starter dependencies", "embedded server", "convention over configuration"],
+        ["environment specific configuration", "@Profile", "spring.profiles.active", "dev test prod"],
+        ["@Transactional", "propagation", "isolation", "rollback"],
+        ["dispatcherservlet", "controllers", "request mapping", "view resolver"],
+        ["@ExceptionHandler", "@ControllerAdvice", "responseentity status", "global exception handling"],
+    ],
+    'Express': [
+        ["minimal web framework node", "routing", "middleware", "http utilities"],
+        ["app.get app.post", "route parameters", "express.Router", "http methods"],
+        ["functions req res next", "order execution", "body parsing logging", "call next"],
+        ["error handling middleware four arguments", "next(err)", "async errors", "status code response"],
+        ["app.use middleware all methods", "app.get get requests", "path prefix", "route handler"],
+        ["passport", "jwt tokens", "sessions cookies", "middleware protect routes"],
+        ["view engine", "pug ejs handlebars", "res.render", "templates directory"],
+        ["multer", "multipart form data", "file size limits", "storage disk"],
+    ],
+    'Mysql': [
+        ["inner join matching rows", "left join all rows left table", "null unmatched", "join condition"],
+        ["reduce redundancy", "first normal form atomic", "second normal form partial dependency", "third normal form transitive dependency"],
+        ["b-tree data structure", "faster lookups avoid full scan", "slower writes storage", "composite index"],
+        ["delete rows where rollback", "drop removes table", "truncate removes all rows", "ddl dml"],
+        ["explain query plan", "add indexes", "avoid select *", "slow query log"],
+        ["precompiled sql stored database", "reduce network traffic", "reuse logic", "security permissions"],
+        ["atomicity", "consistency", "isolation", "durability"],
+        ["innodb transactions", "innodb row level locking", "myisam table locking", "foreign keys"],
+    ],
+    'Postgresql': [
+        ["standards compliance", "advanced data types jsonb", "extensibility", "mvcc concurrency"],
+        ["multiple versions rows", "readers block writers", "snapshot isolation", "vacuum dead tuples"],
+        ["create extension", "postgis", "pg_stat_statements", "extend functionality"],
+        ["json jsonb", "jsonb binary indexed", "gin index", "operators ->"],
+        ["arrays", "jsonb", "hstore", "range uuid"],
+        ["b-tree default", "gin", "gist", "partial expression indexes"],
+        ["pg_dump", "pg_restore", "point in time recovery wal", "base backup"],
+        ["create function", "plpgsql", "procedures transactions", "return values"],
+    ],
+    'Mongodb': [
+        ["nosql document database", "flexible schema", "bson documents", "horizontal scaling"],
+        ["documents bson key value", "collections documents", "embedded documents", "_id field"],
+        ["single field index", "compound index", "text index", "multikey geospatial"],
+        ["aggregation pipeline", "$match", "$group", "$project $sort"],
+        ["horizontal partitioning", "shard key", "mongos router", "config servers"],
+        ["replica set", "primary secondary", "automatic failover", "oplog"],
+        ["multi document transactions", "replica set", "session", "acid"],
+        ["flexible schema scalability", "fast development", "joins limited", "memory usage consistency"],
+    ],
+    'Redis': [
+        ["in memory key value store", "caching", "session store", "queues leaderboards"],
+        ["strings", "lists", "sets sorted sets", "hashes"],
+        ["rdb snapshots", "aof append only file", "fsync", "durability tradeoff"],
+        ["data sharding hash slots", "16384 slots", "master replica", "automatic failover"],
+        ["cache aside", "ttl expiration", "eviction policy lru", "write through"],
+        ["publish subscribe channels", "fire and forget", "subscribers", "real time messaging"],
+        ["maxmemory", "eviction policies", "efficient data types", "key expiration"],
+        ["multi exec", "watch optimistic locking", "lua scripts atomic", "eval"],
+    ],
+    'Aws': [
+        ["ec2", "s3", "rds", "lambda iam"],
+        ["ec2 virtual servers", "lambda serverless functions", "pay per execution", "long running control"],
+        ["object storage", "buckets", "static website hosting backups", "storage classes"],
+        ["auto scaling groups", "scaling policies", "cloudwatch alarms", "load balancer"],
+        ["ebs block storage single instance", "efs shared file system", "multiple instances", "availability zone"],
+        ["virtual private cloud", "subnets public private", "route tables internet gateway", "security groups nacl"],
+        ["cloudwatch metrics", "alarms", "logs", "cloudtrail"],
+        ["least privilege iam", "mfa", "encryption", "security groups"],
+    ],
+    'Azure': [
+        ["app service", "azure functions", "azure sql", "storage"],
+        ["management groups", "subscriptions", "resource groups", "resources"],
+        ["vms infrastructure control", "app service platform managed", "scaling", "patching"],
+        ["azure pipelines", "build release", "yaml", "repos"],
+        ["blob storage", "file storage", "queue storage", "table storage"],
+        ["azure active directory entra", "rbac roles", "managed identities", "conditional access"],
+        ["azure monitor", "application insights", "log analytics", "alerts"],
+        ["site recovery", "backup", "geo redundant storage", "availability zones"],
+    ],
+    'Gcp': [
+        ["compute engine", "cloud storage", "bigquery", "kubernetes engine"],
+        ["compute engine virtual machines", "app engine platform", "managed scaling", "control"],
+        ["object storage buckets", "standard", "nearline coldline", "archive"],
+        ["managed instance groups", "autoscaler", "load balancing", "cpu utilization"],
+        ["bigquery", "dataflow", "vertex ai", "dataproc pubsub"],
+        ["vpc global", "subnets regions", "firewall rules", "cloud load balancing"],
+        ["iam roles", "service accounts", "encryption", "security command center"],
+        ["cloud monitoring", "cloud logging", "alerting", "trace"],
+    ],
+    'Docker': [
+        ["containers share host kernel", "virtual machines hypervisor guest os", "lightweight start fast", "isolation"],
+        ["image read only template", "container running instance", "layers", "docker run"],
+        ["text file builds image", "from", "run copy", "cmd entrypoint"],
+        ["docker compose", "yaml services", "networks", "volumes"],
+        ["persist data", "named volumes", "bind mounts", "tmpfs"],
+        ["bridge network", "host network", "overlay", "port mapping"],
+        ["multi stage builds", "small base image alpine", "reduce layers", "cache layers order"],
+        ["non root user", "scan images vulnerabilities", "minimal images", "secrets"],
+    ],
+    'Kubernetes': [
+        ["container orchestration", "control plane api server", "etcd scheduler", "nodes kubelet"],
+        ["pod containers", "service stable network", "deployment replicas", "rolling updates"],
+        ["virtual clusters", "isolation", "resource quotas", "teams environments"],
+        ["configmaps", "secrets", "environment variables", "volumes mounted"],
+        ["http routing", "ingress resource", "nginx", "tls host path"],
+        ["horizontal pod autoscaler", "vertical pod autoscaler", "cluster autoscaler", "replicas metrics"],
+        ["prometheus", "grafana", "metrics server", "logging"],
+        ["rbac", "network policies", "pod security", "secrets encryption"],
+    ],
+    'Jenkins': [
+        ["automation server", "continuous integration", "continuous delivery", "plugins"],
+        ["jenkinsfile", "declarative", "scripted", "stages steps"],
+        ["jobs", "source control triggers", "webhooks", "build steps"],
+        ["extend functionality", "git integration", "plugin manager", "pipeline plugins"],
+        ["parallel stages", "agents", "matrix", "faster builds"],
+        ["controller distributes", "agents execute builds", "labels", "nodes"],
+        ["authentication", "authorization role based", "credentials", "updates plugins"],
+        ["pipeline as code", "shared libraries", "folders permissions", "agents scaling"],
+    ],
+    'Pandas': [
+        ["data analysis library", "series one dimensional", "dataframe two dimensional", "index"],
+        ["isna isnull", "dropna", "fillna", "interpolate"],
+        ["split apply combine", "groupby", "aggregate agg", "transform"],
+        ["merge", "join", "concat", "how inner outer left"],
+        ["vectorized operations avoid loops", "categorical dtype", "chunksize", "downcast dtypes memory"],
+        ["loc label", "iloc position", "boolean indexing", "query"],
+        ["datetimeindex", "resample", "rolling windows", "to_datetime"],
+        ["remove duplicates", "fix data types", "handle missing values", "outliers consistent"],
+    ],
+    'Numpy': [
+        ["ndarray", "contiguous memory", "vectorized operations faster", "homogeneous types"],
+        ["different shapes", "stretch dimensions", "trailing dimensions compatible", "without copying"],
+        ["sum mean", "std var", "sin exp", "percentile median"],
+        ["reshape", "concatenate stack", "split", "transpose"],
+        ["operations whole arrays", "avoid python loops", "ufuncs", "c speed"],
+        ["dot matmul", "inverse inv", "eigenvalues", "solve linalg"],
+        ["memory mapping memmap", "views copies", "appropriate dtype", "chunk processing"],
+        ["default_rng generator", "seed reproducible", "distributions normal uniform", "shuffle choice"],
+    ],
+    'Tensorflow': [
+        ["machine learning library", "tensors", "keras", "graphs"],
+        ["dataflow graph", "nodes operations", "tf.function", "optimization"],
+        ["tensorflow 1 sessions run graphs", "eager execution default tensorflow 2", "immediate evaluation", "debugging"],
+        ["keras sequential", "functional api", "layers", "compile fit"],
+        ["tf.keras high level api", "core low level", "custom training loops", "gradienttape"],
+        ["tf.data pipelines", "map batch shuffle", "normalization", "prefetch"],
+        ["tensorflow serving", "tensorflow lite", "tensorflow.js", "savedmodel"],
+        ["quantization", "pruning", "mixed precision", "xla"],
+    ],
+    'Pytorch': [
+        ["dynamic graphs", "pythonic", "research", "tensorflow static graphs"],
+        ["tensors gpu", "autograd", "requires_grad", "backward gradients"],
+        ["dataset __getitem__ __len__", "dataloader", "batching shuffling", "num_workers"],
+        ["nn.Module", "__init__ layers", "forward method", "optimizer loss"],
+        ["define by run", "graph built runtime", "control flow", "debugging"],
+        ["pretrained models", "freeze layers", "replace final layer", "fine tune"],
+        ["sgd", "adam", "learning rate scheduler", "torch.optim"],
+        ["torchscript", "onnx", "torchserve", "mobile"],
+    ],
+}
+
+GENERAL_QUESTION_KEYPOINTS = [
+    ["problem context", "approach steps", "tradeoffs", "result outcome"],
+    ["documentation blogs", "courses", "open source projects", "conferences communities"],
+    ["reproduce issue", "logs debugger", "isolate narrow down", "tests regression"],
+    ["code reviews", "automated tests", "linting style guides", "refactoring documentation"],
+    ["git", "branches pull requests", "merge conflicts", "code review"],
+    ["profiling measure", "bottlenecks", "caching", "database queries algorithms"],
+    ["unit tests", "integration tests", "end to end tests", "continuous integration"],
+    ["input validation", "authentication authorization", "encryption", "owasp dependencies"],
+]
+
+# Item response theory ratings for adaptive questioning, aligned index-for-index
+# with QUESTION_TEMPLATES (GENERAL_QUESTION_RATINGS with GENERAL_QUESTIONS).
+# Each is (difficulty, discrimination) for a two-parameter logistic model:
+# difficulty is the skill level at which an answer is expected to cover half
+# the keypoints, discrimination how sharply the question separates levels.
+QUESTION_RATINGS = {
+    'Python': [(-1.2, 0.9), (0.9, 1.6), (-0.8, 1.0), (0.2, 1.4), (0.0, 1.3), (-0.3, 1.1), (0.8, 1.5), (0.3, 1.4)],
+    'Java': [(-1.0, 1.0), (-0.5, 1.1), (-1.3, 0.8), (-0.2, 1.2), (0.9, 1.5), (-0.8, 0.9), (-0.6, 1.0), (0.0, 1.2)],
+    'Javascript': [(-1.4, 0.9), (0.3, 1.5), (0.8, 1.6), (0.1, 1.3), (0.2, 1.3), (-0.8, 1.0), (0.5, 1.4), (-0.2, 1.2)],
+    'React': [(-1.2, 0.9), (-0.2, 1.1), (-0.3, 1.2), (0.4, 1.4), (-0.1, 1.3), (0.2, 1.2), (0.5, 1.3), (0.9, 1.5)],
+    'Angular': [(-1.0, 0.8), (0.4, 1.4), (-0.3, 1.1), (-0.5, 1.0), (-0.9, 0.9), (0.0, 1.2), (0.8, 1.5), (0.1, 1.2)],
+    'Vue': [(-1.4, 0.7), (0.8, 1.5), (-0.6, 1.1), (-0.9, 0.9), (-0.2, 1.2), (-0.1, 1.1), (0.3, 1.2), (0.6, 1.3)],
+    'Node.js': [(-0.3, 1.1), (-1.0, 1.0), (-0.2, 1.3), (0.8, 1.6), (-1.5, 0.7), (-0.6, 1.0), (0.7, 1.4), (0.1, 1.2)],
+    'Django': [(-0.6, 1.0), (-0.7, 1.0), (0.2, 1.3), (-0.3, 1.1), (0.0, 1.2), (0.1, 1.2), (0.5, 1.3), (1.0, 1.6)],
+    'Flask': [(-1.2, 0.8), (0.9, 1.6), (-1.0, 0.9), (0.0, 1.2), (-0.3, 1.1), (-0.1, 1.1), (0.3, 1.2), (-0.6, 1.0)],
+    'Spring': [(-1.2, 0.8), (-0.2, 1.2), (0.2, 1.3), (-0.6, 1.0), (0.1, 1.2), (1.0, 1.6), (0.2, 1.2), (0.3, 1.3)],
+    'Express': [(-1.3, 0.8), (-0.9, 0.9), (-0.1, 1.3), (0.3, 1.3), (0.0, 1.3), (0.5, 1.2), (-0.4, 1.0), (0.4, 1.1)],
+    'Mysql': [(-1.1, 1.0), (0.0, 1.3), (-0.2, 1.3), (-0.5, 1.1), (0.9, 1.6), (-0.1, 1.0), (-0.3, 1.2), (0.7, 1.4)],
+    'Postgresql': [(-0.6, 0.9), (1.2, 1.7), (0.2, 1.1), (0.1, 1.2), (0.3, 1.1), (0.8, 1.5), (0.4, 1.2), (0.2, 1.1)],
+    'Mongodb': [(-1.1, 0.9), (-1.0, 0.9), (0.0, 1.2), (0.4, 1.3), (0.8, 1.5), (0.7, 1.4), (1.0, 1.4), (-0.5, 1.0)],
+    'Redis': [(-1.2, 0.8), (-0.2, 1.2), (0.5, 1.4), (1.0, 1.5), (0.1, 1.3), (0.0, 1.1), (1.1, 1.5), (0.9, 1.4)],
+    'Aws': [(-1.3, 0.7), (-0.6, 1.1), (-1.0, 0.9), (0.3, 1.3), (0.2, 1.3), (0.6, 1.5), (-0.2, 1.1), (0.4, 1.3)],
+    'Azure': [(-1.2, 0.7), (0.1, 1.2), (-0.4, 1.1), (0.3, 1.2), (-0.3, 1.1), (0.5, 1.3), (-0.1, 1.1), (0.9, 1.4)],
+    'Gcp': [(-1.3, 0.7), (-0.5, 1.1), (-0.4, 1.1), (0.3, 1.3), (-0.2, 0.9), (0.7, 1.4), (0.5, 1.3), (-0.1, 1.1)],
+    'Docker': [(-1.0, 1.0), (-1.1, 1.0), (-0.4, 1.1), (-0.1, 1.2), (0.0, 1.2), (0.6, 1.4), (0.7, 1.5), (0.6, 1.4)],
+    'Kubernetes': [(-0.7, 1.0), (-0.4, 1.2), (-0.6, 1.0), (0.1, 1.2), (0.5, 1.3), (0.4, 1.3), (0.3, 1.2), (0.9, 1.5)],
+    'Jenkins': [(-1.3, 0.8), (-0.1, 1.2), (-0.5, 1.0), (-0.9, 0.8), (0.5, 1.3), (0.2, 1.3), (0.6, 1.3), (0.9, 1.3)],
+    'Pandas': [(-1.2, 0.9), (-0.5, 1.1), (0.0, 1.3), (-0.2, 1.2), (1.0, 1.6), (-0.1, 1.2), (0.5, 1.3), (-0.3, 1.0)],
+    'Numpy': [(-1.0, 1.0), (0.6, 1.5), (-1.0, 0.8), (-0.4, 1.0), (0.2, 1.3), (0.3, 1.1), (1.0, 1.5), (-0.6, 0.9)],
+    'Tensorflow': [(-1.0, 0.8), (0.7, 1.4), (0.8, 1.4), (-0.1, 1.2), (0.2, 1.2), (0.0, 1.1), (0.5, 1.2), (1.2, 1.5)],
+    'Pytorch': [(-0.8, 0.9), (0.3, 1.4), (-0.2, 1.2), (0.2, 1.3), (0.5, 1.3), (0.6, 1.3), (0.1, 1.1), (0.8, 1.3)],
+}
+
+GENERAL_QUESTION_RATINGS = [(-0.8, 0.8), (-1.5, 0.6), (-0.5, 1.0), (-0.3, 1.0), (-1.0, 0.8), (0.5, 1.2), (-0.2, 1.1), (0.3, 1.1)]
+
 # Position-specific question weights
 POSITION_TECH_MAPPING = {
     'frontend': ['react', 'angular', 'vue', 'javascript', 'typescript', 'html', 'css'],
@@ -332,6 +671,9 @@ POSITION_TECH_MAPPING = {
 APP_CONFIG = {
     'max_questions': 5,
     'min_questions': 3,
+    # Choose technical questions one at a time for the running skill estimate
+    # and stop once it is confident (see adaptive_questions.py)
+    'adaptive_questions': False,
     'session_timeout': 3600,  # 1 hour in seconds
     'max_tech_stack_items': 10,
     'conversation_stages': [
@@ -0,0 +1,334 @@
+"""
+Prebuilt config artifact for TalentScout Hiring Assistant
+Compiles the question bank and keyword tables in config.py, plus what is
+derived from them, into one versioned file that is memory-mapped and decoded
+lazily; a watcher swaps new versions in without restarting the app
+
+Usage:
+    python config_artifact.py build -o talentscout-config.bin                  # from config.py
+    python config_artifact.py build --source edited_config.py -o talentscout-config.bin
+    python config_artifact.py show talentscout-config.bin
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import runpy
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
+
+import adaptive_questions
+import answer_scoring
+import config
+import question_index
+import tech_matcher
+from adaptive_questions import ItemBank, question_ratings
+from answer_scoring import AnswerScorer, question_keypoints
+from question_index import QuestionIndex
+from tech_matcher import TechMatcher, build_alias_table
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TSCONFIG"
+FORMAT_VERSION = 2
+# Magic, then the header length, then the JSON header; sections follow, 8-byte aligned
+_PREAMBLE = struct.Struct("<8sI")
+_ALIGN = 8
+
+# config.py tables that make up a version, by section name
+SOURCE_TABLES = {
+    "tech_keywords": "TECH_KEYWORDS",
+    "tech_aliases": "TECH_ALIASES",
+    "question_templates": "QUESTION_TEMPLATES",
+    "general_questions": "GENERAL_QUESTIONS",
+    "question_keypoints": "QUESTION_KEYPOINTS",
+    "general_question_keypoints": "GENERAL_QUESTION_KEYPOINTS",
+    "question_ratings": "QUESTION_RATINGS",
+    "general_question_ratings": "GENERAL_QUESTION_RATINGS",
+    "position_tech_mapping": "POSITION_TECH_MAPPING",
+}
+
+
+@dataclass(frozen=True)
+class Catalog:
+    """Everything built from one version of the config tables
+
+    Replaced as a whole, so a caller that holds on to one catalog for an
+    operation never sees a matcher from one version and questions from another.
+    """
+    version: str
+    tech_matcher: TechMatcher
+    question_index: QuestionIndex
+    answer_scorer: AnswerScorer
+    item_bank: ItemBank
+
+
+def config_tables(namespace: Mapping) -> Dict:
+    """The source tables of a config module (or its run_path namespace)"""
+    return {section: namespace[name] for section, name in SOURCE_TABLES.items()}
+
+
+def table_version(tables: Mapping) -> str:
+    """Content hash of the source tables, so rebuilding unchanged config keeps the version"""
+    canonical = json.dumps([tables[section] for section in SOURCE_TABLES], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+_current: Optional[Catalog] = None
+_current_lock = threading.Lock()
+
+
+def current_catalog() -> Catalog:
+    """The catalog in use; config.py as imported until an artifact is loaded"""
+    catalog = _current
+    if catalog is None:
+        with _current_lock:
+            if _current is None:
+                # Built on first use rather than at import, to keep startup fast
+                install(Catalog(table_version(config_tables(vars(config))), tech_matcher.TECH_MATCHER,
+                                question_index.QUESTION_INDEX, answer_scoring.ANSWER_SCORER,
+                                adaptive_questions.ITEM_BANK))
+            catalog = _current
+    return catalog
+
+
+def install(catalog: Catalog) -> None:
+    global _current
+    _current = catalog
+
+
+def _retired(previous: Optional[Catalog], index: QuestionIndex) -> Dict[str, str]:
+    """Question texts of the previous bank whose ids the new bank no longer has (or has with other text)"""
+    if previous is None:
+        return {}
+    return {qid: text for qid, text in previous.question_index.text.items() if index.text.get(qid) != text}
+
+
+def build_catalog(tables: Mapping, previous: Optional[Catalog] = None) -> Catalog:
+    """Build every derived structure from the source tables; raises ValueError on inconsistent tables"""
+    index = QuestionIndex(tables["question_templates"], tables["general_questions"], tables["position_tech_mapping"])
+    retired = _retired(previous, index)
+    if retired:
+        index = QuestionIndex(tables["question_templates"], tables["general_questions"],
+                              tables["position_tech_mapping"], index.ranked_lists, retired)
+    scorer = AnswerScorer(question_keypoints(index, tables["question_keypoints"], tables["general_question_keypoints"]))
+    matcher = TechMatcher.from_alias_table(
+        build_alias_table(tables["tech_keywords"], tables["tech_aliases"]), tables["question_templates"])
+    item_bank = ItemBank(question_ratings(index, tables["question_ratings"], tables["general_question_ratings"]))
+    return Catalog(table_version(tables), matcher, index, scorer, item_bank)
+
+
+def write_artifact(tables: Mapping, path: str) -> str:
+    """Compile the tables into an artifact at path, replacing it atomically; returns the version"""
+    import numpy as np
+
+    catalog = build_catalog(tables)
+    vocabulary, rows, term_ids, weights = catalog.answer_scorer.state()
+    sections = {
+        **{section: tables[section] for section in SOURCE_TABLES},
+        "alias_table": build_alias_table(tables["tech_keywords"], tables["tech_aliases"]),
+        "ranked": [[tech, family, list(ids)] for (tech, family), ids in catalog.question_index.ranked_lists.items()],
+        "scorer_vocabulary": vocabulary,
+        "scorer_rows": rows,
+        "scorer_term_ids": term_ids,
+        "scorer_weights": weights,
+    }
+
+    blobs, entries, offset = [], {}, 0
+    for name, value in sections.items():
+        if isinstance(value, np.ndarray):
+            array = np.ascontiguousarray(value)
+            blob = array.tobytes()
+            entries[name] = [offset, len(blob), array.dtype.str, list(array.shape)]
+        else:
+            blob = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            entries[name] = [offset, len(blob)]
+        blob += b"\0" * (-len(blob) % _ALIGN)
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({
+        "format": FORMAT_VERSION,
+        "version": catalog.version,
+        "built_at": time.time(),
+        "sections": entries,
+    }).encode("utf-8")
+    header += b" " * (-(_PREAMBLE.size + len(header)) % _ALIGN)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    # Readers either see the old file or the complete new one
+    os.replace(tmp_path, path)
+    return catalog.version
+
+
+class ConfigArtifact:
+    """A memory-mapped artifact; sections are decoded on first access
+
+    Scorer tables are used in place from the mapping, without a copy. The
+    artifact is replaced by rename, so a mapping stays valid after a rebuild.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _PREAMBLE.size:
+            raise ValueError(f"{path} is not a config artifact")
+        magic, header_length = _PREAMBLE.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a config artifact")
+        header = json.loads(self._map[_PREAMBLE.size:_PREAMBLE.size + header_length])
+        if header.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported config artifact format: {header.get('format')!r}")
+        self.version: str = header["version"]
+        self.built_at: float = header["built_at"]
+        self._entries: Dict[str, list] = header["sections"]
+        self._base = _PREAMBLE.size + header_length
+        self._decoded: Dict[str, object] = {}
+
+    @property
+    def section_sizes(self) -> Dict[str, int]:
+        return {name: entry[1] for name, entry in self._entries.items()}
+
+    def section(self, name: str):
+        value = self._decoded.get(name)
+        if value is None:
+            entry = self._entries[name]
+            offset, length = self._base + entry[0], entry[1]
+            if len(entry) > 2:
+                import numpy as np
+
+                value = np.frombuffer(self._map, dtype=entry[2], count=int(np.prod(entry[3])), offset=offset)
+                value = value.reshape(entry[3])
+            else:
+                value = json.loads(self._map[offset:offset + length])
+            self._decoded[name] = value
+        return value
+
+    def catalog(self, previous: Optional[Catalog] = None) -> Catalog:
+        """Build the catalog from the precomputed sections"""
+        templates = self.section("question_templates")
+        ranked = {(tech, family): ids for tech, family, ids in self.section("ranked")}
+        index = QuestionIndex(templates, self.section("general_questions"), self.section("position_tech_mapping"), ranked)
+        retired = _retired(previous, index)
+        if retired:
+            index = QuestionIndex(templates, self.section("general_questions"),
+                                  self.section("position_tech_mapping"), ranked, retired)
+        scorer = AnswerScorer.from_state(self.section("scorer_vocabulary"), self.section("scorer_rows"),
+                                         self.section("scorer_term_ids"), self.section("scorer_weights"))
+        matcher = TechMatcher.from_alias_table(self.section("alias_table"), templates)
+        item_bank = ItemBank(question_ratings(index, self.section("question_ratings"),
+                                              self.section("general_question_ratings")))
+        return Catalog(self.version, matcher, index, scorer, item_bank)
+
+
+def load_config(path: str) -> Catalog:
+    """Load an artifact and make it the current catalog"""
+    catalog = ConfigArtifact(path).catalog(_current)
+    install(catalog)
+    logger.info("Loaded config version %s from %s", catalog.version, path)
+    return catalog
+
+
+class ConfigWatcher:
+    """Polls an artifact file and installs new versions as they appear
+
+    A version that fails to load is logged and skipped; the previous one
+    keeps serving. Sessions asked a question that a new version dropped can
+    still read it (see QuestionIndex's retired ids).
+    """
+
+    def __init__(self, path: str, interval: float = 2.0):
+        self.path = path
+        self.interval = interval
+        self._signature = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def check(self) -> bool:
+        """Install the artifact if the file changed since the last check; True if a new version went live"""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            artifact = ConfigArtifact(self.path)
+            # Not current_catalog(): at startup that would build config.py's catalog only to replace it
+            previous = _current
+            if previous is not None and artifact.version == previous.version:
+                return False
+            install(artifact.catalog(previous))
+        except Exception:
+            # A half-written or corrupt file can fail anywhere in decoding (JSON, struct, NumPy)
+            logger.exception("Failed to load config artifact %s; keeping version %s",
+                             self.path, current_catalog().version)
+            return False
+        logger.info("Switched to config version %s", artifact.version)
+        return True
+
+    def start(self) -> "ConfigWatcher":
+        self.check()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # e.g. stat() failing for a reason other than a missing file; try again next time
+                logger.exception("Failed to check config artifact %s", self.path)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build or inspect the prebuilt config artifact")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="compile config tables into an artifact")
+    build.add_argument("--source", help="config module to compile (default: config.py)")
+    build.add_argument("-o", "--output", default="talentscout-config.bin")
+    show = commands.add_parser("show", help="print an artifact's version and sections")
+    show.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        namespace = runpy.run_path(args.source) if args.source else vars(config)
+        version = write_artifact(config_tables(namespace), args.output)
+        print(f"wrote config version {version} to {args.output}", file=sys.stderr)
+        return 0
+
+    artifact = ConfigArtifact(args.path)
+    print(f"version {artifact.version}, built {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(artifact.built_at))}")
+    for name, size in artifact.section_sizes.items():
+        print(f"  {name}: {size} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""
+Duplicate-applicant detection for TalentScout Hiring Assistant
+Hash indexes on normalized email and phone digits for exact matches, and a
+MinHash/LSH index on names for near-duplicates ("Jon Smith" / "John Smith")
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_NON_DIGITS = re.compile(r"\D")
+_NAME_TOKEN = re.compile(r"[a-z]+")
+
+# Domains where dots in the local part are ignored by the provider
+_DOTLESS_DOMAINS = {"gmail.com": "gmail.com", "googlemail.com": "gmail.com"}
+
+# Phone numbers are compared on their last 10 digits, so "+1 555 010 1234"
+# and "(555) 010-1234" are the same number
+PHONE_KEY_DIGITS = 10
+
+# MinHash signature of NAME_BANDS bands of NAME_ROWS rows. Names with
+# Jaccard similarity s share a band with probability 1 - (1 - s^rows)^bands:
+# about 0.89 at s = 0.7 and 0.06 at s = 0.3. Candidates are then verified
+# on their exact shingle similarity.
+NAME_BANDS = 8
+NAME_ROWS = 4
+NAME_SIMILARITY = 0.7
+# Distinct names compared per lookup, most shared bands first
+MAX_NAME_CANDIDATES = 16
+# Bands shared by more distinct names than this narrow nothing down and are skipped
+MAX_BAND_NAMES = 256
+
+# Applicants saved by other processes are read back from the candidate store
+# by a background thread every SYNC_INTERVAL seconds. Rows are re-read this
+# many seconds behind the newest one seen, to catch write-behind batches
+# committed out of timestamp order; rows already synced are skipped.
+SYNC_INTERVAL = 1.0
+SYNC_LAG = 5.0
+
+_MERSENNE31 = (1 << 31) - 1
+
+
+def phone_digits(phone: str) -> str:
+    """Digits of a phone number, without spaces, dashes or a leading '+'"""
+    return _NON_DIGITS.sub("", phone or "")
+
+
+def email_key(email: str) -> str:
+    """Mailbox an address delivers to: case, "+tag" and Gmail dots removed"""
+    local, at, domain = (email or "").strip().lower().rpartition("@")
+    if not at:
+        return ""
+    local = local.split("+", 1)[0]
+    if domain in _DOTLESS_DOMAINS:
+        domain = _DOTLESS_DOMAINS[domain]
+        local = local.replace(".", "")
+    return f"{local}@{domain}"
+
+
+def phone_key(phone: str) -> str:
+    digits = phone_digits(phone)
+    return digits[-PHONE_KEY_DIGITS:] if len(digits) >= PHONE_KEY_DIGITS else ""
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase ASCII words in sorted order ("Smith, José" -> "jose smith")"""
+    folded = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(sorted(_NAME_TOKEN.findall(folded)))
+
+
+def name_shingles(name: str) -> FrozenSet[str]:
+    """Character bigrams of a normalized name, with word boundaries"""
+    padded = f" {name} "
+    return frozenset(padded[i:i + 2] for i in range(len(padded) - 1)) if name else frozenset()
+
+
+@lru_cache(maxsize=None)
+def _permutations() -> Tuple["np.ndarray", "np.ndarray"]:
+    # Imported here so that phone and email checks do not load NumPy
+    import numpy as np
+
+    # Fixed permutations, so signatures agree across processes
+    rng = np.random.default_rng(20240611)
+    return (rng.integers(1, _MERSENNE31, NAME_BANDS * NAME_ROWS, dtype=np.uint64),
+            rng.integers(0, _MERSENNE31, NAME_BANDS * NAME_ROWS, dtype=np.uint64))
+
+
+def minhash(shingles: FrozenSet[str]) -> "np.ndarray":
+    """MinHash signature (NAME_BANDS * NAME_ROWS values) of a shingle set"""
+    import numpy as np
+
+    perm_a, perm_b = _permutations()
+    hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+    return ((np.outer(perm_a, hashes) + perm_b[:, None]) % _MERSENNE31).min(axis=1)
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    session_id: str
+    reason: str  # "email", "phone" or "name"
+    similarity: float
+    completed: bool
+
+
+class _Applicant:
+    __slots__ = ("email", "phone", "name", "completed", "synced_at")
+
+    def __init__(self):
+        self.email = ""
+        self.phone = ""
+        self.name = ""
+        self.completed = False
+        # updated_at of the store row last synced, if any
+        self.synced_at = 0.0
+
+
+class _Name:
+    """One distinct normalized name and everyone registered under it"""
+
+    __slots__ = ("shingles", "bands", "sessions")
+
+    def __init__(self, shingles: FrozenSet[str], bands: Tuple[bytes, ...]):
+        self.shingles = shingles
+        self.bands = bands
+        self.sessions: Set[str] = set()
+
+
+class DuplicateIndex:
+    """Earlier applicants by email, phone and name
+
+    Email and phone lookups are a dict hit. Names are grouped by their
+    normalized form and go through an LSH table of MinHash bands. A lookup
+    reads at most NAME_BANDS buckets of MAX_BAND_NAMES and compares at most
+    MAX_NAME_CANDIDATES names, however many applicants there are. Sessions
+    register themselves as they screen. An index built with from_connection
+    can start() a thread that reads applicants saved by other processes from
+    the store, so workers sharing a store see each other's applicants while
+    find() stays an in-memory lookup.
+    """
+
+    def __init__(self, conn=None):
+        self._applicants: Dict[str, _Applicant] = {}
+        self._by_email: Dict[str, Set[str]] = {}
+        self._by_phone: Dict[str, Set[str]] = {}
+        self._names: Dict[str, _Name] = {}
+        self._by_band: Dict[bytes, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._conn = conn
+        self._synced_at = 0.0
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._applicants)
+
+    @classmethod
+    def from_connection(cls, conn) -> "DuplicateIndex":
+        """Load every applicant in a candidate store; start() keeps following it on conn"""
+        index = cls(conn)
+        index.sync()
+        return index
+
+    def sync(self) -> None:
+        """Register applicants saved to the store since the last sync"""
+        if self._conn is None:
+            return
+        with self._sync_lock:
+            rows = self._conn.execute(
+                "SELECT session_id, full_name, email, phone, completed, updated_at FROM candidates "
+                "WHERE updated_at >= ? ORDER BY updated_at",
+                (self._synced_at - SYNC_LAG,),
+            ).fetchall()
+            if rows:
+                self._synced_at = max(self._synced_at, rows[-1]["updated_at"])
+        for row in rows:
+            applicant = self._applicants.get(row["session_id"])
+            if applicant is not None and applicant.synced_at == row["updated_at"]:
+                continue
+            self.register(row["session_id"], row["full_name"], row["email"], row["phone"], bool(row["completed"]),
+                          synced_at=row["updated_at"])
+
+    def start(self, interval: float = SYNC_INTERVAL) -> "DuplicateIndex":
+        """Sync from the store every interval seconds on a background thread"""
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="duplicate-index-sync", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.sync()
+            except Exception:
+                logger.exception("Failed to sync the duplicate index from the candidate store")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @staticmethod
+    def _unlink(table: Dict, key, session_id: str) -> None:
+        sessions = table.get(key)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del table[key]
+
+    @staticmethod
+    def _bands(shingles: FrozenSet[str]) -> Tuple[bytes, ...]:
+        signature = minhash(shingles).astype("<u4")
+        return tuple(
+            bytes([band]) + signature[band * NAME_ROWS:(band + 1) * NAME_ROWS].tobytes()
+            for band in range(NAME_BANDS)
+        )
+
+    def _link_name(self, name: str, session_id: str) -> None:
+        group = self._names.get(name)
+        if group is None:
+            shingles = name_shingles(name)
+            group = self._names[name] = _Name(shingles, self._bands(shingles))
+            for band in group.bands:
+                self._by_band.setdefault(band, set()).add(name)
+        group.sessions.add(session_id)
+
+    def _unlink_name(self, name: str, session_id: str) -> None:
+        group = self._names.get(name)
+        if group is None:
+            return
+        group.sessions.discard(session_id)
+        if not group.sessions:
+            del self._names[name]
+            for band in group.bands:
+                self._unlink(self._by_band, band, name)
+
+    def register(self, session_id: str, name: str = "", email: str = "", phone: str = "",
+                 completed: bool = False, synced_at: Optional[float] = None) -> None:
+        """Add or update an applicant; empty fields leave earlier values alone"""
+        email, phone, name = email_key(email), phone_key(phone), normalize_name(name)
+        with self._lock:
+            applicant = self._applicants.get(session_id)
+            if applicant is None:
+                applicant = self._applicants[session_id] = _Applicant()
+            applicant.completed = applicant.completed or completed
+            if synced_at is not None:
+                applicant.synced_at = synced_at
+            if email and email != applicant.email:
+                self._unlink(self._by_email, applicant.email, session_id)
+                applicant.email = email
+                self._by_email.setdefault(email, set()).add(session_id)
+            if phone and phone != applicant.phone:
+                self._unlink(self._by_phone, applicant.phone, session_id)
+                applicant.phone = phone
+                self._by_phone.setdefault(phone, set()).add(session_id)
+            if name and name != applicant.name:
+                self._unlink_name(applicant.name, session_id)
+                applicant.name = name
+                self._link_name(name, session_id)
+
+    def remove(self, session_id: str) -> None:
+        with self._lock:
+            applicant = self._applicants.pop(session_id, None)
+            if applicant is None:
+                return
+            self._unlink(self._by_email, applicant.email, session_id)
+            self._unlink(self._by_phone, applicant.phone, session_id)
+            self._unlink_name(applicant.name, session_id)
+
+    def _pick(self, session_ids: Iterable[str], exclude: str) -> Optional[str]:
+        """An earlier session other than exclude, preferring completed screenings"""
+        best = None
+        for session_id in session_ids:
+            if session_id == exclude:
+                continue
+            if self._applicants[session_id].completed:
+                return session_id
+            best = best or session_id
+        return best
+
+    def _similar_name(self, name: str, exclude: str) -> Optional[Tuple[float, str]]:
+        group = self._names.get(name)
+        if group is not None:
+            shingles, bands = group.shingles, group.bands
+        else:
+            shingles = name_shingles(name)
+            bands = self._bands(shingles)
+        shared: Counter = Counter()
+        for band in bands:
+            names = self._by_band.get(band, ())
+            if len(names) <= MAX_BAND_NAMES:
+                shared.update(names)
+
+        best = None
+        for other, _ in shared.most_common(MAX_NAME_CANDIDATES):
+            other_group = self._names[other]
+            similarity = _jaccard(shingles, other_group.shingles)
+            if similarity < NAME_SIMILARITY or (best is not None and similarity <= best[0]):
+                continue
+            session_id = self._pick(other_group.sessions, exclude)
+            if session_id is not None:
+                best = (similarity, session_id)
+        return best
+
+    def find(self, name: str = "", email: str = "", phone: str = "", exclude: str = "") -> List[DuplicateMatch]:
+        """Earlier applicants matching any of the details, exact matches first"""
+        matches: List[DuplicateMatch] = []
+        email, phone, name = email_key(email), phone_key(phone), normalize_name(name)
+        with self._lock:
+            for reason, table, key in (("email", self._by_email, email), ("phone", self._by_phone, phone)):
+                session_id = self._pick(table.get(key, ()), exclude) if key else None
+                if session_id is not None:
+                    matches.append(DuplicateMatch(session_id, reason, 1.0, self._applicants[session_id].completed))
+            similar = self._similar_name(name, exclude) if name else None
+            if similar is not None:
+                similarity, session_id = similar
+                matches.append(DuplicateMatch(session_id, "name", round(similarity, 3),
+                                              self._applicants[session_id].completed))
+        return matches
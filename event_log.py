@@ -0,0 +1,558 @@
+"""
+Per-turn event log for TalentScout Hiring Assistant
+Appends every turn (input, reply, resulting stage and CandidateInfo changes)
+to segmented, append-only files with group-commit fsync, so sessions can be
+rebuilt after a replica dies and turns can be scanned for analytics
+
+Usage:
+    python event_log.py scan events/ > turns.jsonl              # every turn, oldest first
+    python event_log.py scan events/ --session SESSION_ID
+    python event_log.py replay events/ SESSION_ID               # rebuild a session, print its summary
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from dataclasses import astuple, dataclass, fields
+from typing import AbstractSet, BinaryIO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from assistant import CandidateInfo, HiringAssistant
+from duplicate_index import DuplicateMatch
+
+logger = logging.getLogger(__name__)
+
+# Each record is a header (CRC32, payload length, sequence number) and a
+# compact JSON payload. A record whose header or CRC does not check out ends
+# the segment: it is the torn tail of a write cut short by a crash.
+_HEADER = struct.Struct("<IIQ")
+_SEGMENT_NAME = re.compile(r"^(\d{20})\.log$")
+
+SEGMENT_BYTES = 8 * 1024 * 1024
+# A session is snapshotted on its first logged turn and then every
+# SNAPSHOT_EVERY turns, so rebuilding it never applies more turns than that
+SNAPSHOT_EVERY = 10
+# Sessions whose turn count since the last snapshot is tracked; one that
+# drops out simply gets a new snapshot on its next turn
+MAX_TRACKED_SESSIONS = 100_000
+# Failed writes remembered, so that wait() on one of their records raises
+MAX_TRACKED_FAILURES = 1024
+# Session sets of finished segments an EventLog keeps in memory for replay
+MAX_CACHED_SEGMENTS = 64
+
+_CANDIDATE_FIELDS = tuple(f.name for f in fields(CandidateInfo))
+
+
+def segment_path(directory: str, first_seq: int) -> str:
+    return os.path.join(directory, f"{first_seq:020d}.log")
+
+
+def list_segments(directory: str) -> List[str]:
+    """Segment files of a log, oldest first"""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in sorted(names) if _SEGMENT_NAME.match(name)]
+
+
+def sessions_path(segment: str) -> str:
+    """File listing the sessions of a finished segment, written when the log moves past it"""
+    return segment[:-len(".log")] + ".sessions"
+
+
+def write_segment_sessions(segment: str, session_ids: Iterable[str]) -> None:
+    target = sessions_path(segment)
+    with open(target + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(sorted(session_ids), f)
+    os.replace(target + ".tmp", target)
+
+
+def segment_sessions(segment: str) -> Optional[FrozenSet[str]]:
+    """Sessions with records in a finished segment; None if that is not known"""
+    try:
+        with open(sessions_path(segment), encoding="utf-8") as f:
+            return frozenset(json.load(f))
+    except (OSError, ValueError):
+        return None
+
+
+def _frame(seq: int, payload: bytes) -> bytes:
+    crc = zlib.crc32(payload, zlib.crc32(seq.to_bytes(8, "little")))
+    return _HEADER.pack(crc, len(payload), seq) + payload
+
+
+def _frames(data: bytes) -> Iterator[Tuple[int, int, bytes]]:
+    """(end offset, sequence number, payload) of each intact record"""
+    offset = 0
+    while offset + _HEADER.size <= len(data):
+        crc, length, seq = _HEADER.unpack_from(data, offset)
+        start = offset + _HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload, zlib.crc32(seq.to_bytes(8, "little"))) != crc:
+            return
+        offset = start + length
+        yield offset, seq, payload
+
+
+def read_segment(path: str, session_id: Optional[str] = None) -> Iterator[Dict]:
+    """Records of one segment in order, optionally only one session's"""
+    with open(path, "rb") as f:
+        data = f.read()
+    # Cheap substring tests before decoding; the id is then checked exactly
+    needle = b'"id":' + json.dumps(session_id).encode("utf-8") if session_id is not None else None
+    if needle is not None and needle not in data:
+        return
+    for _, seq, payload in _frames(data):
+        if needle is not None and needle not in payload:
+            continue
+        record = json.loads(payload)
+        if session_id is not None and record.get("id") != session_id:
+            continue
+        record["n"] = seq
+        yield record
+
+
+def scan(directory: str, session_id: Optional[str] = None, kind: Optional[str] = "turn") -> Iterator[Dict]:
+    """Every record of a log in order; turn events only unless kind says otherwise (None for all)"""
+    for path in list_segments(directory):
+        if session_id is not None:
+            sessions = segment_sessions(path)
+            if sessions is not None and session_id not in sessions:
+                continue
+        for record in read_segment(path, session_id):
+            if kind is None or record["k"] == kind:
+                yield record
+
+
+def _state(assistant: HiringAssistant) -> Tuple:
+    """What a turn can change, captured before it to work out the event"""
+    return (
+        assistant.current_stage_index,
+        astuple(assistant.candidate_info),
+        assistant.question_ids,
+        assistant.current_question_index,
+        assistant.conversation_ended,
+        assistant.duplicate_of,
+    )
+
+
+def turn_event(session_id: str, before: Tuple, assistant: HiringAssistant, user_input: str, reply: str) -> Dict:
+    """The record for one turn; only what changed is included besides the stage"""
+    event = {
+        "k": "turn",
+        "id": session_id,
+        "t": time.time(),
+        "u": user_input,
+        "r": reply,
+        "p": before[0],
+        "s": assistant.current_stage_index,
+        "stage": assistant.get_current_stage(),
+    }
+    changes = {
+        name: value for name, old, value in zip(_CANDIDATE_FIELDS, before[1], astuple(assistant.candidate_info))
+        if value != old
+    }
+    if changes:
+        event["c"] = changes
+    if assistant.question_ids != before[2]:
+        event["q"] = list(assistant.question_ids)
+        # Model-generated texts are not in the bank, so they travel with the ids
+        if assistant.generated_questions:
+            event["g"] = dict(assistant.generated_questions)
+    if assistant.current_question_index != before[3]:
+        event["i"] = assistant.current_question_index
+    if assistant.conversation_ended and not before[4]:
+        event["e"] = True
+    if assistant.duplicate_of != before[5] and assistant.duplicate_of is not None:
+        event["d"] = list(astuple(assistant.duplicate_of))
+    return event
+
+
+def apply_turn(assistant: HiringAssistant, event: Dict) -> None:
+    """Replay a turn event onto a session in the state the event started from"""
+    info = assistant.candidate_info
+    for name, value in event.get("c", {}).items():
+        setattr(info, name, list(value) if name == "tech_stack" else value)
+    if event.get("g"):
+        assistant.generated_questions = {sys.intern(qid): text for qid, text in event["g"].items()}
+    if "q" in event:
+        assistant.question_ids = tuple(sys.intern(qid) for qid in event["q"])
+    if "i" in event:
+        # Only an answered technical question moves the index
+        assistant.answers.append(event["u"].strip())
+        assistant.current_question_index = event["i"]
+    assistant.current_stage_index = event["s"]
+    if event.get("e"):
+        assistant.conversation_ended = True
+    if "d" in event:
+        assistant.duplicate_of = DuplicateMatch(*event["d"])
+
+
+@dataclass(frozen=True)
+class ReplayedSession:
+    assistant: HiringAssistant
+    updated_at: float
+    # Turns applied on top of the snapshot
+    replayed_turns: int
+    # (user input, reply) of every logged turn, when asked for
+    transcript: Tuple[Tuple[str, str], ...] = ()
+
+
+def replay_session(directory: str, session_id: str, transcript: bool = False,
+                   sessions: Callable[[str], Optional[AbstractSet[str]]] = segment_sessions
+                   ) -> Optional[ReplayedSession]:
+    """Rebuild a session from its latest snapshot and the turns after it
+
+    Segments are read newest first and reading stops at that snapshot, so
+    the work is bounded by SNAPSHOT_EVERY turns rather than the session's
+    length. With transcript=True reading goes back to the session's first
+    turn. Segments whose session set (see segment_sessions) lacks the
+    session are skipped unread. Returns None for sessions that were never
+    logged or were closed.
+    """
+    newer: List[Dict] = []  # newest first
+    snapshot: Optional[Dict] = None
+    turns: List[Dict] = []  # for the transcript, newest first
+    for path in reversed(list_segments(directory)):
+        holds = sessions(path)
+        if holds is not None and session_id not in holds:
+            continue
+        records = list(read_segment(path, session_id))
+        for record in reversed(records):
+            kind = record["k"]
+            if kind == "close" and snapshot is None and not newer:
+                return None
+            if snapshot is None:
+                if kind == "snapshot":
+                    snapshot = record
+                elif kind == "turn":
+                    newer.append(record)
+            if kind == "turn" and transcript:
+                turns.append(record)
+        if snapshot is not None and (not transcript or (turns and turns[-1]["p"] == 0)):
+            break
+    if snapshot is None:
+        return None
+
+    assistant = HiringAssistant.restore(json.dumps(snapshot["a"], ensure_ascii=False).encode("utf-8"))
+    for event in reversed(newer):
+        apply_turn(assistant, event)
+    return ReplayedSession(
+        assistant=assistant,
+        updated_at=newer[0]["t"] if newer else snapshot["t"],
+        replayed_turns=len(newer),
+        transcript=tuple((event["u"], event["r"]) for event in reversed(turns)),
+    )
+
+
+class TurnStart:
+    """State of a session before a turn, from EventLog.begin_turn()"""
+
+    __slots__ = ("session_id", "assistant", "state")
+
+    def __init__(self, session_id: str, assistant: HiringAssistant):
+        self.session_id = session_id
+        self.assistant = assistant
+        self.state = _state(assistant)
+
+
+class EventLog:
+    """Append-only, segmented log of screening turns
+
+    append() frames a record and hands it to a writer thread, which writes
+    everything queued since its last pass and fsyncs once for the lot, so
+    concurrent turns share an fsync. wait() blocks until a record is on disk.
+    Segments roll over at segment_bytes and are never rewritten; on open,
+    a torn record at the end of the last one is cut off. One process writes
+    a log directory; any number can read it.
+
+    A write that fails is cut back off the segment (or, if even that fails,
+    the segment is abandoned and the next write starts a new one), so the
+    records after it stay readable; wait() on a lost record raises OSError.
+
+    The sessions of each segment are tracked as it is written and saved next
+    to it when the log moves on, so replay() only reads segments that hold
+    the session; an unknown id costs set lookups, not a read of the log.
+    """
+
+    def __init__(self, directory: str = "talentscout-events", segment_bytes: int = SEGMENT_BYTES,
+                 snapshot_every: int = SNAPSHOT_EVERY, fsync: bool = True, wait_for_commit: bool = True):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        # Whether end_turn() blocks until the turn is durable; without it a
+        # crash can lose the turns of the last commit
+        self.wait_for_commit = wait_for_commit
+
+        os.makedirs(directory, exist_ok=True)
+        segments = list_segments(directory)
+        for finished in segments[:-1]:
+            # Logs written before session files existed, or a crash mid-rotation
+            if segment_sessions(finished) is None:
+                write_segment_sessions(finished, {record["id"] for record in read_segment(finished)})
+        self._next_seq = 1
+        # Sessions with records in the segment being written
+        self._sessions: Set[str] = set()
+        if segments:
+            path = segments[-1]
+            self._next_seq, self._sessions = self._recover(path)
+        else:
+            path = segment_path(directory, self._next_seq)
+        # Unbuffered, so a failed write leaves nothing behind to be flushed later
+        self._file: Optional[BinaryIO] = open(path, "ab", buffering=0)
+        self._path = path
+        self._sealed: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        # Highest sequence number the writer is done with, written or failed
+        self._committed = self._next_seq - 1
+        self._failures: "deque[Tuple[int, int, OSError]]" = deque(maxlen=MAX_TRACKED_FAILURES)
+        self._failed_records = 0
+        self._reported_failures = 0
+
+        self._turns_since_snapshot: "OrderedDict[str, int]" = OrderedDict()
+        self._pending: List[Tuple[int, bytes, str]] = []
+        self._closing = False
+        self._cond = threading.Condition()
+        self._writer = threading.Thread(target=self._run_writer, name="event-log-writer", daemon=True)
+        self._writer.start()
+
+    @staticmethod
+    def _recover(path: str) -> Tuple[int, Set[str]]:
+        """Cut a torn tail off the last segment; returns the next sequence number and its sessions"""
+        with open(path, "rb") as f:
+            data = f.read()
+        end, next_seq = 0, int(_SEGMENT_NAME.match(os.path.basename(path)).group(1))
+        sessions = set()
+        for end, seq, payload in _frames(data):
+            next_seq = seq + 1
+            sessions.add(json.loads(payload)["id"])
+        if end < len(data):
+            logger.warning("Truncating %d bytes of torn records from %s", len(data) - end, path)
+            os.truncate(path, end)
+        # The segment is written to again, so a session file from a crash mid-rotation is out of date
+        try:
+            os.remove(sessions_path(path))
+        except FileNotFoundError:
+            pass
+        return next_seq, sessions
+
+    def append(self, record: Dict) -> int:
+        """Queue a record for writing; returns its sequence number"""
+        payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("EventLog is closed")
+            seq = self._next_seq
+            self._next_seq += 1
+            self._pending.append((seq, _frame(seq, payload), record["id"]))
+            self._cond.notify_all()
+        return seq
+
+    def _wait_done(self, seq: int) -> None:
+        # Caller holds self._cond
+        while self._committed < seq:
+            self._cond.wait()
+
+    def wait(self, seq: int) -> None:
+        """Block until the record with this sequence number is on disk; OSError if writing it failed"""
+        with self._cond:
+            self._wait_done(seq)
+            for first, last, error in self._failures:
+                if first <= seq <= last:
+                    raise OSError(error.errno, f"Event log record {seq} was not written: {error.strerror or error}")
+
+    def flush(self) -> None:
+        """Block until everything appended so far is on disk
+
+        Raises OSError if a write failed since the last flush().
+        """
+        with self._cond:
+            self._wait_done(self._next_seq - 1)
+            failed = self._failed_records - self._reported_failures
+            if not failed:
+                return
+            self._reported_failures = self._failed_records
+            error = self._failures[-1][2]
+        raise OSError(error.errno, f"{failed} event log records were not written: {error.strerror or error}")
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._writer.join()
+        if self._file is not None:
+            self._file.close()
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                batch, self._pending = self._pending, []
+                if not batch:
+                    return
+            error = None
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # Anything escaping here would end the thread and leave waiters blocked forever
+                logger.exception("Failed to write %d event log records", len(batch))
+                error = e if isinstance(e, OSError) else OSError(str(e))
+            with self._cond:
+                if error is not None:
+                    self._failures.append((batch[0][0], batch[-1][0], error))
+                    self._failed_records += len(batch)
+                else:
+                    self._sessions.update(session_id for _, _, session_id in batch)
+                self._committed = batch[-1][0]
+                self._cond.notify_all()
+
+    def _write_batch(self, batch: List[Tuple[int, bytes, str]]) -> None:
+        if self._file is None or self._file.tell() >= self.segment_bytes:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._seal()
+            path = segment_path(self.directory, batch[0][0])
+            self._file = open(path, "ab", buffering=0)
+            with self._cond:
+                self._path, self._sessions = path, set()
+            if self.fsync and hasattr(os, "O_DIRECTORY"):
+                # Make the new segment's directory entry durable too
+                fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        start = self._file.tell()
+        try:
+            data = memoryview(b"".join(frame for _, frame, _ in batch))
+            while data:
+                data = data[self._file.write(data):]
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except OSError:
+            self._discard(start)
+            raise
+
+    def _seal(self) -> None:
+        """Save the sessions of the segment the log is moving past"""
+        sessions = frozenset(self._sessions)
+        try:
+            write_segment_sessions(self._path, sessions)
+        except OSError:
+            # replay then reads the whole segment
+            logger.exception("Failed to write the session file for %s", self._path)
+        self._remember(self._path, sessions)
+
+    def _remember(self, path: str, sessions: FrozenSet[str]) -> None:
+        with self._cond:
+            self._sealed[path] = sessions
+            self._sealed.move_to_end(path)
+            while len(self._sealed) > MAX_CACHED_SEGMENTS:
+                self._sealed.popitem(last=False)
+
+    def _segment_sessions(self, path: str) -> Optional[AbstractSet[str]]:
+        with self._cond:
+            if path == self._path:
+                return self._sessions
+            sessions = self._sealed.get(path)
+        if sessions is None:
+            sessions = segment_sessions(path)
+            if sessions is not None:
+                self._remember(path, sessions)
+        return sessions
+
+    def _discard(self, offset: int) -> None:
+        """Cut a failed write off the segment; a torn record mid-segment would hide every one after it"""
+        try:
+            os.ftruncate(self._file.fileno(), offset)
+            self._file.seek(offset)
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except OSError:
+            logger.exception("Failed to truncate %s; the next write starts a new segment", self._file.name)
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def begin_turn(self, session_id: str, assistant: HiringAssistant) -> TurnStart:
+        """Call before a turn; snapshots the session when one is due"""
+        with self._cond:
+            since = self._turns_since_snapshot.get(session_id)
+            due = since is None or since >= self.snapshot_every
+            if due:
+                self._turns_since_snapshot[session_id] = 0
+                self._turns_since_snapshot.move_to_end(session_id)
+                while len(self._turns_since_snapshot) > MAX_TRACKED_SESSIONS:
+                    self._turns_since_snapshot.popitem(last=False)
+        if due:
+            self.append({"k": "snapshot", "id": session_id, "t": time.time(), "a": json.loads(assistant.snapshot())})
+        return TurnStart(session_id, assistant)
+
+    def end_turn(self, start: TurnStart, user_input: str, reply: str) -> int:
+        """Log a turn begun with begin_turn(); returns the event's sequence number"""
+        assistant = start.assistant
+        with self._cond:
+            if assistant.conversation_ended:
+                self._turns_since_snapshot.pop(start.session_id, None)
+            elif start.session_id in self._turns_since_snapshot:
+                self._turns_since_snapshot[start.session_id] += 1
+        seq = self.append(turn_event(start.session_id, start.state, assistant, user_input, reply))
+        if self.wait_for_commit:
+            self.wait(seq)
+        return seq
+
+    def close_session(self, session_id: str) -> None:
+        """Record that a session was dropped, so replay() no longer rebuilds it"""
+        with self._cond:
+            self._turns_since_snapshot.pop(session_id, None)
+        self.append({"k": "close", "id": session_id, "t": time.time()})
+
+    def replay(self, session_id: str, transcript: bool = False) -> Optional[ReplayedSession]:
+        with self._cond:
+            # Lost records are not an error here: replay reads what is on disk
+            self._wait_done(self._next_seq - 1)
+        return replay_session(self.directory, session_id, transcript, self._segment_sessions)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Read the per-turn event log")
+    commands = parser.add_subparsers(dest="command", required=True)
+    scan_parser = commands.add_parser("scan", help="print turn events as JSONL")
+    scan_parser.add_argument("directory")
+    scan_parser.add_argument("--session", help="only this session's turns")
+    replay_parser = commands.add_parser("replay", help="rebuild a session and print its summary")
+    replay_parser.add_argument("directory")
+    replay_parser.add_argument("session_id")
+    args = parser.parse_args(argv)
+
+    if args.command == "scan":
+        for record in scan(args.directory, args.session):
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return 0
+
+    replayed = replay_session(args.directory, args.session_id)
+    if replayed is None:
+        print(f"no logged session {args.session_id}", file=sys.stderr)
+        return 1
+    assistant = replayed.assistant
+    print(f"stage {assistant.get_current_stage()}, last turn "
+          f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(replayed.updated_at))}, "
+          f"{replayed.replayed_turns} turns replayed after the snapshot")
+    print(assistant.get_candidate_summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
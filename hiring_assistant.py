@@ -1,22 +1,22 @@
 import streamlit as st
 import json
-import re
-from datetime import datetime
-from typing import Dict, List, Optional
-import openai
-from dataclasses import dataclass, asdict
+from typing import Optional
 import os
-
-# Configure page
-st.set_page_config(
-    page_title="TalentScout - AI Hiring Assistant",
-    page_icon="🤖",
-    layout="wide",
-    initial_sidebar_state="collapsed"
-)
+import time
+import uuid
+
+from assistant import HiringAssistant
+from candidate_store import CandidateStore, connect
+from config_artifact import ConfigWatcher, current_catalog
+from duplicate_index import DuplicateIndex
+from event_log import EventLog
+from metrics import serve_metrics
+from question_cache import QuestionCache
+from question_generator import QuestionGenerator
+from session_store import SESSION_TTL, SessionStore, open_session_store
 
 # Custom CSS for better UI
-st.markdown("""
+CUSTOM_CSS = """
 <style>
 .main-header {
     text-align: center;
@@ -53,378 +53,309 @@ st.markdown("""
     margin: 1rem 0;
 }
 </style>
-""", unsafe_allow_html=True)
-
-@dataclass
-class CandidateInfo:
-    full_name: str = ""
-    email: str = ""
-    phone: str = ""
-    experience_years: str = ""
-    desired_position: str = ""
-    location: str = ""
-    tech_stack: List[str] = None
-    
-    def __post_init__(self):
-        if self.tech_stack is None:
-            self.tech_stack = []
-
-class HiringAssistant:
-    def __init__(self):
-        self.conversation_stages = [
-            "greeting",
-            "name_collection",
-            "email_collection", 
-            "phone_collection",
-            "experience_collection",
-            "position_collection",
-            "location_collection",
-            "tech_stack_collection",
-            "technical_questions",
-            "conclusion"
-        ]
-        self.current_stage_index = 0
-        self.candidate_info = CandidateInfo()
-        self.technical_questions = []
-        self.current_question_index = 0
-        self.conversation_ended = False
-        
-    def get_current_stage(self):
-        if self.current_stage_index < len(self.conversation_stages):
-            return self.conversation_stages[self.current_stage_index]
-        return "conclusion"
-    
-    def advance_stage(self):
-        self.current_stage_index += 1
-    
-    def is_exit_keyword(self, user_input: str) -> bool:
-        exit_keywords = ["bye", "goodbye", "exit", "quit", "end", "stop", "finish"]
-        return any(keyword in user_input.lower() for keyword in exit_keywords)
-    
-    def validate_email(self, email: str) -> bool:
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
-    
-    def validate_phone(self, phone: str) -> bool:
-        # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
-        # Check if it has 10-15 digits (common phone number lengths)
-        return 10 <= len(digits_only) <= 15
-    
-    def extract_tech_stack(self, user_input: str) -> List[str]:
-        # Common tech stack keywords
-        tech_keywords = [
-            # Programming Languages
-            "python", "java", "javascript", "typescript", "c++", "c#", "php", "ruby", "go", "rust", "kotlin", "swift",
-            # Frontend
-            "react", "angular", "vue", "html", "css", "bootstrap", "tailwind",
-            # Backend
-            "node.js", "express", "django", "flask", "spring", "laravel", "rails",
-            # Databases
-            "mysql", "postgresql", "mongodb", "redis", "sqlite", "oracle",
-            # Cloud & DevOps
-            "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "git",
-            # Others
-            "tensorflow", "pytorch", "pandas", "numpy", "rest", "graphql"
-        ]
-        
-        found_tech = []
-        user_lower = user_input.lower()
-        
-        for tech in tech_keywords:
-            if tech in user_lower:
-                found_tech.append(tech.title())
-        
-        return found_tech
-    
-    def generate_technical_questions(self, tech_stack: List[str]) -> List[str]:
-        """Generate technical questions based on the candidate's tech stack"""
-        questions = []
-        
-        # Question templates for different technologies
-        question_templates = {
-            "Python": [
-                "What is the difference between list and tuple in Python?",
-                "Explain Python's GIL (Global Interpreter Lock).",
-                "How do you handle exceptions in Python?"
-            ],
-            "Java": [
-                "What is the difference between JDK, JRE, and JVM?",
-                "Explain the concept of polymorphism in Java.",
-                "What are the main principles of OOP in Java?"
-            ],
-            "Javascript": [
-                "What is the difference between == and === in JavaScript?",
-                "Explain closures in JavaScript with an example.",
-                "What is the event loop in JavaScript?"
-            ],
-            "React": [
-                "What is the difference between state and props in React?",
-                "Explain the React component lifecycle.",
-                "What are React Hooks and why are they useful?"
-            ],
-            "Django": [
-                "What is Django ORM and how does it work?",
-                "Explain the MVC pattern in Django.",
-                "What are Django middlewares and their use cases?"
-            ],
-            "Node.js": [
-                "What is the event-driven architecture in Node.js?",
-                "Explain the difference between synchronous and asynchronous programming.",
-                "What are callbacks, promises, and async/await?"
-            ],
-            "Mysql": [
-                "What is the difference between INNER JOIN and LEFT JOIN?",
-                "Explain database normalization and its types.",
-                "What are indexes and how do they improve query performance?"
-            ],
-            "Aws": [
-                "What are the main AWS services you've worked with?",
-                "Explain the difference between EC2 and Lambda.",
-                "What is the purpose of AWS S3 and its use cases?"
-            ]
-        }
-        
-        # Generate questions for each technology in the stack
-        for tech in tech_stack[:3]:  # Limit to 3 technologies to avoid too many questions
-            if tech in question_templates:
-                tech_questions = question_templates[tech]
-                questions.extend(tech_questions[:2])  # Take 2 questions per technology
-        
-        # If no specific questions found, add general questions
-        if not questions:
-            questions = [
-                "Describe a challenging technical problem you've solved recently.",
-                "How do you stay updated with new technologies in your field?",
-                "What's your approach to debugging code?",
-                "How do you ensure code quality in your projects?"
-            ]
-        
-        return questions[:5]  # Limit to 5 questions maximum
-    
-    def get_response(self, user_input: str) -> str:
-        if self.is_exit_keyword(user_input):
-            self.conversation_ended = True
-            return "Thank you for your time! We'll review your information and get back to you soon. Have a great day! 👋"
-        
-        current_stage = self.get_current_stage()
-        
-        if current_stage == "greeting":
-            self.advance_stage()
-            return """Hello! 👋 Welcome to TalentScout's AI Hiring Assistant! 
-
-I'm here to help with your initial screening for technology positions. I'll gather some basic information about you and ask a few technical questions based on your expertise.
-
-This should take about 5-10 minutes. You can type 'exit' or 'bye' anytime to end our conversation.
-
-Let's get started! What's your full name?"""
-
-        elif current_stage == "name_collection":
-            if user_input.strip():
-                self.candidate_info.full_name = user_input.strip()
-                self.advance_stage()
-                return f"Nice to meet you, {self.candidate_info.full_name}! 😊\n\nCould you please provide your email address?"
-            else:
-                return "Please provide your full name to continue."
-
-        elif current_stage == "email_collection":
-            if self.validate_email(user_input.strip()):
-                self.candidate_info.email = user_input.strip()
-                self.advance_stage()
-                return "Great! Now, what's your phone number?"
-            else:
-                return "Please provide a valid email address (e.g., john@example.com)."
-
-        elif current_stage == "phone_collection":
-            if self.validate_phone(user_input.strip()):
-                self.candidate_info.phone = user_input.strip()
-                self.advance_stage()
-                return "Perfect! How many years of professional experience do you have in technology?"
-            else:
-                return "Please provide a valid phone number."
-
-        elif current_stage == "experience_collection":
-            if user_input.strip():
-                self.candidate_info.experience_years = user_input.strip()
-                self.advance_stage()
-                return "Thanks! What position(s) are you interested in? (e.g., Software Developer, Data Scientist, DevOps Engineer)"
-            else:
-                return "Please specify your years of experience."
-
-        elif current_stage == "position_collection":
-            if user_input.strip():
-                self.candidate_info.desired_position = user_input.strip()
-                self.advance_stage()
-                return "Excellent! What's your current location (city, state/country)?"
-            else:
-                return "Please specify the position you're interested in."
-
-        elif current_stage == "location_collection":
-            if user_input.strip():
-                self.candidate_info.location = user_input.strip()
-                self.advance_stage()
-                return """Now for the technical part! 💻
-
-Please tell me about your tech stack. List the programming languages, frameworks, databases, and tools you're proficient in.
-
-For example: "Python, Django, React, PostgreSQL, AWS, Docker" """
-            else:
-                return "Please provide your current location."
-
-        elif current_stage == "tech_stack_collection":
-            if user_input.strip():
-                tech_stack = self.extract_tech_stack(user_input)
-                if tech_stack:
-                    self.candidate_info.tech_stack = tech_stack
-                    self.technical_questions = self.generate_technical_questions(tech_stack)
-                    self.advance_stage()
-                    return f"""Perfect! I've identified your expertise in: {', '.join(tech_stack)}
-
-Now I'll ask you {len(self.technical_questions)} technical questions to assess your proficiency. Please answer them to the best of your ability.
-
-**Question 1:** {self.technical_questions[0] if self.technical_questions else "Tell me about a recent project you've worked on."}"""
-                else:
-                    return "I couldn't identify specific technologies. Please mention specific programming languages, frameworks, or tools you know (e.g., Python, React, MySQL, etc.)."
-            else:
-                return "Please tell me about your technical skills and tools you use."
-
-        elif current_stage == "technical_questions":
-            if user_input.strip():
-                self.current_question_index += 1
-                
-                if self.current_question_index < len(self.technical_questions):
-                    return f"Thank you for your answer! 👍\n\n**Question {self.current_question_index + 1}:** {self.technical_questions[self.current_question_index]}"
-                else:
-                    self.advance_stage()
-                    return """Excellent! You've completed all the technical questions. 🎉
-
-Let me summarize the information we've collected:
-
-""" + self.get_candidate_summary() + """
-
-Thank you for taking the time to complete this screening! Our recruitment team will review your responses and contact you within 2-3 business days if your profile matches our current openings.
-
-Is there anything else you'd like to know about TalentScout or our process?"""
-            else:
-                return "Please provide an answer to continue with the next question."
-
-        else:  # conclusion stage
-            return """Thank you for your interest in TalentScout! 🌟
-
-Your information has been recorded and our team will be in touch soon. 
-
-Have a wonderful day, and good luck with your job search!
-
-Type 'bye' to end our conversation."""
-
-    def get_candidate_summary(self) -> str:
-        return f"""
-**Candidate Summary:**
-• **Name:** {self.candidate_info.full_name}
-• **Email:** {self.candidate_info.email}
-• **Phone:** {self.candidate_info.phone}
-• **Experience:** {self.candidate_info.experience_years} years
-• **Desired Position:** {self.candidate_info.desired_position}
-• **Location:** {self.candidate_info.location}
-• **Tech Stack:** {', '.join(self.candidate_info.tech_stack) if self.candidate_info.tech_stack else 'Not specified'}
-• **Questions Completed:** {len(self.technical_questions)} technical questions answered
 """
 
-# Initialize session state
-if 'assistant' not in st.session_state:
-    st.session_state.assistant = HiringAssistant()
-if 'messages' not in st.session_state:
-    st.session_state.messages = []
-if 'conversation_started' not in st.session_state:
-    st.session_state.conversation_started = False
-
-# Header
-st.markdown("""
+HEADER_HTML = """
 <div class="main-header">
     <h1>🤖 TalentScout AI Hiring Assistant</h1>
     <p>Your intelligent partner for tech talent screening</p>
 </div>
-""", unsafe_allow_html=True)
-
-# Sidebar with information
-with st.sidebar:
-    st.header("ℹ️ About This Assistant")
-    st.write("""
-    This AI assistant will help screen candidates for technology positions by:
-    
-    ✅ Collecting basic information
-    ✅ Understanding your tech stack
-    ✅ Asking relevant technical questions
-    ✅ Providing a smooth interview experience
-    
-    **Privacy Notice:** All data is handled securely and used only for recruitment purposes.
-    """)
-    
-    st.header("📊 Progress")
-    if st.session_state.assistant:
-        current_stage = st.session_state.assistant.get_current_stage()
-        progress = (st.session_state.assistant.current_stage_index / len(st.session_state.assistant.conversation_stages)) * 100
-        st.progress(progress / 100)
-        st.write(f"Current Stage: {current_stage.replace('_', ' ').title()}")
+"""
 
-# Main chat interface
-st.header("💬 Chat Interface")
+FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 1rem;">
+    <p>🏢 TalentScout - Connecting Tech Talent with Opportunities</p>
+    <p><small>Built with Streamlit • Powered by AI</small></p>
+</div>
+"""
 
-# Display conversation history
-for message in st.session_state.messages:
-    if message["role"] == "user":
-        st.markdown(f"""
+@st.cache_resource
+def get_candidate_store() -> CandidateStore:
+    # One store (and writer thread) shared by every browser session
+    return CandidateStore(os.getenv("TALENTSCOUT_DB", "talentscout.db"))
+
+@st.cache_resource
+def get_question_generator() -> Optional[QuestionGenerator]:
+    # Shared event loop and pooled client; None means template questions only
+    return QuestionGenerator.from_env()
+
+@st.cache_resource
+def get_question_cache() -> QuestionCache:
+    # TALENTSCOUT_QUESTION_CACHE adds an on-disk tier shared across restarts
+    return QuestionCache(disk_path=os.getenv("TALENTSCOUT_QUESTION_CACHE"))
+
+@st.cache_resource
+def get_metrics_exporter():
+    # TALENTSCOUT_METRICS_PORT exposes /metrics for Prometheus-style scrapers
+    port = os.getenv("TALENTSCOUT_METRICS_PORT")
+    return serve_metrics(int(port), os.getenv("TALENTSCOUT_METRICS_HOST", "127.0.0.1")) if port else None
+
+@st.cache_resource
+def get_duplicate_index() -> DuplicateIndex:
+    # Earlier applicants from the candidate store, followed for ones other processes save
+    get_candidate_store()
+    return DuplicateIndex.from_connection(connect(os.getenv("TALENTSCOUT_DB", "talentscout.db"))).start()
+
+@st.cache_resource
+def get_config_watcher() -> Optional[ConfigWatcher]:
+    # TALENTSCOUT_CONFIG points at a config_artifact build; new builds go live without a restart
+    path = os.getenv("TALENTSCOUT_CONFIG")
+    return ConfigWatcher(path).start() if path else None
+
+@st.cache_resource
+def get_session_store() -> Optional[SessionStore]:
+    # TALENTSCOUT_SESSION_STORE (redis://host:port or a SQLite file) lets every
+    # replica serve every session; unset keeps sessions in this process
+    return open_session_store(os.getenv("TALENTSCOUT_SESSION_STORE"))
+
+@st.cache_resource
+def get_event_log() -> Optional[EventLog]:
+    # TALENTSCOUT_EVENT_LOG is a directory for the per-turn log; sessions this
+    # process lost in a restart are rebuilt from it
+    path = os.getenv("TALENTSCOUT_EVENT_LOG")
+    return EventLog(path) if path else None
+
+# Set by main(); a None session store keeps sessions in this process
+session_store: Optional[SessionStore] = None
+event_log: Optional[EventLog] = None
+progress_slot = None
+
+def message_html(role: str, content: str) -> str:
+    if role == "user":
+        return f"""
         <div class="chat-message user-message">
-            <strong>You:</strong> {message["content"]}
+            <strong>You:</strong> {content}
         </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
+        """
+    return f"""
         <div class="chat-message bot-message">
-            <strong>Assistant:</strong> {message["content"]}
+            <strong>Assistant:</strong> {content}
         </div>
-        """, unsafe_allow_html=True)
-
-# Start conversation button or chat input
-if not st.session_state.conversation_started:
-    if st.button("🚀 Start Screening Process", type="primary", use_container_width=True):
-        st.session_state.conversation_started = True
-        welcome_message = st.session_state.assistant.get_response("")
-        st.session_state.messages.append({"role": "assistant", "content": welcome_message})
-        st.rerun()
-else:
-    # Chat input
-    if not st.session_state.assistant.conversation_ended:
-        user_input = st.chat_input("Type your response here...")
-        
+        """
+
+def new_session():
+    st.session_state.session_id = uuid.uuid4().hex
+    st.session_state.assistant = HiringAssistant(st.session_state.session_id)
+    st.session_state.messages = []
+    st.session_state.conversation_started = False
+    st.session_state.turn = 0
+    if session_store is not None or event_log is not None:
+        # The id travels in the URL so another replica (or this one after a
+        # restart) can pick the session up
+        st.query_params["sid"] = st.session_state.session_id
+
+def save_session():
+    """Write the session to the shared store; each save restarts its idle timeout"""
+    if session_store is None:
+        return
+    st.session_state.turn += 1
+    state = {
+        "a": st.session_state.assistant.snapshot().decode("utf-8"),
+        "m": [[message["role"], message["content"]] for message in st.session_state.messages],
+        "s": st.session_state.conversation_started,
+        "n": st.session_state.turn,
+    }
+    session_store.save(st.session_state.session_id, json.dumps(state, ensure_ascii=False).encode("utf-8"))
+
+def load_session(session_id: str) -> bool:
+    """Rehydrate from the shared store unless this replica already has the latest turn"""
+    blob = session_store.load(session_id)
+    if blob is None:
+        return False
+    state = json.loads(blob)
+    if st.session_state.get("session_id") == session_id and st.session_state.get("turn", -1) >= state["n"]:
+        return True
+    st.session_state.assistant = HiringAssistant.restore(state["a"].encode("utf-8"))
+    st.session_state.session_id = session_id
+    st.session_state.messages = [
+        {"role": role, "content": content, "html": message_html(role, content)} for role, content in state["m"]
+    ]
+    st.session_state.conversation_started = state["s"]
+    st.session_state.turn = state["n"]
+    return True
+
+def recover_session(session_id: str) -> bool:
+    """Rebuild a session, chat history included, from the event log"""
+    replayed = event_log.replay(session_id, transcript=True)
+    if replayed is None or time.time() - replayed.updated_at > SESSION_TTL:
+        return False
+    st.session_state.assistant = replayed.assistant
+    st.session_state.session_id = session_id
+    st.session_state.messages = []
+    for user_input, reply in replayed.transcript:
+        # The greeting turn has no input from the candidate
         if user_input:
-            # Add user message
-            st.session_state.messages.append({"role": "user", "content": user_input})
-            
-            # Get assistant response
-            response = st.session_state.assistant.get_response(user_input)
-            st.session_state.messages.append({"role": "assistant", "content": response})
-            
-            st.rerun()
+            add_message("user", user_input)
+        add_message("assistant", reply)
+    st.session_state.conversation_started = True
+    st.session_state.turn = len(replayed.transcript)
+    return True
+
+def respond(user_input: str, reply_fn) -> str:
+    """Run a turn through reply_fn, logging it when there is an event log"""
+    if event_log is None:
+        return reply_fn(user_input)
+    start = event_log.begin_turn(st.session_state.session_id, st.session_state.assistant)
+    reply = reply_fn(user_input)
+    event_log.end_turn(start, user_input, reply)
+    return reply
+
+def render_progress():
+    with progress_slot.container():
+        current_stage = st.session_state.assistant.get_current_stage()
+        progress = (st.session_state.assistant.current_stage_index / len(st.session_state.assistant.conversation_stages)) * 100
+        st.progress(progress / 100)
+        st.write(f"Current Stage: {current_stage.replace('_', ' ').title()}")
+
+def add_message(role: str, content: str):
+    # HTML is rendered once here and reused on every later run
+    st.session_state.messages.append({"role": role, "content": content, "html": message_html(role, content)})
+
+def stream_reply(user_input: str) -> str:
+    """Render the assistant's reply chunk by chunk and return the full text"""
+    placeholder = st.empty()
+    response = ""
+    for chunk in st.session_state.assistant.stream_response(user_input):
+        response += chunk
+        placeholder.markdown(message_html("assistant", response), unsafe_allow_html=True)
+    return response
+
+@st.fragment
+def chat_turn(history) -> None:
+    """Chat input and the turn it starts
+
+    A message reruns only this fragment, so the history drawn by the full
+    run is not sent again. The new exchange goes into the history container,
+    which lies outside the fragment and keeps what is written to it until
+    the next full run.
+    """
+    user_input = st.chat_input("Type your response here...")
+    if not user_input:
+        return
+
+    add_message("user", user_input)
+    with history:
+        st.markdown(st.session_state.messages[-1]["html"], unsafe_allow_html=True)
+        # Stream the assistant response, then keep the final text
+        response = respond(user_input, stream_reply)
+    add_message("assistant", response)
+    get_candidate_store().save(st.session_state.session_id, st.session_state.assistant)
+    save_session()
+
+    # Only rerun the whole page when its layout changes (the conversation ended)
+    if st.session_state.assistant.conversation_ended:
+        st.rerun()
+    render_progress()
+
+def configure_resources() -> None:
+    """Attach the shared, cached resources to HiringAssistant"""
+    get_config_watcher()
+    # Built once per process, at startup rather than on the first candidate's tech stack
+    current_catalog()
+    get_metrics_exporter()
+    HiringAssistant.question_generator = get_question_generator()
+    HiringAssistant.question_cache = get_question_cache()
+    HiringAssistant.duplicate_index = get_duplicate_index()
+    if os.getenv("TALENTSCOUT_ADAPTIVE_QUESTIONS"):
+        # Overrides APP_CONFIG['adaptive_questions'] for this deployment
+        HiringAssistant.adaptive_questions = os.getenv("TALENTSCOUT_ADAPTIVE_QUESTIONS") == "1"
+
+def main() -> None:
+    global session_store, event_log, progress_slot
+
+    # Configure page
+    st.set_page_config(
+        page_title="TalentScout - AI Hiring Assistant",
+        page_icon="🤖",
+        layout="wide",
+        initial_sidebar_state="collapsed"
+    )
+
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+    configure_resources()
+    session_store = get_session_store()
+    event_log = get_event_log()
+
+    # Initialize session state, from the shared store when there is one
+    if session_store is None:
+        if 'assistant' not in st.session_state:
+            session_id = st.query_params.get("sid")
+            if not (session_id and event_log is not None and recover_session(session_id)):
+                new_session()
     else:
-        st.success("🎉 Conversation completed! Thank you for using TalentScout's AI Hiring Assistant.")
-        
-        # Show final summary
-        if st.session_state.assistant.candidate_info.full_name:
-            st.markdown("### 📋 Final Summary")
-            st.markdown(st.session_state.assistant.get_candidate_summary())
-        
-        if st.button("🔄 Start New Conversation"):
-            st.session_state.assistant = HiringAssistant()
-            st.session_state.messages = []
-            st.session_state.conversation_started = False
+        session_id = st.query_params.get("sid") or st.session_state.get("session_id")
+        if not (session_id and load_session(session_id)):
+            # Unknown, or idle past APP_CONFIG['session_timeout'] and expired;
+            # a session nobody has typed into yet is not stored at all
+            if 'assistant' not in st.session_state or st.session_state.turn > 0:
+                new_session()
+
+    # Header
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+    # Sidebar with information
+    with st.sidebar:
+        st.header("ℹ️ About This Assistant")
+        st.write("""
+        This AI assistant will help screen candidates for technology positions by:
+
+        ✅ Collecting basic information
+        ✅ Understanding your tech stack
+        ✅ Asking relevant technical questions
+        ✅ Providing a smooth interview experience
+
+        **Privacy Notice:** All data is handled securely and used only for recruitment purposes.
+        """)
+
+        st.header("📊 Progress")
+        # Filled through a placeholder so a turn can update it without a rerun
+        progress_slot = st.empty()
+
+    render_progress()
+
+    # Main chat interface
+    st.header("💬 Chat Interface")
+
+    # Display conversation history from the cached HTML; turns taken in the
+    # chat fragment are added to this container without a full rerun
+    history = st.container()
+    with history:
+        for message in st.session_state.messages:
+            st.markdown(message["html"], unsafe_allow_html=True)
+
+    # Start conversation button or chat input
+    if not st.session_state.conversation_started:
+        if st.button("🚀 Start Screening Process", type="primary", use_container_width=True):
+            st.session_state.conversation_started = True
+            welcome_message = respond("", st.session_state.assistant.get_response)
+            add_message("assistant", welcome_message)
+            save_session()
             st.rerun()
-
-# Footer
-st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #666; padding: 1rem;">
-    <p>🏢 TalentScout - Connecting Tech Talent with Opportunities</p>
-    <p><small>Built with Streamlit • Powered by AI</small></p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+    else:
+        # Chat input
+        if not st.session_state.assistant.conversation_ended:
+            chat_turn(history)
+        else:
+            st.success("🎉 Conversation completed! Thank you for using TalentScout's AI Hiring Assistant.")
+
+            # Show final summary
+            if st.session_state.assistant.candidate_info.full_name:
+                st.markdown("### 📋 Final Summary")
+                st.markdown(st.session_state.assistant.get_candidate_summary())
+
+            if st.button("🔄 Start New Conversation"):
+                if session_store is not None:
+                    session_store.delete(st.session_state.session_id)
+                if event_log is not None:
+                    event_log.close_session(st.session_state.session_id)
+                new_session()
+                st.rerun()
+
+    # Footer
+    st.markdown("---")
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
+
+# Streamlit runs this file as __main__; importing it has no UI side effects
+if __name__ == "__main__":
+    main()
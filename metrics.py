@@ -0,0 +1,189 @@
+"""
+Screening metrics for TalentScout Hiring Assistant
+Per-stage latency histograms and funnel counters, exported in OpenMetrics
+text format over HTTP or to a file
+"""
+
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Seconds; a turn is tens of microseconds, model calls are seconds
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter family keyed by label values"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple[str, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: int = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> int:
+        return self._values.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# TYPE {self.name} counter", f"# HELP {self.name} {self.help_text}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}_total{_labels(self.label_names, label_values)} {value}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram family keyed by label values"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# TYPE {self.name} histogram", f"# HELP {self.name} {self.help_text}"]
+        with self._lock:
+            items = sorted((key, ([*counts], total, count)) for key, (counts, total, count) in self._series.items())
+        for label_values, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*map(float, self.buckets), "+Inf"), counts):
+                cumulative += bucket_count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, label_values, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, label_values)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, label_values)} {count}")
+        return lines
+
+
+class ScreeningMetrics:
+    """The metric families HiringAssistant records into"""
+
+    def __init__(self, prefix: str = "talentscout"):
+        self.stage_latency = Histogram(
+            f"{prefix}_stage_latency_seconds", "Time to produce a reply, by conversation stage", ["stage"])
+        self.stage_completions = Counter(
+            f"{prefix}_stage_completions", "Candidates who completed a stage (the screening funnel)", ["stage"])
+        self.validation_failures = Counter(
+            f"{prefix}_validation_failures", "Inputs rejected by a field validator", ["field"])
+        self.exits = Counter(
+            f"{prefix}_exits", "Conversations ended with an exit keyword, by stage", ["stage"])
+        self.question_selection = Histogram(
+            f"{prefix}_question_selection_seconds",
+            "Time spent choosing technical questions, by where they came from", ["source"])
+        self.duplicates = Counter(
+            f"{prefix}_duplicate_applicants", "Applicants matching an earlier one, by what matched", ["reason"])
+        self.questions_asked = Histogram(
+            f"{prefix}_technical_questions_asked",
+            "Technical questions asked per finished screening, by selection mode", ["mode"],
+            buckets=(1, 2, 3, 4, 5, 6, 8, 10))
+        self.families = [
+            self.stage_latency,
+            self.stage_completions,
+            self.validation_failures,
+            self.exits,
+            self.question_selection,
+            self.duplicates,
+            self.questions_asked,
+        ]
+
+    def render(self) -> str:
+        """The current values in OpenMetrics text format"""
+        lines = []
+        for family in self.families:
+            lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide metrics; HiringAssistant records here unless told otherwise
+METRICS = ScreeningMetrics()
+
+
+def write_metrics(path: str, metrics: Optional[ScreeningMetrics] = None) -> None:
+    """Atomically replace path with the current metrics (for node-exporter style textfile collectors)"""
+    text = (metrics or METRICS).render()
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1",
+                  metrics: Optional[ScreeningMetrics] = None) -> "ThreadingHTTPServer":
+    """Serve GET /metrics on a daemon thread; returns the server so callers can shut it down"""
+    # Imported here so that sessions recording metrics do not load the HTTP stack
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    metrics = metrics or METRICS
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+    return server
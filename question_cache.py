@@ -0,0 +1,161 @@
+"""
+Question set cache for TalentScout Hiring Assistant
+Content-addressed by normalized tech stack, position and experience band, with
+an in-memory LRU tier and an optional SQLite tier, both with TTL eviction
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+# (upper bound in years, band name); anything above the last bound is "staff"
+EXPERIENCE_BANDS = [(1, "entry"), (4, "mid"), (9, "senior")]
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def experience_band(experience: str) -> str:
+    """Map free-text experience ("5", "3.5 years", "about 10") to a coarse band"""
+    match = _NUMBER.search(experience or "")
+    if not match:
+        return "unknown"
+    years = float(match.group())
+    for upper, band in EXPERIENCE_BANDS:
+        if years <= upper:
+            return band
+    return "staff"
+
+
+def cache_key(tech_stack: Sequence[str], position: str, experience: str) -> str:
+    """Content address of a question request; equivalent requests share a key"""
+    canonical = {
+        "tech": sorted({tech.strip().lower() for tech in tech_stack}),
+        "position": " ".join((position or "").lower().split()),
+        "experience": experience_band(experience),
+    }
+    payload = json.dumps(canonical, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class QuestionCache:
+    """Two-tier LRU + TTL cache of question sets
+
+    The memory tier holds up to max_entries sets. When disk_path is given, sets
+    are also written to SQLite so they survive restarts and are shared by
+    processes on the same host; disk hits are promoted to memory.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 24 * 3600,
+                 disk_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+        # _lock guards the memory tier and counters, _disk_lock the shared SQLite connection
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._counters = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS question_sets ("
+                " key TEXT PRIMARY KEY, questions TEXT NOT NULL, expires_at REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+
+    def get(self, key: str) -> Optional[Tuple[str, ...]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, questions = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return questions
+                del self._entries[key]
+                self._counters["expirations"] += 1
+            if self._disk is None:
+                self._counters["misses"] += 1
+                return None
+
+        # Disk tier read outside the memory lock, so a slow disk hit never blocks memory hits
+        with self._disk_lock:
+            row = self._disk.execute(
+                "SELECT questions, expires_at FROM question_sets WHERE key = ?", (key,)
+            ).fetchone()
+            expired = row is not None and row[1] <= now
+            if expired:
+                with self._disk:
+                    # Guarded on expiry so a set put() refreshed meanwhile survives
+                    self._disk.execute(
+                        "DELETE FROM question_sets WHERE key = ? AND expires_at <= ?", (key, now)
+                    )
+
+        with self._lock:
+            if row is None or expired:
+                if expired:
+                    self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return None
+            questions = tuple(json.loads(row[0]))
+            current = self._entries.get(key)
+            # A put() that landed while the disk was read wins over the older row
+            if current is None or current[0] < row[1]:
+                self._store_in_memory(key, row[1], questions)
+            self._counters["disk_hits"] += 1
+            return questions
+
+    def put(self, key: str, questions: Sequence[str]) -> None:
+        expires_at = time.time() + self.ttl
+        questions = tuple(questions)
+        with self._lock:
+            self._store_in_memory(key, expires_at, questions)
+        if self._disk is not None:
+            with self._disk_lock, self._disk:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO question_sets (key, questions, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(questions, ensure_ascii=False), expires_at),
+                )
+
+    def _store_in_memory(self, key: str, expires_at: float, questions: Tuple[str, ...]) -> None:
+        self._entries[key] = (expires_at, questions)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers; returns how many were removed"""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+        removed = len(expired)
+        if self._disk is not None:
+            with self._disk_lock, self._disk:
+                removed += self._disk.execute(
+                    "DELETE FROM question_sets WHERE expires_at <= ?", (now,)
+                ).rowcount
+        with self._lock:
+            self._counters["expirations"] += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+        return stats
+
+    def close(self) -> None:
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.close()
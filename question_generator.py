@@ -0,0 +1,180 @@
+"""
+Model-backed technical question generation for TalentScout Hiring Assistant
+Runs every request on one shared asyncio loop with a pooled client, so a slow
+model call never stalls other sessions. Callers get None when the deadline
+passes and fall back to the question templates.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import List, Optional, Sequence
+
+from config import APP_CONFIG, GENERAL_QUESTIONS, QUESTION_TEMPLATES
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = (
+    "You are a technical interviewer at TalentScout screening candidates for "
+    "technology roles. Write concise, specific screening questions. Reply with "
+    "one question per line and nothing else."
+)
+
+# Strips "1.", "2)", "-", "*" and similar list markers from model output
+_LIST_MARKER = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s*")
+
+
+def build_prompt(tech_stack: Sequence[str], position: str, experience: str, count: int) -> str:
+    return (
+        f"Write {count} technical screening questions for a candidate applying for "
+        f"'{position or 'a software role'}' with {experience or 'unspecified'} years of experience. "
+        f"Their tech stack is: {', '.join(tech_stack)}. "
+        "Cover the most relevant technologies and vary the difficulty."
+    )
+
+
+def parse_questions(text: str, count: int) -> List[str]:
+    questions = []
+    for line in text.splitlines():
+        question = _LIST_MARKER.sub("", line).strip()
+        if question:
+            questions.append(question)
+    return questions[:count]
+
+
+class OpenAIBackend:
+    """Chat-completions backend sharing one pooled HTTP client across sessions"""
+
+    def __init__(self, model: Optional[str] = None, api_key: Optional[str] = None,
+                 max_connections: int = 20):
+        # Imported here so the templates-only setup never loads openai/httpx
+        import httpx
+        import openai
+
+        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+        )
+        # Retries and timeouts are enforced by QuestionGenerator's deadline
+        self._client = openai.AsyncOpenAI(api_key=api_key, http_client=self._http, max_retries=0)
+
+    async def generate(self, tech_stack: Sequence[str], position: str, experience: str,
+                       count: int) -> List[str]:
+        completion = await self._client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_prompt(tech_stack, position, experience, count)},
+            ],
+            temperature=0.7,
+        )
+        return parse_questions(completion.choices[0].message.content or "", count)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+class LocalBackend:
+    """Offline stand-in that answers from config.QUESTION_TEMPLATES
+
+    The same inputs always produce the same questions. delay and fail let
+    tests exercise the timeout and fallback paths without a network.
+    """
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+
+    async def generate(self, tech_stack: Sequence[str], position: str, experience: str,
+                       count: int) -> List[str]:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("local backend configured to fail")
+
+        pool = [q for tech in tech_stack for q in QUESTION_TEMPLATES.get(tech, [])] or list(GENERAL_QUESTIONS)
+        seed = "|".join([*tech_stack, position, experience]).encode("utf-8")
+        start = int(hashlib.sha1(seed).hexdigest(), 16) % len(pool)
+        return [pool[(start + i) % len(pool)] for i in range(min(count, len(pool)))]
+
+    async def aclose(self) -> None:
+        pass
+
+
+class QuestionGenerator:
+    """Thread-safe front end that runs a backend on a private event loop"""
+
+    def __init__(self, backend, timeout: float = 4.0, max_concurrency: int = 16,
+                 count: int = APP_CONFIG['max_questions']):
+        self.backend = backend
+        self.timeout = timeout
+        self.count = count
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="question-generator", daemon=True)
+        self._thread.start()
+        self._semaphore = asyncio.run_coroutine_threadsafe(
+            self._make_semaphore(max_concurrency), self._loop
+        ).result()
+
+    @classmethod
+    def from_env(cls) -> Optional["QuestionGenerator"]:
+        """Build the generator selected by TALENTSCOUT_QUESTION_BACKEND, if any"""
+        backend_name = os.getenv("TALENTSCOUT_QUESTION_BACKEND", "").lower()
+        timeout = float(os.getenv("TALENTSCOUT_QUESTION_TIMEOUT", "4.0"))
+        if backend_name == "openai":
+            return cls(OpenAIBackend(), timeout=timeout)
+        if backend_name == "local":
+            return cls(LocalBackend(), timeout=timeout)
+        return None
+
+    @staticmethod
+    async def _make_semaphore(limit: int) -> asyncio.Semaphore:
+        return asyncio.Semaphore(limit)
+
+    async def _bounded(self, tech_stack: Sequence[str], position: str, experience: str) -> List[str]:
+        async with self._semaphore:
+            return await self.backend.generate(tech_stack, position, experience, self.count)
+
+    async def _generate(self, tech_stack: Sequence[str], position: str,
+                        experience: str) -> Optional[List[str]]:
+        try:
+            # The deadline covers waiting for a free slot, not just the model call
+            questions = await asyncio.wait_for(self._bounded(tech_stack, position, experience), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Question generation timed out after %.1fs", self.timeout)
+            return None
+        except Exception:
+            logger.exception("Question generation failed")
+            return None
+        return questions or None
+
+    def submit(self, tech_stack: Sequence[str], position: str = "",
+               experience: str = "") -> "concurrent.futures.Future[Optional[List[str]]]":
+        """Start generation without waiting for it"""
+        return asyncio.run_coroutine_threadsafe(
+            self._generate(list(tech_stack), position, experience), self._loop
+        )
+
+    def generate(self, tech_stack: Sequence[str], position: str = "",
+                 experience: str = "") -> Optional[List[str]]:
+        """Return generated questions, or None if the deadline passes or the backend fails"""
+        future = self.submit(tech_stack, position, experience)
+        try:
+            # The coroutine enforces the deadline itself; the margin only
+            # covers scheduling delay on a busy loop.
+            return future.result(timeout=self.timeout + 0.5)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return None
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.backend.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,208 @@
+"""
+Question bank and ranked question index for TalentScout Hiring Assistant
+Built from config.QUESTION_TEMPLATES, GENERAL_QUESTIONS and
+POSITION_TECH_MAPPING; selecting a candidate's questions is a lookup plus a
+merge of precomputed ranked lists
+"""
+
+import hashlib
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from config import APP_CONFIG, GENERAL_QUESTIONS, POSITION_TECH_MAPPING, QUESTION_TEMPLATES
+
+GENERAL_FAMILY = "general"
+
+# Checked in order, so "full stack" wins over "frontend"/"backend"
+_FAMILY_PATTERNS = [
+    ("fullstack", r"full[\s\-]?stack"),
+    ("frontend", r"front[\s\-]?end|\bui\b|web developer"),
+    ("mobile", r"mobile|android|\bios\b|flutter|react native"),
+    ("devops", r"devops|\bsre\b|site reliability|platform|infrastructure|cloud"),
+    ("data", r"\bdata\b|machine learning|\bml\b|\bai\b|analyst|scientist"),
+    ("backend", r"back[\s\-]?end|server|\bapi\b"),
+]
+_FAMILY_REGEXES = [(family, re.compile(pattern)) for family, pattern in _FAMILY_PATTERNS]
+
+# Words that make a question more relevant to a position family
+FAMILY_FOCUS_TERMS = {
+    "frontend": ("component", "dom", "render", "state", "event", "hook", "directive", "forms"),
+    "backend": ("database", "orm", "concurren", "request", "middleware", "transaction", "authentication", "error"),
+    "fullstack": ("api", "component", "request", "database", "authentication", "state", "routing"),
+    "data": ("data", "array", "vectoriz", "model", "query", "index", "large", "time series"),
+    "devops": ("deploy", "scal", "monitor", "production", "security", "container", "ci/cd", "pipeline", "cluster"),
+    "mobile": ("performance", "lifecycle", "state", "memory", "native"),
+}
+
+# Questions taken from one technology before moving to the next
+QUESTIONS_PER_ROUND = 2
+
+
+def question_id(prefix: str, text: str) -> str:
+    """Content-addressed id ("Python/<hash>"), so an edited, inserted or
+    reordered question never takes over the id of another one"""
+    return sys.intern(f"{prefix}/{hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]}")
+
+
+def _question_ids(prefix: str, questions: Sequence[str]) -> Tuple[str, ...]:
+    ids = tuple(question_id(prefix, text) for text in questions)
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"Questions for '{prefix}' must not repeat")
+    return ids
+
+
+def position_family(position: str) -> str:
+    """Map a free-text position ("Sr. Backend Engineer") to a POSITION_TECH_MAPPING key"""
+    text = (position or "").lower()
+    for family, regex in _FAMILY_REGEXES:
+        if regex.search(text):
+            return family
+    return GENERAL_FAMILY
+
+
+def _rotation(seed: str, key: str, size: int) -> int:
+    if not seed or size <= 1:
+        return 0
+    digest = hashlib.blake2b(f"{seed}|{key}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % size
+
+
+class QuestionIndex:
+    """Question bank and ranked question ids per (tech, position family)
+
+    Sessions hold stable, interned question ids ("Python/<hash>",
+    "general/<hash>") and look the text up in `text`. Ids of a previous bank
+    that this one no longer has can be passed as `retired`; they stay
+    readable for sessions that were asked them but are never selected again.
+    """
+
+    def __init__(self, question_templates: Mapping[str, Sequence[str]] = QUESTION_TEMPLATES,
+                 general_questions: Sequence[str] = GENERAL_QUESTIONS,
+                 position_tech_mapping: Mapping[str, Sequence[str]] = POSITION_TECH_MAPPING,
+                 ranked: Optional[Mapping[Tuple[str, str], Sequence[str]]] = None,
+                 retired: Optional[Mapping[str, str]] = None):
+        self.tech_question_ids: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+            tech: _question_ids(tech, questions) for tech, questions in question_templates.items()
+        })
+        self.general_question_ids = _question_ids("general", general_questions)
+        self.text: Mapping[str, str] = MappingProxyType({
+            **(retired or {}),
+            **{qid: question_templates[tech][i] for tech, ids in self.tech_question_ids.items() for i, qid in enumerate(ids)},
+            **dict(zip(self.general_question_ids, general_questions)),
+        })
+        self.ids_by_text: Mapping[str, str] = MappingProxyType({text: qid for qid, text in self.text.items()})
+
+        if ranked is not None:
+            # Precomputed, e.g. by config_artifact
+            self._ranked = {key: tuple(sys.intern(qid) for qid in ids) for key, ids in ranked.items()}
+        else:
+            families = [GENERAL_FAMILY, *position_tech_mapping]
+            self._ranked: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+            for tech, question_ids in self.tech_question_ids.items():
+                for family in families:
+                    self._ranked[(tech.lower(), family)] = self._rank(question_ids, family)
+
+        # Technologies a family cares about, for ordering a candidate's stack
+        self._family_techs = {
+            family: frozenset(tech.lower() for tech in techs)
+            for family, techs in position_tech_mapping.items()
+        }
+
+    def _rank(self, question_ids: Tuple[str, ...], family: str) -> Tuple[str, ...]:
+        """Order questions by focus-term hits for the family, then by bank order"""
+        terms = FAMILY_FOCUS_TERMS.get(family, ())
+
+        def score(item: Tuple[int, str]) -> Tuple[int, int]:
+            position, qid = item
+            text = self.text[qid].lower()
+            return (-sum(term in text for term in terms), position)
+
+        return tuple(qid for _, qid in sorted(enumerate(question_ids), key=score))
+
+    @property
+    def ranked_lists(self) -> Mapping[Tuple[str, str], Tuple[str, ...]]:
+        return MappingProxyType(self._ranked)
+
+    def ranked(self, tech: str, family: str = GENERAL_FAMILY) -> Tuple[str, ...]:
+        return self._ranked.get((tech.lower(), family), ())
+
+    def select(self, tech_stack: Sequence[str], position: str = "", seed: str = "",
+               max_questions: int = APP_CONFIG['max_questions'],
+               min_questions: int = APP_CONFIG['min_questions']) -> Tuple[str, ...]:
+        """Pick up to max_questions ids for a candidate
+
+        Technologies relevant to the position family come first, and each
+        contributes QUESTIONS_PER_ROUND questions per round. A non-empty seed
+        rotates where every ranked list starts, so different candidates with
+        the same stack see different (but stable) questions. General questions
+        top the set up to min_questions.
+        """
+        family = position_family(position)
+        relevant = self._family_techs.get(family, frozenset())
+
+        lists = []
+        seen_techs = set()
+        for tech in tech_stack:
+            key = tech.lower()
+            ranked = self._ranked.get((key, family))
+            if ranked and key not in seen_techs:
+                seen_techs.add(key)
+                lists.append((key not in relevant, key, ranked))
+        # Stable sort keeps the candidate's own order within each group
+        lists.sort(key=lambda item: item[0])
+
+        picked: List[str] = []
+        seen = set()
+        cursors = [(_rotation(seed, key, len(ranked)), 0) for _, key, ranked in lists]
+        while len(picked) < max_questions and lists:
+            progressed = False
+            for i, (_, _, ranked) in enumerate(lists):
+                start, taken = cursors[i]
+                step = 0
+                while step < QUESTIONS_PER_ROUND and taken < len(ranked) and len(picked) < max_questions:
+                    qid = ranked[(start + taken) % len(ranked)]
+                    taken += 1
+                    step += 1
+                    if qid not in seen:
+                        seen.add(qid)
+                        picked.append(qid)
+                        progressed = True
+                cursors[i] = (start, taken)
+            if not progressed:
+                break
+
+        target = min_questions if picked else max_questions
+        general = self.general_question_ids
+        if len(picked) < target:
+            start = _rotation(seed, GENERAL_FAMILY, len(general))
+            for offset in range(len(general)):
+                if len(picked) >= target:
+                    break
+                picked.append(general[(start + offset) % len(general)])
+
+        return tuple(picked)
+
+
+@lru_cache(maxsize=None)
+def _config_index() -> QuestionIndex:
+    return QuestionIndex()
+
+
+_INDEX_ATTRIBUTES = {
+    "TECH_QUESTION_IDS": "tech_question_ids",
+    "GENERAL_QUESTION_IDS": "general_question_ids",
+    "QUESTION_TEXT": "text",
+}
+
+
+def __getattr__(name: str):
+    # QUESTION_INDEX and the bank tables are built from config.py on first use;
+    # config_artifact can swap in newer versions
+    if name == "QUESTION_INDEX":
+        return _config_index()
+    if name in _INDEX_ATTRIBUTES:
+        return getattr(_config_index(), _INDEX_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,310 @@
+"""
+Session stores for TalentScout Hiring Assistant
+Keep in-flight screenings outside the process, so any app replica can serve
+any candidate and a restart does not lose conversations. Sessions expire
+after APP_CONFIG['session_timeout'] seconds without a turn.
+"""
+
+import re
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from candidate_store import connect
+from config import APP_CONFIG
+
+SESSION_TTL = APP_CONFIG['session_timeout']
+
+SESSION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    data       BLOB NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at);
+"""
+
+
+class SessionStore(ABC):
+    """Key-value store of serialized sessions with idle expiry
+
+    save() (re)starts a session's ttl, so a session expires ttl seconds after
+    its last turn. shared is True for stores other processes can see; values
+    in those must be bytes.
+    """
+
+    shared = True
+
+    def __init__(self, ttl: float = SESSION_TTL):
+        self.ttl = ttl
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def save(self, session_id: str, data: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of live sessions"""
+
+    def purge_expired(self) -> int:
+        """Drop expired sessions now; returns how many were removed"""
+        return 0
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySessionStore(SessionStore):
+    """Process-local store; values are kept as-is, so live objects work too
+
+    Entries are kept in last-save order, so expired sessions are always at
+    the front and eviction never scans live ones.
+    """
+
+    shared = False
+
+    def __init__(self, ttl: float = SESSION_TTL, max_sessions: int = 0):
+        super().__init__(ttl)
+        self.max_sessions = max_sessions
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> int:
+        removed = 0
+        while self._entries:
+            session_id, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and not (self.max_sessions and len(self._entries) > self.max_sessions):
+                break
+            del self._entries[session_id]
+            removed += 1
+        return removed
+
+    def load(self, session_id: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            self._evict(now)
+            entry = self._entries.get(session_id)
+            return entry[1] if entry is not None else None
+
+    def save(self, session_id: str, data: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._entries[session_id] = (now + self.ttl, data)
+            self._entries.move_to_end(session_id)
+            self._evict(now)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def count(self) -> int:
+        with self._lock:
+            self._evict(time.time())
+            return len(self._entries)
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._evict(time.time())
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions in a SQLite file, shared by every process that opens it
+
+    Suits replicas on one host or on a shared volume. Expired rows are
+    ignored on read and purged at most every purge_interval seconds.
+    """
+
+    def __init__(self, path: str = "talentscout_sessions.db", ttl: float = SESSION_TTL,
+                 purge_interval: float = 60.0):
+        super().__init__(ttl)
+        self.path = path
+        self.purge_interval = purge_interval
+        self._conn = connect(path)
+        self._conn.executescript(SESSION_SCHEMA)
+        self._lock = threading.Lock()
+        self._next_purge = time.time() + purge_interval
+
+    def load(self, session_id: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE session_id = ? AND expires_at > ?",
+                (session_id, time.time()),
+            ).fetchone()
+        return bytes(row["data"]) if row is not None else None
+
+    def save(self, session_id: str, data: bytes) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, data, expires_at) VALUES (?, ?, ?)",
+                (session_id, data, now + self.ttl),
+            )
+        if now >= self._next_purge:
+            self.purge_expired()
+
+    def delete(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM sessions WHERE expires_at > ?", (time.time(),)
+            ).fetchone()[0]
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock, self._conn:
+            self._next_purge = now + self.purge_interval
+            return self._conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,)).rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisSessionStore(SessionStore):
+    """Sessions in Redis (or anything speaking RESP), with server-side expiry
+
+    A small stdlib client: one connection guarded by a lock, reconnected
+    once on failure.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0,
+                 ttl: float = SESSION_TTL, prefix: str = "talentscout:session:",
+                 password: Optional[str] = None, timeout: float = 2.0):
+        super().__init__(ttl)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.prefix = prefix
+        self.password = password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+        if self.password:
+            self._roundtrip("AUTH", self.password)
+        if self.db:
+            self._roundtrip("SELECT", self.db)
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = self._reader = None
+
+    @staticmethod
+    def _encode(args: Tuple[Any, ...]) -> bytes:
+        parts: List[bytes] = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode("utf-8")
+            elif not isinstance(arg, (bytes, bytearray)):
+                arg = str(arg).encode("ascii")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("connection closed by server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise RedisError(f"unexpected reply: {line!r}")
+
+    def _roundtrip(self, *args: Any) -> Any:
+        self._sock.sendall(self._encode(args))
+        return self._read_reply()
+
+    def command(self, *args: Any) -> Any:
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._roundtrip(*args)
+                except (ConnectionError, socket.timeout, OSError):
+                    self._disconnect()
+                    if attempt == 2:
+                        raise
+
+    def load(self, session_id: str) -> Optional[bytes]:
+        return self.command("GET", self.prefix + session_id)
+
+    def save(self, session_id: str, data: bytes) -> None:
+        self.command("SET", self.prefix + session_id, data, "PX", int(self.ttl * 1000))
+
+    def delete(self, session_id: str) -> None:
+        self.command("DEL", self.prefix + session_id)
+
+    def count(self) -> int:
+        # SCAN rather than DBSIZE, which would count every key in the database
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self.prefix) + "*"
+        cursor, keys = b"0", set()
+        while True:
+            # A key can come back twice while Redis resizes its table
+            cursor, batch = self.command("SCAN", cursor, "MATCH", pattern, "COUNT", 1000)
+            keys.update(batch)
+            if cursor == b"0":
+                return len(keys)
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+
+def open_session_store(url: Optional[str], ttl: float = SESSION_TTL) -> Optional[SessionStore]:
+    """Build a store from a URL: redis://host:port/db, sqlite:///path or a bare file path
+
+    Empty means no shared store (sessions stay in the process).
+    """
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if parsed.scheme == "redis":
+        db = int(parsed.path.strip("/") or 0)
+        return RedisSessionStore(parsed.hostname or "127.0.0.1", parsed.port or 6379, db, ttl,
+                                 password=parsed.password)
+    if parsed.scheme == "sqlite":
+        return SQLiteSessionStore(parsed.path if not parsed.netloc else parsed.netloc + parsed.path, ttl)
+    if parsed.scheme in ("", "file"):
+        return SQLiteSessionStore(parsed.path or url, ttl)
+    raise ValueError(f"Unsupported session store URL: {url}")
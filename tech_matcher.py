@@ -0,0 +1,323 @@
+"""
+Tech stack matcher for TalentScout Hiring Assistant
+Compiles config.TECH_KEYWORDS and their aliases into a single word-boundary
+aware pattern, with a character n-gram index for misspelled names
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from config import QUESTION_TEMPLATES, TECH_ALIASES, TECH_KEYWORDS
+
+# Characters that may continue a technology name ("c++", "c#", "node.js").
+# A keyword only matches when it is not glued to one of these on either side,
+# so "go" does not fire inside "google" and "java" not inside "javascript".
+_NAME_CHARS = r"a-z0-9_+#"
+
+# Multi-word keywords accept any run of spaces or hyphens ("react-native")
+_SEPARATOR_RE = re.compile(r"[\s\-]+")
+
+# Frameworks are often written with a "js" suffix ("reactjs", "express.js")
+_JS_SUFFIX_CATEGORIES = ("frontend_frameworks", "backend_frameworks")
+
+# Shortest word, and shortest name, that is matched fuzzily. Names shorter
+# than this are one edit from too many ordinary words ("reacts", "redist",
+# "scalar") and only match exactly or through an alias.
+MIN_FUZZY_LENGTH = 6
+
+
+def display_name(keyword: str, template_keys: Iterable[str] = QUESTION_TEMPLATES) -> str:
+    """Return the name shown to candidates and used to look up question templates"""
+    for template_key in template_keys:
+        if template_key.lower() == keyword:
+            return template_key
+    return keyword.title()
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def build_alias_table(keyword_groups: Mapping[str, Iterable[str]],
+                      aliases: Mapping[str, str]) -> Dict[str, str]:
+    """Map every accepted spelling to its canonical keyword
+
+    Besides the explicit aliases, each keyword is accepted without spaces,
+    hyphens or dots ("nodejs", "springboot", "scikitlearn"), and frameworks
+    also with a "js" suffix ("reactjs", "react.js").
+    """
+    canonical_of = {_normalize(alias): _normalize(target) for alias, target in aliases.items()}
+    table: Dict[str, str] = {}
+
+    def add(form: str, canonical: str) -> None:
+        form = _normalize(form)
+        if form and form not in table:
+            table[form] = canonical
+
+    for category, keywords in keyword_groups.items():
+        for keyword in keywords:
+            keyword = _normalize(keyword)
+            canonical = canonical_of.get(keyword, keyword)
+            add(keyword, canonical)
+            add(re.sub(r"[\s\-.]+", "", keyword), canonical)
+            if category in _JS_SUFFIX_CATEGORIES:
+                base = re.sub(r"\.?js$", "", keyword)
+                for form in (f"{base}js", f"{base}.js", f"{base} js"):
+                    add(form, canonical)
+
+    for alias, canonical in canonical_of.items():
+        add(alias, canonical)
+        add(re.sub(r"[\s\-.]+", "", alias), canonical)
+    return table
+
+
+def _key_positions() -> Dict[str, Tuple[int, float]]:
+    # QWERTY rows, each shifted half a key to the right of the one above
+    rows = ("qwertyuiop", "asdfghjkl", "zxcvbnm")
+    return {key: (row, col + row / 2) for row, keys in enumerate(rows) for col, key in enumerate(keys)}
+
+
+_KEY_POSITIONS = _key_positions()
+
+
+def adjacent_keys(a: str, b: str) -> bool:
+    """Whether a and b sit next to each other on a QWERTY keyboard"""
+    if a not in _KEY_POSITIONS or b not in _KEY_POSITIONS:
+        return False
+    (row_a, x_a), (row_b, x_b) = _KEY_POSITIONS[a], _KEY_POSITIONS[b]
+    return (row_a == row_b and abs(x_a - x_b) == 1) or (abs(row_a - row_b) == 1 and abs(x_a - x_b) == 0.5)
+
+
+def typo_distance(word: str, term: str, limit: int) -> int:
+    """Optimal string alignment distance from term to a mistyped word, capped at limit + 1
+
+    Dropped letters and swapped neighbours cost one edit. A wrong or extra
+    letter costs one edit only when it is a slip of the finger, a key next to
+    the intended one or a doubled key; otherwise it costs two. Real words
+    near a name mostly differ by such non-slips ("string"/"spring",
+    "flatter"/"flutter", "sparing"/"spring").
+    """
+    if abs(len(word) - len(term)) > limit:
+        return limit + 1
+
+    def extra(i: int) -> int:
+        # word[i] has no counterpart in term
+        neighbours = word[max(i - 1, 0):i] + word[i + 1:i + 2]
+        return 1 if any(c == word[i] or adjacent_keys(c, word[i]) for c in neighbours) else 2
+
+    previous2: List[int] = []
+    previous = list(range(len(term) + 1))
+    for i in range(1, len(word) + 1):
+        current = [previous[0] + extra(i - 1)] + [0] * len(term)
+        row_min = current[0]
+        for j in range(1, len(term) + 1):
+            if word[i - 1] == term[j - 1]:
+                replace = 0
+            else:
+                replace = 1 if adjacent_keys(word[i - 1], term[j - 1]) else 2
+            value = min(previous[j] + extra(i - 1), current[j - 1] + 1, previous[j - 1] + replace)
+            if i > 1 and j > 1 and word[i - 1] == term[j - 2] and word[i - 2] == term[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class NGramIndex:
+    """Bounded-edit-distance lookup of single words through a character n-gram index
+
+    Per-word cost is bounded independently of vocabulary size: grams shared
+    by more than max_posting terms are too common to narrow anything down and
+    are left out of the index, and at most max_candidates terms (those sharing
+    the most grams with the word) are checked with typo_distance.
+    """
+
+    def __init__(self, terms: Iterable[str], n: int = 3, max_posting: int = 32, max_candidates: int = 8):
+        self.n = n
+        self.max_candidates = max_candidates
+        self._terms: Tuple[str, ...] = tuple(dict.fromkeys(terms))
+        postings: Dict[str, List[int]] = {}
+        for term_id, term in enumerate(self._terms):
+            for gram in set(self._grams(term)):
+                postings.setdefault(gram, []).append(term_id)
+        self._postings: Dict[str, Tuple[int, ...]] = {
+            gram: tuple(ids) for gram, ids in postings.items() if len(ids) <= max_posting
+        }
+
+    def _grams(self, word: str) -> List[str]:
+        padded = f"^{word}$"
+        return [padded[i:i + self.n] for i in range(len(padded) - self.n + 1)]
+
+    @staticmethod
+    def max_distance(word: str) -> int:
+        if len(word) < MIN_FUZZY_LENGTH:
+            return 0
+        return 1 if len(word) < 10 else 2
+
+    @staticmethod
+    def inflected(word: str, term: str) -> bool:
+        """Whether word only differs from term at its end, by a changed last
+        letter or added letters ("docked"/"docker", "oracles"/"oracle").
+        That is how English forms of a word differ; typos land anywhere."""
+        if len(word) < len(term):
+            return False
+        prefix = 0
+        for a, b in zip(word, term):
+            if a != b:
+                break
+            prefix += 1
+        return prefix >= len(term) - 1
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Closest indexed term within max_distance(word) edits, or None"""
+        limit = self.max_distance(word)
+        if not limit:
+            return None
+        grams = set(self._grams(word))
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        # q-gram lemma: an edit destroys at most n grams, a swap n + 1
+        required = len(grams) - limit * (self.n + 1)
+
+        best, best_distance = None, limit + 1
+        for term_id, count in shared.most_common(self.max_candidates):
+            if count < required:
+                break
+            term = self._terms[term_id]
+            # Typos rarely touch the first letter, while real words one edit
+            # away from a name usually do ("locker"/"docker", "member"/"ember")
+            if term[0] != word[0] and not (len(term) == len(word) and term[:2] == word[1::-1]):
+                continue
+            if self.inflected(word, term):
+                continue
+            distance = typo_distance(word, term, limit)
+            if distance < best_distance:
+                best, best_distance = term, distance
+        return best
+
+
+class TechMatcher:
+    """Finds every known technology in a piece of text in a single regex pass
+
+    Exact names and aliases are matched by one compiled pattern. Other words
+    of MIN_FUZZY_LENGTH or more letters are looked up in an n-gram index of
+    the canonical single-word names of that length, so "kubernets" or
+    "pyhton" still count.
+    """
+
+    # Bound on memoized fuzzy lookups; most words repeat across candidates
+    FUZZY_CACHE_SIZE = 1 << 16
+
+    def __init__(self, keywords: Iterable[str], aliases: Optional[Mapping[str, str]] = None,
+                 fuzzy: bool = True, template_keys: Iterable[str] = QUESTION_TEMPLATES):
+        self._canonical: Dict[str, str] = {}
+        for keyword in keywords:
+            keyword = _normalize(keyword)
+            if keyword:
+                self._canonical.setdefault(keyword, keyword)
+        for form, canonical in (aliases or {}).items():
+            self._canonical.setdefault(_normalize(form), _normalize(canonical))
+        template_keys = tuple(template_keys)
+        self._display: Dict[str, str] = {
+            form: display_name(canonical, template_keys) for form, canonical in self._canonical.items()
+        }
+
+        # Longest alternatives first so "spring boot" wins over "spring"
+        alternatives = sorted(self._display, key=len, reverse=True)
+        body = "|".join(
+            r"[\s\-]+".join(re.escape(word) for word in keyword.split())
+            for keyword in alternatives
+        )
+        # A word that is not a known name is captured by the second group, for
+        # the fuzzy lookup; names are tried first at every position
+        word = rf"|([a-z][a-z0-9]{{{MIN_FUZZY_LENGTH - 1},}})" if fuzzy else ""
+        self._pattern = re.compile(
+            rf"(?<![{_NAME_CHARS}])(?:({body}){word})(?![{_NAME_CHARS}])"
+        )
+
+        self._fuzzy_index = None
+        self._fuzzy_cache: Dict[str, Optional[str]] = {}
+        if fuzzy:
+            # Canonical names only: generated spellings ("objectivec", "flaskjs")
+            # sit one edit from ordinary words ("objective", "flasks")
+            self._fuzzy_index = NGramIndex(
+                name for name in self.keywords if name.isalnum() and len(name) >= MIN_FUZZY_LENGTH
+            )
+
+    @classmethod
+    def from_config(cls) -> "TechMatcher":
+        table = build_alias_table(TECH_KEYWORDS, TECH_ALIASES)
+        return cls(table.values(), table)
+
+    @classmethod
+    def from_alias_table(cls, table: Mapping[str, str], template_keys: Iterable[str]) -> "TechMatcher":
+        """Matcher for a prebuilt build_alias_table() result, e.g. from a config artifact"""
+        return cls(table.values(), table, template_keys=template_keys)
+
+    @property
+    def keywords(self) -> List[str]:
+        """Canonical names, without aliases"""
+        return list(dict.fromkeys(self._canonical.values()))
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Canonical keyword for a known name or alias ("k8s" -> "kubernetes")"""
+        return self._canonical.get(_normalize(name))
+
+    def _fuzzy(self, word: str) -> Optional[str]:
+        cache = self._fuzzy_cache
+        if word in cache:
+            return cache[word]
+        term = self._fuzzy_index.lookup(word)
+        name = None if term is None else self._display[term]
+        if len(cache) >= self.FUZZY_CACHE_SIZE:
+            cache.clear()
+        cache[word] = name
+        return name
+
+    def extract(self, text: str) -> List[str]:
+        """Return the technologies mentioned in text, in order of first mention"""
+        found: Dict[str, None] = {}
+        display = self._display
+        if self._fuzzy_index is None:
+            for match in self._pattern.findall(text.lower()):
+                name = display.get(match)
+                if name is None:
+                    name = display[_SEPARATOR_RE.sub(" ", match)]
+                found[name] = None
+            return list(found)
+
+        for match, word in self._pattern.findall(text.lower()):
+            if match:
+                name = display.get(match)
+                if name is None:
+                    name = display[_SEPARATOR_RE.sub(" ", match)]
+            else:
+                name = self._fuzzy(word)
+                if name is None:
+                    continue
+            found[name] = None
+        return list(found)
+
+    def extract_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Batch version of extract for bulk re-screening"""
+        extract = self.extract
+        return [extract(text) for text in texts]
+
+
+@lru_cache(maxsize=None)
+def _config_matcher() -> TechMatcher:
+    return TechMatcher.from_config()
+
+
+def __getattr__(name: str):
+    # TECH_MATCHER is built from config.py on first use and then shared by every
+    # session; compiling its pattern is left out of the import
+    if name == "TECH_MATCHER":
+        return _config_matcher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,48 @@
+from adaptive_questions import DECISION_Z, PASS_LEVEL, POOL_SIZE, TARGET_SE, ItemBank
+
+POOL = [f"{topic}/{i}" for i in range(POOL_SIZE // 3 + 1) for topic in ("Python", "Django", "SQL")][:POOL_SIZE]
+
+
+def run(bank, score, **limits):
+    asked, scores = [], []
+    while True:
+        qid = bank.next_question(POOL, asked, scores, **limits)
+        if qid is None:
+            return asked, scores
+        assert qid in POOL and qid not in asked
+        asked.append(qid)
+        scores.append(score)
+
+
+def confident(bank, asked, scores):
+    theta, se = bank.estimate(asked, scores)
+    return se <= TARGET_SE or abs(theta - PASS_LEVEL) >= DECISION_Z * se
+
+
+def test_stops_once_the_estimate_is_confident():
+    bank = ItemBank({qid: (0.0, 1.5) for qid in POOL})
+    for score in (0.0, 0.5, 1.0):
+        asked, scores = run(bank, score, min_questions=1, max_questions=100)
+        assert confident(bank, asked, scores)
+        assert not any(confident(bank, asked[:n], scores[:n]) for n in range(1, len(asked)))
+
+
+def test_never_asks_more_than_the_pool():
+    # Barely informative questions never make the estimate confident
+    bank = ItemBank({qid: (0.0, 0.05) for qid in POOL})
+    asked, scores = run(bank, 0.5, min_questions=1, max_questions=100)
+    assert sorted(asked) == sorted(POOL)
+    assert not confident(bank, asked, scores)
+
+
+def test_question_limits():
+    bank = ItemBank({qid: (0.0, 0.05) for qid in POOL})
+    assert len(run(bank, 0.5, min_questions=3, max_questions=5)[0]) == 5
+    strong = ItemBank({qid: (0.0, 3.0) for qid in POOL})
+    assert len(run(strong, 1.0, min_questions=3, max_questions=5)[0]) == 3
+
+
+def test_topics_take_turns():
+    bank = ItemBank({qid: (0.0, 1.0) for qid in POOL})
+    asked, _ = run(bank, 0.5, min_questions=3, max_questions=3)
+    assert sorted(qid.split("/")[0] for qid in asked) == ["Django", "Python", "SQL"]
@@ -0,0 +1,77 @@
+import math
+
+import numpy as np
+import pytest
+
+from answer_scoring import AnswerScorer, format_score, rank_candidates, terms
+from config_artifact import current_catalog
+
+KEYPOINTS = {
+    "q/mvcc": ["MVCC snapshots", "data consistency"],
+    "q/perf": ["data performance"],
+    "q/storage": ["data storage"],
+}
+
+
+def test_terms_are_stemmed_and_stopwords_dropped():
+    assert terms("The indexes, and indexing of the Index") == ["index"]
+    assert terms("Queries vs query") == ["query"]
+
+
+def test_rare_terms_weigh_more_than_common_ones():
+    scorer = AnswerScorer(KEYPOINTS)
+    # Four keypoints: "data" is in three of them, every other term in one
+    common, rare = math.log(5 / 4) + 1, math.log(5 / 2) + 1
+    scores = scorer.score(["q/mvcc"] * 3, ["data", "consistency", "mvcc"]).tolist()
+    # Each of the two keypoints counts for half the question
+    assert scores == pytest.approx([common / (common + rare) / 2, rare / (common + rare) / 2, 0.25], rel=1e-5)
+    assert scores[1] > scores[0]
+
+
+def test_scores_cover_keypoints():
+    scorer = AnswerScorer(KEYPOINTS)
+    scores = scorer.score(["q/mvcc", "q/mvcc", "q/perf", "gen/unknown"],
+                          ["MVCC snapshots keep data consistency", "", "Data performance.", "anything"])
+    assert scores[0] == pytest.approx(1.0)
+    assert scores[1] == 0.0
+    assert scores[2] == pytest.approx(1.0)
+    assert math.isnan(scores[3])
+    assert scorer.has_keypoints("q/perf") and not scorer.has_keypoints("gen/unknown")
+    assert scorer.score([], []).shape == (0,)
+    with pytest.raises(ValueError):
+        scorer.score(["q/perf"], [])
+    assert (format_score(scores[0]), format_score(scores[3])) == ("100%", "n/a")
+
+
+def test_state_round_trip():
+    for scorer in (AnswerScorer(KEYPOINTS), current_catalog().answer_scorer):
+        vocabulary, rows, term_ids, weights = scorer.state()
+        rebuilt = AnswerScorer.from_state(vocabulary, rows, term_ids.copy(), weights.copy())
+        question_ids = [*rows, "gen/unknown"]
+        answers = [" ".join(vocabulary[i::7]) for i in range(len(question_ids))]
+        np.testing.assert_array_equal(rebuilt.score(question_ids, answers), scorer.score(question_ids, answers))
+        assert dict(rebuilt.vocabulary) == dict(scorer.vocabulary)
+
+
+def test_rank_candidates_best_first():
+    scorer = current_catalog().answer_scorer
+    qid = next(qid for qid in current_catalog().question_index.text if scorer.has_keypoints(qid))
+    vocabulary = list(scorer.vocabulary)
+    full = " ".join(vocabulary)
+    rows = [
+        ("weak", qid, "no idea"),
+        ("strong", qid, full),
+        ("strong", "gen/unscored", "not counted"),
+        ("unscored", "gen/unscored", "anything"),
+        ("middle", qid, full),
+        ("middle", qid, "no idea"),
+    ]
+    ranked = rank_candidates(rows)
+    # Ties keep session id order
+    assert [session_id for session_id, _, _ in ranked] == ["strong", "middle", "unscored", "weak"]
+    by_session = {session_id: (mean, count) for session_id, mean, count in ranked}
+    assert by_session["strong"] == (pytest.approx(1.0), 1)
+    assert by_session["middle"] == (pytest.approx(0.5), 2)
+    assert by_session["weak"] == (0.0, 1)
+    assert by_session["unscored"] == (0.0, 0)
+    assert rank_candidates([]) == []
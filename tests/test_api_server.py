@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+import pytest
+
+from api_server import HTTPError, ScreeningAPI, handle_connection
+from assistant import HiringAssistant
+from session_store import SQLiteSessionStore
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_create_turn_and_summary():
+    async def scenario():
+        api = ScreeningAPI()
+        status, created = await api.dispatch("POST", "/sessions", None)
+        assert status == 201 and created["stage"] == "name_collection"
+        session_id = created["session_id"]
+        for message in ("Jane Doe", "jane@example.com"):
+            status, turn = await api.dispatch("POST", f"/sessions/{session_id}/turns", {"message": message})
+            assert status == 200 and not turn["conversation_ended"]
+        status, summary = await api.dispatch("GET", f"/sessions/{session_id}/summary", None)
+        assert status == 200
+        assert summary["candidate_info"]["full_name"] == "Jane Doe"
+        assert summary["candidate_info"]["email"] == "jane@example.com"
+        status, health = await api.dispatch("GET", "/health", None)
+        assert health["sessions"] == 1
+
+    run(scenario())
+
+
+@pytest.mark.parametrize("method, path, body, status", [
+    ("POST", "/sessions/missing/turns", {"message": "hi"}, 404),
+    ("GET", "/sessions/missing/summary", None, 404),
+    ("GET", "/nowhere", None, 404),
+    ("PUT", "/sessions", None, 405),
+])
+def test_errors(method, path, body, status):
+    with pytest.raises(HTTPError) as error:
+        run(ScreeningAPI().dispatch(method, path, body))
+    assert error.value.status == status
+
+
+def test_turn_needs_a_message():
+    async def scenario():
+        api = ScreeningAPI()
+        _, created = await api.dispatch("POST", "/sessions", None)
+        await api.dispatch("POST", f"/sessions/{created['session_id']}/turns", {"message": 5})
+
+    with pytest.raises(HTTPError) as error:
+        run(scenario())
+    assert error.value.status == 400
+
+
+def test_unrestorable_snapshot_is_a_conflict(tmp_path):
+    sessions = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    state = json.loads(HiringAssistant("old").snapshot())
+    state["q"] = ["Python/not-a-question"]
+    sessions.save("old", json.dumps(state).encode())
+    with pytest.raises(HTTPError) as error:
+        run(ScreeningAPI(sessions=sessions).dispatch("GET", "/sessions/old/summary", None))
+    assert error.value.status == 409
+    sessions.close()
+
+
+async def request(server, raw: bytes):
+    host, port = server.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+@pytest.mark.parametrize("body, error", [
+    (b"{not json", "invalid JSON body"),
+    (b"\xff\xfe", "invalid JSON body"),
+    (b"[1, 2]", "request body must be a JSON object"),
+])
+def test_malformed_body(body, error):
+    async def scenario():
+        api = ScreeningAPI()
+        server = await asyncio.start_server(lambda r, w: handle_connection(api, r, w), "127.0.0.1", 0)
+        async with server:
+            return await request(server, b"POST /sessions HTTP/1.1\r\nConnection: close\r\n"
+                                 b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+
+    assert run(scenario()) == (400, {"error": error})
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+import assistant as assistant_module
+from assistant import SNAPSHOT_VERSION, STAGES, HiringAssistant
+from config import APP_CONFIG
+
+MESSAGES = ["", "Jane Doe", "jane@example.com", "+1 555 010 1234", "5", "Backend Developer", "Berlin",
+            "Python, Django", "An answer about caching", "An answer about indexes"]
+
+
+@pytest.fixture(autouse=True)
+def fixed_questions(monkeypatch):
+    monkeypatch.setattr(HiringAssistant, "adaptive_questions", False)
+
+
+def test_stage_table_follows_config():
+    assert [stage.name for stage in STAGES] == APP_CONFIG["conversation_stages"]
+    assert HiringAssistant.conversation_stages == tuple(APP_CONFIG["conversation_stages"])
+    assert [handler.__name__ for handler in assistant_module._STAGE_HANDLERS] == [stage.handler for stage in STAGES]
+
+
+def test_snapshot_round_trip_at_every_turn():
+    live = HiringAssistant("s-1")
+    for message in MESSAGES:
+        live.get_response(message)
+        blob = live.snapshot()
+        state = json.loads(blob)
+        assert state["v"] == SNAPSHOT_VERSION
+        restored = HiringAssistant.restore(json.dumps(state).encode("utf-8"))
+        assert restored.snapshot() == blob
+        assert restored.get_current_stage() == live.get_current_stage()
+        assert restored.candidate_info == live.candidate_info
+        assert restored.technical_questions == live.technical_questions
+    # Restored sessions carry on exactly like the original
+    assert restored.get_response("Another answer") == live.get_response("Another answer")
+
+
+def test_generated_questions_travel_with_the_snapshot():
+    live = HiringAssistant("s-1")
+    live.question_ids = ("gen/0123456789abcdef",)
+    live.generated_questions = {"gen/0123456789abcdef": "How would you shard this table?"}
+    assert HiringAssistant.restore(live.snapshot()).technical_questions == ["How would you shard this table?"]
+
+
+def test_restore_rejects_unknown_questions_and_versions():
+    state = json.loads(HiringAssistant("s-1").snapshot())
+    with pytest.raises(ValueError, match="unknown questions"):
+        HiringAssistant.restore(json.dumps(dict(state, q=["Python/not-a-question"])).encode())
+    with pytest.raises(ValueError, match="version"):
+        HiringAssistant.restore(json.dumps(dict(state, v=SNAPSHOT_VERSION + 1)).encode())
+    with pytest.raises(ValueError, match="version"):
+        HiringAssistant.restore(json.dumps({k: v for k, v in state.items() if k != "v"}).encode())
+
+
+@pytest.mark.parametrize("message", ["bye", "Bye!", "quit", "bye for now", "ok, goodbye", "end the chat please",
+                                     "I want to stop", "EXIT"])
+def test_exit_keywords(message):
+    assert HiringAssistant().is_exit_keyword(message)
+
+
+@pytest.mark.parametrize("message", ["quite", "Backend Developer", "Frontend engineer", "Stopwatch app",
+                                     "I would stop the service and drain the queue first", "", "   "])
+def test_not_exit_keywords(message):
+    assert not HiringAssistant().is_exit_keyword(message)
+
+
+def test_exit_ends_the_conversation():
+    assistant = HiringAssistant()
+    assistant.get_response("")
+    assistant.get_response("bye for now")
+    assert assistant.conversation_ended
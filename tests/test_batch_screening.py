@@ -0,0 +1,20 @@
+import json
+
+from batch_screening import run_batch, screen_line
+
+GOOD = {"candidate_id": "c-001", "turns": ["Jane Doe", "jane@example.com", "+1 555 010 1234", "5",
+                                           "Backend Developer", "Berlin", "Python, Django"]}
+
+
+def test_screen_line_reports_malformed_records():
+    for record in ('{"turns": 5}', '{"turns": ["Jane", 3]}', '[1, 2]', '"text"', 'not json'):
+        result = json.loads(screen_line(record))
+        assert result["error"].startswith("invalid transcript"), record
+
+
+def test_malformed_record_does_not_stop_the_pool():
+    lines = [json.dumps(GOOD), '{"candidate_id": "c-002", "turns": 5}', json.dumps({**GOOD, "candidate_id": "c-003"})]
+    results = [json.loads(line) for line in run_batch(lines, workers=2, chunk_size=1)]
+    assert [result.get("candidate_id") for result in results] == ["c-001", None, "c-003"]
+    assert "error" in results[1]
+    assert results[0]["final_stage"] == results[2]["final_stage"] == "technical_questions"
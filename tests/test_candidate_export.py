@@ -0,0 +1,112 @@
+import json
+import os
+
+import pytest
+
+import candidate_export
+from assistant import HiringAssistant
+from candidate_export import export
+from candidate_store import CandidateStore
+from config_artifact import current_catalog
+
+
+def screened(session_id, question_ids, answers, generated=None):
+    assistant = HiringAssistant(session_id)
+    assistant.candidate_info.full_name = f"Candidate {session_id}"
+    assistant.candidate_info.email = f"{session_id}@example.com"
+    assistant.question_ids = tuple(question_ids)
+    assistant.answers = list(answers)
+    assistant.generated_questions = generated
+    return assistant
+
+
+def test_export_keeps_generated_question_text(tmp_path):
+    db = str(tmp_path / "candidates.db")
+    bank_id = next(iter(current_catalog().question_index.text))
+    store = CandidateStore(db)
+    store.save("s-1", screened("s-1", [bank_id, "gen/0123456789abcdef"], ["first", "second"],
+                               {"gen/0123456789abcdef": "How would you shard this table?"}))
+    store.flush()
+    store.close()
+
+    # A fresh export process has never seen the generated question
+    output = str(tmp_path / "out.jsonl")
+    assert export(db, "jsonl", output) == 1
+    with open(output, encoding="utf-8") as f:
+        answers = json.loads(f.readline())["answers"]
+    assert [a["question"] for a in answers] == [
+        current_catalog().question_index.text[bank_id], "How would you shard this table?"]
+
+
+class Interrupted(Exception):
+    pass
+
+
+def fill_store(db, count):
+    bank_ids = list(current_catalog().question_index.text)[:3]
+    store = CandidateStore(db)
+    for i in range(count):
+        store.save(f"s-{i:03d}", screened(f"s-{i:03d}", bank_ids[:i % 4], ["an answer about caching"] * (i % 4)))
+    store.flush()
+    store.close()
+
+
+def interrupt_after(monkeypatch, chunks):
+    original = candidate_export.iter_chunks
+
+    def iter_chunks(*args, **kwargs):
+        for n, chunk in enumerate(original(*args, **kwargs)):
+            if n == chunks:
+                raise Interrupted
+            yield chunk
+
+    monkeypatch.setattr(candidate_export, "iter_chunks", iter_chunks)
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+def test_resumed_export_matches_single_pass(tmp_path, monkeypatch, fmt):
+    db = str(tmp_path / "candidates.db")
+    fill_store(db, 25)
+    single = str(tmp_path / f"single.{fmt}")
+    assert export(db, fmt, single, chunk_size=4) == 25
+
+    output, cursor = str(tmp_path / f"resumed.{fmt}"), str(tmp_path / "cursor")
+    with monkeypatch.context() as m:
+        interrupt_after(m, 3)
+        with pytest.raises(Interrupted):
+            export(db, fmt, output, cursor, chunk_size=4)
+    # Output written after the last checkpoint is dropped on resume
+    with open(output, "a", encoding="utf-8") as f:
+        f.write("torn partial record")
+    assert export(db, fmt, output, cursor, chunk_size=4) == 13
+
+    with open(single, encoding="utf-8") as a, open(output, encoding="utf-8") as b:
+        assert a.read() == b.read()
+    # Finished: a rerun only picks up new candidates
+    assert export(db, fmt, output, cursor, chunk_size=4) == 0
+
+
+def test_resumed_parquet_export_matches_single_pass(tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    db = str(tmp_path / "candidates.db")
+    fill_store(db, 25)
+
+    def rows(directory):
+        names = sorted(os.listdir(directory))
+        assert not [name for name in names if name.endswith(".tmp")]
+        return [row for name in names for row in pq.read_table(os.path.join(directory, name)).to_pylist()]
+
+    single = str(tmp_path / "single")
+    export(db, "parquet", single, chunk_size=4, rows_per_file=8)
+
+    output, cursor = str(tmp_path / "resumed"), str(tmp_path / "cursor")
+    with monkeypatch.context() as m:
+        interrupt_after(m, 3)
+        with pytest.raises(Interrupted):
+            export(db, "parquet", output, cursor, chunk_size=4, rows_per_file=8)
+    # The part being written when the export stopped was never renamed into place
+    assert sorted(os.listdir(output)) == ["candidates-00000.parquet", "candidates-00001.parquet.tmp"]
+    export(db, "parquet", output, cursor, chunk_size=4, rows_per_file=8)
+
+    assert sorted(os.listdir(output)) == sorted(os.listdir(single))
+    assert rows(output) == rows(single)
@@ -0,0 +1,113 @@
+import io
+import json
+
+from candidate_import import CandidateImporter, import_file, read_csv, read_jsonl
+
+CSV = """Candidate Name,E-Mail,Mobile,Years_of_Experience,Job Title,City,Tech Stack
+Jane Doe, jane@Example.COM ,+1 (555) 010-1234,5,Backend Developer,Berlin,"Python, Django"
+Raj Patel,raj@example.com,,3,Data Engineer,Pune,SQL
+"""
+
+
+def run(rows, chunk_size=1000):
+    importer = CandidateImporter()
+    imported, rejected = [], []
+    for chunk_imported, chunk_rejected in importer.run(rows, chunk_size):
+        imported.extend(chunk_imported)
+        rejected.extend(chunk_rejected)
+    return importer, imported, rejected
+
+
+def record(line, **fields):
+    return line, {"name": f"Candidate {line}", "email": f"c{line}@example.com", **fields}
+
+
+def test_column_aliases_map_to_candidate_fields():
+    _, imported, rejected = run(read_csv(io.StringIO(CSV)))
+    assert rejected == []
+    assert [row["line"] for row in imported] == [2, 3]
+    jane = imported[0]["candidate_info"]
+    assert jane["full_name"] == "Jane Doe"
+    assert jane["email"] == "jane@example.com"
+    assert jane["phone"] == "+15550101234"
+    assert jane["experience_years"] == "5"
+    assert jane["desired_position"] == "Backend Developer"
+    assert jane["location"] == "Berlin"
+    assert "Python" in jane["tech_stack"] and "Django" in jane["tech_stack"]
+    assert imported[1]["candidate_info"]["phone"] == ""
+
+
+def test_first_non_empty_alias_wins():
+    rows = [(1, {"name": "", "Full-Name": "Ada Lovelace", "candidate": "Ignored", "email": "ada@example.com",
+                 "unrelated": "x"})]
+    _, imported, _ = run(rows)
+    assert imported[0]["candidate_info"]["full_name"] == "Ada Lovelace"
+
+
+def test_invalid_email_and_phone_rows_are_rejected():
+    rows = [
+        record(1),
+        record(2, email="not-an-email"),
+        record(3, phone="12345"),
+        record(4, email="", phone="555"),
+        (5, {"email": "noname@example.com"}),
+        record(6, phone="+44 20 7946 0958"),
+    ]
+    importer, imported, rejected = run(rows, chunk_size=4)
+    assert [row["line"] for row in imported] == [1, 6]
+    reasons = {row["line"]: row["reasons"] for row in rejected}
+    assert reasons == {
+        2: ["invalid email"],
+        3: ["invalid phone"],
+        4: ["missing email", "invalid phone"],
+        5: ["missing name"],
+    }
+    assert rejected[0]["record"] == rows[1][1]
+    assert (importer.imported, importer.rejected) == (2, 4)
+
+
+def test_duplicate_emails_are_dropped_across_chunks():
+    rows = [
+        record(1, email="jane.doe@gmail.com"),
+        record(2),
+        record(3, email="JaneDoe+jobs@Gmail.com"),
+        record(4, email="c2@EXAMPLE.com"),
+    ]
+    _, imported, rejected = run(rows, chunk_size=2)
+    assert [row["line"] for row in imported] == [1, 2]
+    assert {row["line"]: row["reasons"] for row in rejected} == {
+        3: ["duplicate email (line 1)"],
+        4: ["duplicate email (line 2)"],
+    }
+
+
+def test_rejected_row_does_not_claim_its_email():
+    rows = [record(1, phone="123"), record(2, email="c1@example.com")]
+    _, imported, rejected = run(rows)
+    assert [row["line"] for row in imported] == [2]
+    assert rejected[0]["reasons"] == ["invalid phone"]
+
+
+def test_import_file_writes_records_and_rejects():
+    source = io.StringIO("\n".join([
+        json.dumps({"name": "Jane Doe", "email": "jane@example.com", "skills": ["Python"]}),
+        "[1, 2]",
+        "",
+        json.dumps({"name": "Jane Again", "email": "JANE@example.com"}),
+    ]) + "\n")
+    sink, rejects = io.StringIO(), io.StringIO()
+    importer = import_file(source, "jsonl", sink, rejects, chunk_size=2)
+    imported = [json.loads(line) for line in sink.getvalue().splitlines()]
+    rejected = [json.loads(line) for line in rejects.getvalue().splitlines()]
+    assert [row["line"] for row in imported] == [1]
+    assert imported[0]["candidate_info"]["tech_stack"] == ["Python"]
+    assert [(row["line"], row["reasons"]) for row in rejected] == [
+        (2, ["not a JSON object"]), (4, ["duplicate email (line 1)"])
+    ]
+    assert rejected[0]["record"] == {"_raw": "[1, 2]"}
+    assert (importer.imported, importer.rejected) == (1, 2)
+
+
+def test_read_jsonl_skips_blank_lines():
+    rows = list(read_jsonl(io.StringIO('{"name": "A"}\n\n  \n{"name": "B"}\n')))
+    assert [line for line, _ in rows] == [1, 4]
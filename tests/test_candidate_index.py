@@ -0,0 +1,92 @@
+import random
+from collections import OrderedDict
+
+from candidate_index import CandidateIndex, parse_query
+
+# Term frequencies from ~60% (bitmap postings) down to a handful of documents (id arrays)
+TERMS = [(f"t{i}", 0.6 / (i + 1) ** 1.3) for i in range(40)]
+
+
+def random_terms(rng):
+    return [term for term, frequency in TERMS if rng.random() < frequency]
+
+
+def random_query(rng):
+    def atom():
+        return tuple(rng.choice(TERMS)[0] if rng.random() < 0.95 else "unknown" for _ in range(rng.randint(1, 2)))
+
+    return [[atom() for _ in range(rng.randint(1, 3))] for _ in range(rng.randint(1, 3))]
+
+
+def brute_force(live, clauses, limit):
+    """Straight set algebra over every live session, most recently saved first"""
+    sessions_with = {}
+    for session_id, terms in live.items():
+        for term in terms:
+            sessions_with.setdefault(term, set()).add(session_id)
+    matched = set(live)
+    for clause in clauses:
+        matched &= set().union(*(set.intersection(*(sessions_with.get(term, set()) for term in atom))
+                                 for atom in clause))
+    matches = [session_id for session_id in reversed(live) if session_id in matched]
+    return len(matches), matches[:limit]
+
+
+def check(index, live, rng, queries=150):
+    dense = sum(posting.bits is not None for posting in index._postings.values())
+    assert 0 < dense < len(index._postings)
+    for _ in range(queries):
+        clauses, limit = random_query(rng), rng.choice([0, 1, 10, 100, 10_000])
+        result = index.match(clauses, limit)
+        assert (result.total, result.session_ids) == brute_force(live, clauses, limit), clauses
+
+
+def test_match_agrees_with_brute_force_through_retire_and_compact():
+    rng = random.Random(7)
+    index, live = CandidateIndex(), OrderedDict()
+
+    def save(session_id):
+        terms = random_terms(rng)
+        index.add(session_id, terms)
+        live.pop(session_id, None)
+        live[session_id] = set(terms)
+
+    for n in range(3000):
+        save(f"s-{n}")
+    check(index, live, rng)
+
+    # Re-saved sessions retire their old document ids; removed ones disappear
+    for n in rng.sample(range(3000), 1200):
+        save(f"s-{n}")
+    for n in rng.sample(range(3000), 600):
+        index.remove(f"s-{n}")
+        live.pop(f"s-{n}", None)
+    assert len(index) == len(live)
+    check(index, live, rng)
+
+    index.compact()
+    assert len(index._session_of) == len(live)
+    check(index, live, rng)
+    for n in range(3000, 3300):
+        save(f"s-{n}")
+    check(index, live, rng)
+
+
+def test_parse_query():
+    assert parse_query("Kubernetes AND AWS, devops, Berlin | Munich") == [
+        [("tech:kubernetes",)], [("tech:aws",)], [("family:devops",)], [("loc:berlin",), ("loc:munich",)]]
+    assert parse_query("5+ years & completed") == [[("exp:senior",), ("exp:staff",)], [("status:completed",)]]
+    assert parse_query("loc:new york, tech:k8s OR tech:docker") == [
+        [("loc:new", "loc:york")], [("tech:kubernetes",), ("tech:docker",)]]
+    assert parse_query("exp:3 years") == [[("exp:mid",)]]
+    assert parse_query(" , ") == []
+
+
+def test_search_end_to_end():
+    index = CandidateIndex()
+    index.add("a", ["tech:kubernetes", "tech:aws", "family:devops", "loc:berlin"])
+    index.add("b", ["tech:kubernetes", "family:devops", "loc:munich"])
+    index.add("c", ["tech:aws", "family:devops", "loc:munich", "status:completed"])
+    assert index.search("kubernetes, berlin | munich").session_ids == ["b", "a"]
+    assert index.search("aws, completed").session_ids == ["c"]
+    assert index.search("rust").total == 0
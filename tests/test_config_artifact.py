@@ -0,0 +1,98 @@
+import copy
+import time
+
+import numpy as np
+import pytest
+
+import config
+import config_artifact
+from config_artifact import (ConfigArtifact, ConfigWatcher, build_catalog, config_tables, current_catalog,
+                             table_version, write_artifact)
+
+NEW_QUESTION = "What does a metaclass do in Python?"
+
+
+@pytest.fixture(autouse=True)
+def restore_catalog():
+    previous = current_catalog()
+    yield
+    config_artifact.install(previous)
+
+
+def edited_tables():
+    tables = copy.deepcopy(config_tables(vars(config)))
+    tables["question_templates"]["Python"].append(NEW_QUESTION)
+    tables["question_keypoints"]["Python"].append(["metaclass creates classes"])
+    tables["question_ratings"]["Python"].append((0.5, 1.0))
+    return tables
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_artifact_round_trip(tmp_path):
+    tables = config_tables(vars(config))
+    path = str(tmp_path / "config.bin")
+    assert write_artifact(tables, path) == table_version(tables)
+
+    expected, loaded = build_catalog(tables), ConfigArtifact(path).catalog()
+    assert loaded.version == expected.version == current_catalog().version
+    assert dict(loaded.question_index.text) == dict(expected.question_index.text)
+    assert loaded.question_index.ranked_lists == expected.question_index.ranked_lists
+    for stack in (["Python", "Django"], ["React"], []):
+        assert loaded.question_index.select(stack, "Backend Developer", "seed") == \
+            expected.question_index.select(stack, "Backend Developer", "seed")
+    message = "I use python, reactjs, postgres and k8s"
+    assert loaded.tech_matcher.extract(message) == expected.tech_matcher.extract(message)
+    question_ids = list(expected.question_index.text)
+    answers = ["list tuple mutable immutable hashable"] * len(question_ids)
+    np.testing.assert_array_equal(loaded.answer_scorer.score(question_ids, answers),
+                                  expected.answer_scorer.score(question_ids, answers))
+    assert dict(loaded.item_bank.ratings) == dict(expected.item_bank.ratings)
+
+
+def test_watcher_swaps_in_new_versions(tmp_path):
+    path = str(tmp_path / "config.bin")
+    write_artifact(config_tables(vars(config)), path)
+    watcher = ConfigWatcher(path, interval=0.02).start()
+    try:
+        first = current_catalog()
+        asked = next(iter(first.question_index.text))
+
+        version = write_artifact(edited_tables(), path)
+        assert wait_for(lambda: current_catalog().version == version)
+        catalog = current_catalog()
+        assert NEW_QUESTION in catalog.question_index.text.values()
+        # Questions sessions were already asked stay readable
+        assert catalog.question_index.text[asked] == first.question_index.text[asked]
+    finally:
+        watcher.stop()
+
+
+def test_watcher_keeps_serving_after_a_bad_artifact(tmp_path, monkeypatch):
+    path = str(tmp_path / "config.bin")
+    write_artifact(config_tables(vars(config)), path)
+    watcher = ConfigWatcher(path, interval=0.02).start()
+    try:
+        serving = current_catalog().version
+        # Not an OSError/ValueError/KeyError, as a corrupt NumPy section could raise
+        monkeypatch.setattr(ConfigArtifact, "catalog", lambda self, previous=None: 1 / 0)
+        write_artifact(edited_tables(), path)
+        time.sleep(0.2)
+        assert current_catalog().version == serving
+        assert watcher._thread.is_alive()
+
+        with open(path, "wb") as f:
+            f.write(b"TSCONFIG\xff\xff\xff\xff{")
+        time.sleep(0.1)
+        assert current_catalog().version == serving
+
+        monkeypatch.undo()
+        version = write_artifact(edited_tables(), path)
+        assert wait_for(lambda: current_catalog().version == version)
+    finally:
+        watcher.stop()
@@ -0,0 +1,71 @@
+import time
+
+from candidate_store import SCHEMA, connect
+from duplicate_index import DuplicateIndex
+
+
+def save_row(conn, session_id, name, email, phone, completed=True):
+    now = time.time()
+    conn.execute(
+        "INSERT OR REPLACE INTO candidates (session_id, full_name, email, phone, stage, completed, created_at, updated_at)"
+        " VALUES (?, ?, ?, ?, 'conclusion', ?, ?, ?)",
+        (session_id, name, email, phone, int(completed), now, now),
+    )
+    conn.commit()
+
+
+def test_index_sees_applicants_saved_by_another_process(tmp_path):
+    path = str(tmp_path / "candidates.db")
+    other_worker = connect(path)
+    other_worker.executescript(SCHEMA)
+    index = DuplicateIndex.from_connection(connect(path))
+    assert index.find(email="jane@example.com") == []
+
+    save_row(other_worker, "s-1", "Jane Doe", "jane@example.com", "+1 555 010 1234")
+    # find() is a pure in-memory lookup; only a sync reads the store
+    assert index.find(email="jane@example.com") == []
+    index.sync()
+    matches = index.find("Jane Doe", "Jane@Example.com", "(555) 010-1234", exclude="s-2")
+    assert [(m.session_id, m.reason, m.completed) for m in matches] == [
+        ("s-1", "email", True), ("s-1", "phone", True), ("s-1", "name", True)]
+
+
+def test_index_rebuilt_from_store_after_restart(tmp_path):
+    path = str(tmp_path / "candidates.db")
+    conn = connect(path)
+    conn.executescript(SCHEMA)
+    save_row(conn, "s-1", "John Smith", "john@example.com", "5550101234", completed=False)
+    restarted = DuplicateIndex.from_connection(connect(path))
+    assert len(restarted) == 1
+    assert [m.reason for m in restarted.find("Jon Smith")] == ["name"]
+
+
+def test_sync_skips_rows_already_synced(tmp_path, monkeypatch):
+    path = str(tmp_path / "candidates.db")
+    conn = connect(path)
+    conn.executescript(SCHEMA)
+    save_row(conn, "s-1", "Jane Doe", "jane@example.com", "5550101234")
+    index = DuplicateIndex.from_connection(connect(path))
+    registered = []
+    original = index.register
+    monkeypatch.setattr(index, "register", lambda *args, **kwargs: registered.append(args[0]) or original(*args, **kwargs))
+    index.sync()
+    assert registered == []
+    save_row(conn, "s-2", "John Smith", "john@example.com", "5550109999")
+    index.sync()
+    assert registered == ["s-2"]
+
+
+def test_background_sync(tmp_path):
+    path = str(tmp_path / "candidates.db")
+    conn = connect(path)
+    conn.executescript(SCHEMA)
+    index = DuplicateIndex.from_connection(connect(path)).start(interval=0.01)
+    try:
+        save_row(conn, "s-1", "Jane Doe", "jane@example.com", "5550101234")
+        deadline = time.time() + 5
+        while not index.find(email="jane@example.com") and time.time() < deadline:
+            time.sleep(0.01)
+        assert [m.session_id for m in index.find(email="jane@example.com")] == ["s-1"]
+    finally:
+        index.stop()
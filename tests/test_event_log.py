@@ -0,0 +1,113 @@
+import os
+import threading
+
+import event_log
+from assistant import HiringAssistant
+from event_log import EventLog, list_segments, read_segment, replay_session, segment_sessions
+
+CONVERSATION = ["Jane Doe", "not an email", "jane@example.com", "555", "+1 555 010 1234", "5",
+                "Backend Developer", "Berlin", "Python, Django"] + ["An answer about caching and indexes"] * 10
+
+
+def converse(log, session_id, messages):
+    assistant = HiringAssistant(session_id)
+    for message in messages:
+        if assistant.conversation_ended:
+            break
+        start = log.begin_turn(session_id, assistant)
+        reply = assistant.get_response(message)
+        log.end_turn(start, message, reply)
+    return assistant
+
+
+def test_replay_applies_at_most_snapshot_every_turns(tmp_path):
+    log = EventLog(str(tmp_path), fsync=False)
+    live = converse(log, "s-1", CONVERSATION)
+    replayed = log.replay("s-1")
+    log.close()
+    assert replayed.replayed_turns < event_log.SNAPSHOT_EVERY
+    assert replayed.assistant.snapshot() == live.snapshot()
+    transcript = replay_session(str(tmp_path), "s-1", transcript=True).transcript
+    assert [message for message, _ in transcript] == CONVERSATION[:len(transcript)]
+
+
+def test_corrupt_record_ends_the_segment(tmp_path):
+    log = EventLog(str(tmp_path), fsync=False)
+    for n in range(3):
+        log.append({"k": "note", "id": "s-1", "n": n})
+    log.close()
+    path = list_segments(str(tmp_path))[0]
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    frames = list(event_log._frames(bytes(data)))
+    data[frames[0][0] + event_log._HEADER.size + 2] ^= 0xFF  # a payload byte of the second record
+    with open(path, "wb") as f:
+        f.write(data)
+    assert [record["n"] for record in read_segment(path)] == [1]
+
+
+def test_torn_tail_is_cut_off_on_open(tmp_path):
+    log = EventLog(str(tmp_path), fsync=False)
+    for n in range(3):
+        log.append({"k": "note", "id": "s-1"})
+    log.close()
+    path = list_segments(str(tmp_path))[0]
+    intact = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(event_log._frame(4, b'{"k":"note","id":"s-1"}')[:-5])
+
+    log = EventLog(str(tmp_path), fsync=False)
+    assert os.path.getsize(path) == intact
+    assert log.append({"k": "note", "id": "s-2"}) == 4
+    log.close()
+    assert [(record["n"], record["id"]) for record in read_segment(path)] == [
+        (1, "s-1"), (2, "s-1"), (3, "s-1"), (4, "s-2")]
+
+
+def test_turns_do_not_wait_for_the_writer_without_wait_for_commit(tmp_path, monkeypatch):
+    log = EventLog(str(tmp_path), fsync=False, wait_for_commit=False)
+    release = threading.Event()
+    write_batch = log._write_batch
+    monkeypatch.setattr(log, "_write_batch", lambda batch: release.wait() and write_batch(batch))
+
+    converse(log, "s-1", CONVERSATION[:2])  # would block here if turns waited
+    assert not list(read_segment(list_segments(str(tmp_path))[0]))
+    release.set()
+    log.flush()
+    assert len([record for record in read_segment(list_segments(str(tmp_path))[0])]) == 3
+    log.close()
+
+
+def test_unknown_session_reads_no_segment(tmp_path, monkeypatch):
+    log = EventLog(str(tmp_path), segment_bytes=512, fsync=False)
+    for n in range(12):
+        converse(log, f"s-{n}", CONVERSATION[:3])
+    segments = list_segments(str(tmp_path))
+    assert len(segments) > 3
+    assert all(segment_sessions(path) is not None for path in segments[:-1])
+
+    reads = []
+    original = event_log.read_segment
+    monkeypatch.setattr(event_log, "read_segment", lambda path, *args: reads.append(path) or original(path, *args))
+    assert log.replay("no-such-session") is None
+    assert reads == []
+    assert log.replay("s-0").assistant.candidate_info.email == "jane@example.com"
+    assert len(reads) < len(segments)
+    log.close()
+
+    # Without the writer's in-memory sets, only the segment still being written is read
+    reads.clear()
+    assert replay_session(str(tmp_path), "no-such-session") is None
+    assert reads == [segments[-1]]
+
+
+def test_reopened_segment_loses_its_session_file(tmp_path):
+    log = EventLog(str(tmp_path), segment_bytes=512, fsync=False)
+    for n in range(6):
+        converse(log, f"s-{n}", CONVERSATION[:3])
+    log.close()
+    last = list_segments(str(tmp_path))[-1]
+    event_log.write_segment_sessions(last, [])  # as if the process died right after rotating
+    log = EventLog(str(tmp_path), segment_bytes=512, fsync=False)
+    assert segment_sessions(last) is None
+    log.close()
@@ -0,0 +1,171 @@
+import threading
+
+import pytest
+
+import question_cache
+from question_cache import QuestionCache, cache_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(question_cache, "time", clock)
+    return clock
+
+
+def test_cache_key_equivalence():
+    base = cache_key(["Python", "Django"], "Backend Developer", "3")
+    assert cache_key([" django", "PYTHON ", "python"], "  backend   developer ", "3.5 years") == base
+    assert cache_key(["Python", "Django"], "Backend Developer", "about 4") == base
+    assert cache_key(["Python"], "Backend Developer", "3") != base
+    assert cache_key(["Python", "Django"], "Frontend Developer", "3") != base
+    assert cache_key(["Python", "Django"], "Backend Developer", "5") != base
+    assert cache_key([], "", "") == cache_key([], "", "no idea")
+
+
+def test_memory_tier_evicts_least_recently_used(clock):
+    cache = QuestionCache(max_entries=2)
+    cache.put("a", ["qa"])
+    cache.put("b", ["qb"])
+    assert cache.get("a") == ("qa",)
+    cache.put("c", ["qc"])
+    assert cache.get("b") is None
+    assert cache.get("a") == ("qa",)
+    assert cache.get("c") == ("qc",)
+    cache.put("d", ["qd"])
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["evictions"], stats["entries"]) == (2, 2)
+
+
+def test_memory_tier_expires_after_ttl(clock):
+    cache = QuestionCache(ttl=60)
+    cache.put("a", ["qa"])
+    clock.now += 59
+    assert cache.get("a") == ("qa",)
+    clock.now += 1
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["expirations"], stats["misses"], stats["entries"]) == (1, 1, 1, 0)
+
+
+def test_disk_tier_survives_restart_and_expires(clock, tmp_path):
+    path = str(tmp_path / "questions.db")
+    cache = QuestionCache(ttl=60, disk_path=path)
+    cache.put("a", ["qa", "qa2"])
+    cache.close()
+
+    cache = QuestionCache(ttl=60, disk_path=path)
+    clock.now += 30
+    assert cache.get("a") == ("qa", "qa2")
+    assert cache.get("a") == ("qa", "qa2")
+    stats = cache.stats()
+    assert (stats["disk_hits"], stats["hits"]) == (1, 1)
+    cache.close()
+
+    cache = QuestionCache(ttl=60, disk_path=path)
+    clock.now += 30
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache._disk.execute("SELECT COUNT(*) FROM question_sets").fetchone()[0] == 0
+    cache.close()
+
+
+def test_purge_expired_clears_both_tiers(clock, tmp_path):
+    cache = QuestionCache(ttl=60, disk_path=str(tmp_path / "questions.db"))
+    cache.put("old", ["q"])
+    clock.now += 30
+    cache.put("new", ["q"])
+    clock.now += 30
+    # One expired set in memory and one on disk
+    assert cache.purge_expired() == 2
+    assert cache.get("old") is None
+    assert cache.get("new") == ("q",)
+    cache.close()
+
+
+class SlowDisk:
+    """SQLite connection wrapper whose reads wait until released"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.reading = threading.Event()
+        self.release = threading.Event()
+
+    def execute(self, sql, params=()):
+        if sql.startswith("SELECT"):
+            self.reading.set()
+            self.release.wait(5)
+        return self.conn.execute(sql, params)
+
+    def __enter__(self):
+        return self.conn.__enter__()
+
+    def __exit__(self, *exc):
+        return self.conn.__exit__(*exc)
+
+
+class _Rows:
+    def __init__(self, row):
+        self.row = row
+
+    def fetchone(self):
+        return self.row
+
+
+def test_slow_disk_read_does_not_block_memory_hits(tmp_path):
+    cache = QuestionCache(disk_path=str(tmp_path / "questions.db"))
+    cache.put("hot", ["q"])
+    slow = cache._disk = SlowDisk(cache._disk)
+    results = {}
+    reader = threading.Thread(target=lambda: results.setdefault("cold", cache.get("cold")))
+    reader.start()
+    assert slow.reading.wait(5)
+
+    done = threading.Event()
+    threading.Thread(target=lambda: (results.setdefault("hot", cache.get("hot")), done.set())).start()
+    try:
+        assert done.wait(2), "memory hit waited for the disk read"
+    finally:
+        slow.release.set()
+        reader.join(5)
+    assert results == {"hot": ("q",), "cold": None}
+    cache._disk = slow.conn
+    cache.close()
+
+
+def test_disk_hit_does_not_overwrite_newer_put(tmp_path):
+    cache = QuestionCache(disk_path=str(tmp_path / "questions.db"))
+    cache.put("a", ["old"])
+    cache._entries.clear()
+    slow = cache._disk = SlowDisk(cache._disk)
+    reader = threading.Thread(target=cache.get, args=("a",))
+    slow.release.set()
+    # put() lands after the row was read but before it is promoted
+    original = slow.execute
+
+    def execute(sql, params=()):
+        result = original(sql, params)
+        if sql.startswith("SELECT"):
+            row = result.fetchone()
+            # put()'s memory half; its disk write would wait for this read
+            assert cache._lock.acquire(timeout=2)
+            cache._store_in_memory("a", row[1] + 1, ("new",))
+            cache._lock.release()
+            return _Rows(row)
+        return result
+
+    slow.execute = execute
+    reader.start()
+    reader.join(5)
+    assert cache._entries["a"][1] == ("new",)
+    cache._disk = slow.conn
+    cache.close()
@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+
+from assistant import HiringAssistant
+from config import QUESTION_TEMPLATES
+from question_generator import LocalBackend, QuestionGenerator
+
+STACK = ["Python", "Django"]
+
+
+@pytest.fixture
+def make_generator():
+    generators = []
+
+    def make(backend, **kwargs):
+        generators.append(QuestionGenerator(backend, **kwargs))
+        return generators[-1]
+
+    yield make
+    for generator in generators:
+        generator.close()
+
+
+def screen_to_questions(monkeypatch, generator):
+    monkeypatch.setattr(HiringAssistant, "question_generator", generator)
+    monkeypatch.setattr(HiringAssistant, "adaptive_questions", False)
+    assistant = HiringAssistant("s-1")
+    for message in ("", "Jane Doe", "jane@example.com", "+1 555 010 1234", "5", "Backend Developer", "Berlin",
+                    ", ".join(STACK)):
+        assistant.get_response(message)
+    return assistant
+
+
+def test_local_backend_questions_are_used(make_generator, monkeypatch):
+    generator = make_generator(LocalBackend(), timeout=1.0)
+    questions = generator.generate(STACK, "Backend Developer", "5")
+    assert questions and questions == generator.generate(STACK, "Backend Developer", "5")
+    assert screen_to_questions(monkeypatch, generator).technical_questions == questions
+
+
+@pytest.mark.parametrize("backend", [LocalBackend(delay=2.0), LocalBackend(fail=True)])
+def test_late_or_failing_backend_falls_back_to_templates(make_generator, monkeypatch, backend):
+    generator = make_generator(backend, timeout=0.2)
+    start = time.perf_counter()
+    assert generator.generate(STACK) is None
+    assert time.perf_counter() - start < 1.0
+
+    assistant = screen_to_questions(monkeypatch, generator)
+    templates = {question for tech in STACK for question in QUESTION_TEMPLATES[tech]}
+    assert assistant.technical_questions and set(assistant.technical_questions) <= templates
+
+
+class CountingBackend(LocalBackend):
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = delays
+        self.running = 0
+        self.most_running = 0
+
+    async def generate(self, tech_stack, position, experience, count):
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(position, 0.0))
+            return await super().generate(tech_stack, position, experience, count)
+        finally:
+            self.running -= 1
+
+
+def test_slow_sessions_do_not_stall_others(make_generator):
+    backend = CountingBackend({"slow": 1.0})
+    generator = make_generator(backend, timeout=3.0, max_concurrency=4)
+    slow = [generator.submit(STACK, "slow") for _ in range(3)]
+    start = time.perf_counter()
+    assert generator.generate(STACK, "fast") is not None
+    assert time.perf_counter() - start < 0.5
+    assert all(future.result() is not None for future in slow)
+    assert backend.most_running <= 4
+
+
+def test_deadline_covers_waiting_for_a_slot(make_generator):
+    backend = CountingBackend({"slow": 2.0})
+    generator = make_generator(backend, timeout=0.3, max_concurrency=2)
+    futures = [generator.submit(STACK, "slow") for _ in range(4)]
+    start = time.perf_counter()
+    assert [future.result() for future in futures] == [None] * 4
+    assert time.perf_counter() - start < 1.0
+    assert backend.most_running <= 2
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+
+from benchmarks.redis_standin import start_in_thread
+from session_store import (MemorySessionStore, RedisSessionStore, SQLiteSessionStore, SessionStore,
+                           open_session_store)
+
+TTL = 0.2
+
+
+@pytest.fixture(scope="module")
+def redis_port():
+    _, port = start_in_thread()
+    return port
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def make_store(request, tmp_path, redis_port):
+    stores = []
+
+    def make(ttl=60.0, prefix="talentscout:session:"):
+        if request.param == "memory":
+            store = MemorySessionStore(ttl)
+        elif request.param == "sqlite":
+            store = SQLiteSessionStore(str(tmp_path / "sessions.db"), ttl)
+        else:
+            store = RedisSessionStore("127.0.0.1", redis_port, ttl=ttl, prefix=f"{prefix}{request.node.name}:")
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def test_round_trip(make_store):
+    store = make_store()
+    assert store.load("s-1") is None
+    store.save("s-1", b"first")
+    store.save("s-2", b"second")
+    store.save("s-1", b"updated")
+    assert (store.load("s-1"), store.load("s-2"), store.count()) == (b"updated", b"second", 2)
+    store.delete("s-1")
+    assert (store.load("s-1"), store.count()) == (None, 1)
+
+
+def test_sessions_expire_after_ttl_without_a_save(make_store):
+    store = make_store(ttl=TTL)
+    store.save("idle", b"x")
+    store.save("active", b"y")
+    time.sleep(TTL * 0.6)
+    store.save("active", b"y")  # a turn restarts the ttl
+    time.sleep(TTL * 0.6)
+    assert store.load("idle") is None
+    assert store.load("active") == b"y"
+    assert store.count() == 1
+
+
+def test_redis_count_ignores_other_keys(redis_port):
+    store = RedisSessionStore("127.0.0.1", redis_port, prefix="talentscout:count[1]:")
+    other = RedisSessionStore("127.0.0.1", redis_port, prefix="talentscout:count1:")
+    store.save("s-1", b"x")
+    other.save("s-1", b"x")
+    other.command("SET", "unrelated", b"x")
+    assert store.count() == 1
+    store.close()
+    other.close()
+
+
+def test_memory_store_evicts_least_recently_saved():
+    store = MemorySessionStore(max_sessions=2)
+    store.save("a", 1)
+    store.save("b", 2)
+    store.save("a", 3)
+    store.save("c", 4)
+    assert (store.load("a"), store.load("b"), store.load("c")) == (3, None, 4)
+    assert store.count() == 2
+
+
+def test_session_store_is_abstract():
+    with pytest.raises(TypeError):
+        SessionStore()
+
+
+@pytest.mark.parametrize("url, kind, where", [
+    ("", None, None),
+    ("sessions.db", SQLiteSessionStore, "sessions.db"),
+    ("sqlite:///tmp-sessions.db", SQLiteSessionStore, "/tmp-sessions.db"),
+    ("sqlite://sessions.db", SQLiteSessionStore, "sessions.db"),
+    ("redis://cache.internal:6380/2", RedisSessionStore, ("cache.internal", 6380, 2)),
+    ("redis://", RedisSessionStore, ("127.0.0.1", 6379, 0)),
+])
+def test_open_session_store(url, kind, where, monkeypatch):
+    monkeypatch.setattr(SQLiteSessionStore, "__init__", lambda self, path, ttl: setattr(self, "where", path))
+    monkeypatch.setattr(RedisSessionStore, "__init__",
+                        lambda self, host, port, db, ttl, password=None: setattr(self, "where", (host, port, db)))
+    store = open_session_store(url)
+    if kind is None:
+        assert store is None
+    else:
+        assert type(store) is kind and store.where == where
+
+
+def test_open_session_store_rejects_unknown_schemes():
+    with pytest.raises(ValueError):
+        open_session_store("memcached://localhost")
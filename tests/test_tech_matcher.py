@@ -0,0 +1,35 @@
+import pytest
+
+from tech_matcher import TechMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return TechMatcher.from_config()
+
+
+@pytest.mark.parametrize("text", [
+    "my code reacts to events",
+    "the ship docked",
+    "ancient oracles",
+    "redist",
+    "a scalar value",
+    "the objective was clear",
+    "string formatting in a sprint",
+    "sparing flasks",
+    "decker flatter stagger",
+    "pythons are snakes",
+])
+def test_ordinary_words_are_not_technologies(matcher, text):
+    assert matcher.extract(text) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("pyhton and kubernets", ["Python", "Kubernetes"]),
+    ("javascipt, typscript", ["Javascript", "Typescript"]),
+    ("djnago", ["Django"]),
+    ("terrafrom", ["Terraform"]),
+    ("react, redis, k8s", ["React", "Redis", "Kubernetes"]),
+])
+def test_names_aliases_and_typos(matcher, text, expected):
+    assert matcher.extract(text) == expected